@@ -1,18 +1,214 @@
 import openai
+import json
 import logging
+import queue
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from config import Config
+from company_info_cache import CompanyInfoCache
+from completion_cache import CompletionCache
+from llm_metrics import LLMMetrics, OUTCOME_FALLBACK, OUTCOME_PARSE_FAILURE, OUTCOME_REJECTED
+from message_cascade import CascadeStats, TIER_DRAFT, TIER_ESCALATION, TIER_REGENERATE, validate_message
+from message_generation_engine import MessageGenerationEngine
+from message_templates import MessageTemplate
+from http_client import get_transport
+from rate_limiter import build_rate_limiter
+from resilience import parse_retry_after
+from person import Person
+
+# Fixed instructions shared by every outreach prompt, sent once as the system message
+OUTREACH_SYSTEM_PROMPT = """You write LinkedIn outreach messages from Abhinav Ala, a Computer Science Engineering student at Santa Clara University (SCU), to people at companies where he hopes to intern.
+Every message must:
+1. Use a professional but warm tone
+2. Mention Abhinav is a CS student at SCU
+3. Show genuine interest in the recipient's career journey
+4. Mention the shared SCU connection only for SCU alumni
+5. Reference the company's mission/values if relevant
+6. Ask for a brief coffee chat or virtual call
+7. Mention interest in the 2026 Software Engineer Internship
+8. Stay under 200 words
+Unless told otherwise, answer in exactly this format:
+Subject: [Appropriate subject line]
+
+[Message body]
+
+Best regards,
+Abhinav Ala
+(469)-381-4729
+aala@scu.edu"""
+
+# Per-person prompt: only what differs between recipients
+MESSAGE_PROMPT_TEMPLATE = """Write the message to {person_name}, who works as a {person_title} at {company_name}.
+SCU alumni: {is_scu_alumni}
+
+About {company_name}:
+{company_context}"""
+
+# Batched prompt: company context once, one JSON entry per recipient
+BATCH_PROMPT_TEMPLATE = """Write one message to each recipient below. They all work at {company_name}.
+
+About {company_name}:
+{company_context}
+
+Recipients (JSON):
+{recipients}
+
+Address each recipient by name, mention the SCU connection only where is_scu_alumni is true, and end every body with the signature block.
+Answer with only a JSON object of the form {{"messages": [{{"id": <recipient id>, "subject": "...", "body": "..."}}]}} containing one entry per recipient."""
+
+# Prompt tokens each recipient adds to a batched request (its JSON entry)
+BATCH_PROMPT_PERSON_TOKENS = 30
+
+# Template prompt: one reusable message per company and alumni status, filled in locally
+TEMPLATE_PROMPT_TEMPLATE = """Write a reusable message template to people who work at {company_name}. Recipients {alumni_clause}
+
+About {company_name}:
+{company_context}
+
+Write the placeholders {{first_name}} and {{title}} exactly where the recipient's first name and job title go; use no other placeholders. Start the body with "Hi {{first_name}},"."""
 
 class AIMessageGenerator:
-    def __init__(self):
+    def __init__(self, force_regenerate=None):
         self.setup_logging()
         # Set OpenAI API key
         openai.api_key = Config.OPENAI_API_KEY
+        openai.api_base = Config.OPENAI_API_BASE
+        # Reuse the shared keep-alive pool instead of a new connection per completion
+        # (the openai SDK only accepts a requests.Session, so HTTP/2 pools aren't handed over)
+        self.http = get_transport()
+        if not self.http.http2:
+            openai.requestssession = self.http.session_for(Config.OPENAI_API_BASE)
+        self.company_info_cache = CompanyInfoCache()
+        # Identical prompts are answered from disk unless regeneration is forced
+        self.completion_cache = CompletionCache() if Config.COMPLETION_CACHE_ENABLED else None
+        self.force_regenerate = Config.FORCE_REGENERATE if force_regenerate is None else force_regenerate
+        # Tokens, latency and outcome of every completion, summarised per run
+        self.metrics = LLMMetrics()
+        self.cascade_stats = CascadeStats()
+        self._templates = {}
+        self._template_locks = {}
+        self._lock = threading.Lock()
+        # Every completion shares one request and token budget, however many run concurrently
+        self.request_limiter = build_rate_limiter(per_minute=Config.OPENAI_REQUESTS_PER_MINUTE, name='openai requests')
+        self.token_limiter = build_rate_limiter(per_minute=Config.OPENAI_TOKENS_PER_MINUTE, name='openai tokens')
+        
+    def start_run(self):
+        """Start per-run LLM usage and cascade accounting"""
+        self.metrics.start_run()
+        self.cascade_stats.reset()
+        self.company_info_cache.start_run()
         
     def setup_logging(self):
         logging.basicConfig(level=logging.INFO)
         self.logger = logging.getLogger(__name__)
     
+    def _create_chat_completion(self, call=None, use_cache=True, on_token=None, **kwargs):
+        """Run a chat completion through the pooled session with pacing, timeouts and latency recording
+
+        If an LLMCall is given, its model, token usage and latency are filled in. With
+        use_cache=False the completion cache isn't read (the new answer still replaces it).
+        With on_token, the completion is streamed and on_token(text so far) is called as
+        tokens arrive; a retried attempt simply starts the text over.
+        """
+        kwargs.setdefault('request_timeout', self.http.timeout)
+        if call is not None:
+            call.model = kwargs.get('model')
+        cache_key = None
+        if self.completion_cache is not None:
+            cache_key = self.completion_cache.make_key(kwargs)
+            if use_cache and not self.force_regenerate:
+                cached = self.completion_cache.get(cache_key)
+                if cached is not None:
+                    if call is not None:
+                        call.cached = True
+                        self._record_usage(call, kwargs, cached)
+                    if on_token is not None:
+                        on_token(cached.choices[0].message.content)
+                    return cached
+        tokens = min(self._estimate_tokens(kwargs), Config.OPENAI_TOKENS_PER_MINUTE or float('inf'))
+
+        def create():
+            self.request_limiter.acquire_sync()
+            self.token_limiter.acquire_sync(tokens)
+            start = time.perf_counter()
+            try:
+                with self.http.timed('openai'):
+                    if on_token is not None:
+                        return self._stream_chat_completion(kwargs, on_token)
+                    return openai.ChatCompletion.create(**kwargs)
+            finally:
+                if call is not None:
+                    call.attempts += 1
+                    call.latency = time.perf_counter() - start
+
+        response = self.http.resilience.call('openai', create, self._classify_openai_error)
+        if call is not None:
+            self._record_usage(call, kwargs, response)
+        if cache_key is not None:
+            self.completion_cache.set(cache_key, kwargs.get('model'), response)
+        return response
+
+    def _record_usage(self, call, kwargs, response):
+        """Token counts from the response's usage block, estimated if it has none"""
+        usage = response.get('usage') or {}
+        call.prompt_tokens = usage.get('prompt_tokens') or self._estimate_tokens(kwargs) - kwargs.get('max_tokens', 0)
+        if usage.get('completion_tokens') is not None:
+            call.completion_tokens = usage['completion_tokens']
+        else:
+            call.completion_tokens = sum(len(choice.message.content or '') for choice in response.choices) // 4
+
+    def _stream_chat_completion(self, kwargs, on_token):
+        """Stream a completion, returning it assembled like a non-streamed one"""
+        start = time.perf_counter()
+        text = ''
+        finish_reason = None
+        model = kwargs.get('model')
+        for chunk in openai.ChatCompletion.create(stream=True, **kwargs):
+            if not chunk.choices:
+                continue
+            choice = chunk.choices[0]
+            delta = choice.get('delta', {}).get('content')
+            if delta:
+                if not text:
+                    self.http.latency.record('openai first token', time.perf_counter() - start)
+                text += delta
+                on_token(text)
+            finish_reason = choice.get('finish_reason') or finish_reason
+            model = chunk.get('model') or model
+        # Streamed answers carry no usage block, so _record_usage estimates the tokens
+        return openai.util.convert_to_openai_object({
+            'object': 'chat.completion',
+            'model': model,
+            'choices': [{'index': 0, 'message': {'role': 'assistant', 'content': text}, 'finish_reason': finish_reason}]
+        })
+
+    def _discard_completion(self, kwargs):
+        """Drop a completion from the cache (e.g. a draft that failed validation)"""
+        if self.completion_cache is not None:
+            self.completion_cache.delete(self.completion_cache.make_key(kwargs))
+
+    def _estimate_tokens(self, kwargs):
+        """Prompt tokens (~4 characters each) plus the completion allowance, as OpenAI counts them for TPM"""
+        prompt_chars = sum(len(message.get('content') or '') for message in kwargs.get('messages', []))
+        return prompt_chars // 4 + kwargs.get('max_tokens', 0)
+
+    def _classify_openai_error(self, response, error):
+        """(retryable, breaker failure / None for neutral, retry_after) for a completion attempt"""
+        if error is None:
+            return False, False, None
+        retry_after = parse_retry_after((getattr(error, 'headers', None) or {}).get('Retry-After'))
+        if isinstance(error, openai.error.RateLimitError):
+            # An exhausted quota won't come back by waiting
+            return error.code != 'insufficient_quota', None, retry_after
+        if isinstance(error, (openai.error.ServiceUnavailableError, openai.error.Timeout,
+                              openai.error.APIConnectionError, openai.error.TryAgain)):
+            return True, True, retry_after
+        if isinstance(error, openai.error.APIError) and (error.http_status or 0) >= 500:
+            return True, True, retry_after
+        return False, None, None
+    
     def check_if_scu_alumni(self, person_data):
         """Check if the person is an SCU alumni based on their profile data"""
         try:
@@ -40,20 +236,55 @@ class AIMessageGenerator:
             return False
     
     def get_company_info(self, company_name):
-        """Get company information using AI to understand their mission and values"""
-        try:
-            prompt = f"""
-            Please provide a brief overview of {company_name} including:
-            1. Their main mission/purpose
-            2. What they do (products/services)
-            3. Their core values
-            4. Why someone might want to work there
-            5. Their company culture (if known)
-            
-            Keep it concise and professional. Format as a structured response.
-            """
-            
-            response = openai.ChatCompletion.create(
+        """Get company information (one AI call per company, cached across runs)"""
+        return self.company_info_cache.get_or_fetch(company_name, self._fetch_company_info)
+    
+    def prefetch_company_info(self, companies):
+        """Fetch every company's overview (and prompt summary) in the background
+
+        Returns the background thread. Later get_company_info calls for a company still
+        being fetched wait for that fetch instead of starting another.
+        """
+        companies = list(dict.fromkeys(company for company in companies if company))
+
+        def prefetch(company_name):
+            info = self.get_company_info(company_name)
+            if Config.PROMPT_COMPACTION_ENABLED:
+                self.company_info_cache.summary(company_name, info)
+
+        def run():
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=max(1, min(Config.OPENAI_CONCURRENCY, len(companies)))) as executor:
+                list(executor.map(prefetch, companies))
+            self.logger.info(f"Prefetched company info for {len(companies)} companies in {time.perf_counter() - start:.1f}s")
+
+        thread = threading.Thread(target=run, name='company-info-prefetch', daemon=True)
+        thread.start()
+        return thread
+    
+    def _company_context(self, company_name, company_info):
+        """Company text for prompts: the compact summary unless compaction is off"""
+        if not Config.PROMPT_COMPACTION_ENABLED:
+            return company_info
+        return self.company_info_cache.summary(company_name, company_info) or company_info
+    
+    def _fetch_company_info(self, company_name):
+        """Ask the AI for the company's mission and values (raises on failure)"""
+        prompt = f"""
+        Please provide a brief overview of {company_name} including:
+        1. Their main mission/purpose
+        2. What they do (products/services)
+        3. Their core values
+        4. Why someone might want to work there
+        5. Their company culture (if known)
+        
+        Keep it concise and professional. Format as a structured response.
+        """
+        
+        # A failure here leaves the company with the placeholder overview
+        with self.metrics.track('company_info', company_name, error_outcome=OUTCOME_FALLBACK) as call:
+            response = self._create_chat_completion(
+                call,
                 model="gpt-3.5-turbo",
                 messages=[
                     {"role": "system", "content": "You are a helpful assistant that provides company information for professional networking purposes."},
@@ -62,86 +293,87 @@ class AIMessageGenerator:
                 max_tokens=300,
                 temperature=0.7
             )
-            
-            return response.choices[0].message.content.strip()
-            
-        except Exception as e:
-            self.logger.error(f"Error getting company info: {str(e)}")
-            return f"Information about {company_name} not available."
+        
+        return response.choices[0].message.content.strip()
     
-    def generate_personalized_message(self, person_data, company_info=None):
-        """Generate a personalized outreach message"""
+    def generate_personalized_message(self, person_data, company_info=None, on_token=None):
+        """Generate a personalized outreach message (streamed to on_token(text so far) if given)"""
         try:
             is_scu_alumni = self.check_if_scu_alumni(person_data)
             company_name = person_data.get('company', 'this company')
             person_name = person_data.get('first_name', 'there')
-            person_title = person_data.get('title', 'professional')
             
             if not company_info:
                 company_info = self.get_company_info(company_name)
             
-            # Create the prompt for message generation
-            prompt = f"""
-            Generate a personalized LinkedIn outreach message for Abhinav Ala, a Computer Science Engineering student at Santa Clara University, to reach out to {person_name} who works as a {person_title} at {company_name}.
-            
-            Person details:
-            - Name: {person_name}
-            - Title: {person_title}
-            - Company: {company_name}
-            - Is SCU Alumni: {is_scu_alumni}
-            
-            Company information:
-            {company_info}
-            
-            Requirements:
-            1. Use a professional but warm tone
-            2. Mention Abhinav is a CS student at SCU
-            3. Show genuine interest in their career journey
-            4. If they're an SCU alumni, mention the shared connection
-            5. Reference the company's mission/values if relevant
-            6. Ask for a brief coffee chat or virtual call
-            7. Mention interest in 2026 Software Engineer Internship
-            8. Keep it concise (under 200 words)
-            9. Include Abhinav's contact info: (469)-381-4729, aala@scu.edu
-            
-            Format the message exactly like this:
-            Subject: [Appropriate subject line]
-            
-            [Message body]
-            
-            Best regards,
-            Abhinav Ala
-            (469)-381-4729
-            aala@scu.edu
-            """
-            
-            response = openai.ChatCompletion.create(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {"role": "system", "content": "You are a professional networking assistant that creates personalized outreach messages for students seeking internships."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=500,
-                temperature=0.8
-            )
-            
-            generated_message = response.choices[0].message.content.strip()
-            
-            # Parse subject and body
-            subject, body = self._parse_message(generated_message)
+            messages = self.build_message_prompt(person_data, company_info, is_scu_alumni)
+            tiers = self._cascade_tiers()
+            for position, (tier, model) in enumerate(tiers):
+                last_tier = position == len(tiers) - 1
+                request = dict(model=model, messages=messages, max_tokens=500, temperature=0.8)
+                start = time.perf_counter()
+                with self.metrics.track('message', company_name, error_outcome=OUTCOME_FALLBACK) as call:
+                    # A regeneration must not be answered with the draft it replaces
+                    response = self._create_chat_completion(
+                        call, use_cache=tier != TIER_REGENERATE, on_token=on_token, **request
+                    )
+                    generated_message = response.choices[0].message.content.strip()
+                    subject, body, problems = self.check_generated_message(generated_message, company_name)
+                    if problems:
+                        call.outcome = OUTCOME_FALLBACK if last_tier else (
+                            OUTCOME_PARSE_FAILURE if 'Subject:' not in generated_message else OUTCOME_REJECTED
+                        )
+                self.cascade_stats.record(tier, model, time.perf_counter() - start, not problems)
+                
+                if not problems:
+                    return {
+                        'subject': subject,
+                        'body': body,
+                        'is_scu_alumni': is_scu_alumni,
+                        'company_info': company_info
+                    }
+                # Don't serve the rejected draft from the completion cache next run
+                self._discard_completion(request)
+                self.logger.warning(f"{tier} from {model} for {person_name} at {company_name} rejected: {'; '.join(problems)}")
             
-            return {
-                'subject': subject,
-                'body': body,
-                'is_scu_alumni': is_scu_alumni,
-                'company_info': company_info
-            }
+            return self._get_fallback_message(person_data, is_scu_alumni)
             
         except Exception as e:
             self.logger.error(f"Error generating personalized message: {str(e)}")
             # Return fallback message
             return self._get_fallback_message(person_data, is_scu_alumni)
     
+    def build_message_prompt(self, person_data, company_info, is_scu_alumni):
+        """Chat messages asking for one person's outreach message"""
+        company_name = person_data.get('company', 'this company')
+        prompt = MESSAGE_PROMPT_TEMPLATE.format(
+            person_name=person_data.get('first_name', 'there'),
+            person_title=person_data.get('title', 'professional'),
+            company_name=company_name,
+            is_scu_alumni=is_scu_alumni,
+            company_context=self._company_context(company_name, company_info)
+        )
+        return [
+            {"role": "system", "content": OUTREACH_SYSTEM_PROMPT},
+            {"role": "user", "content": prompt}
+        ]
+    
+    def check_generated_message(self, generated_message, company_name):
+        """(subject, body, problems) for a model's answer; no problems means it can be sent"""
+        subject, body = self._parse_message(generated_message)
+        problems = validate_message(
+            subject if 'Subject:' in generated_message else '', body, company_name, Config.MESSAGE_MAX_WORDS
+        )
+        return subject, body, problems
+    
+    def _cascade_tiers(self):
+        """[(tier, model)]: the draft, any regenerations, then the escalation model"""
+        tiers = [(TIER_DRAFT, Config.MESSAGE_DRAFT_MODEL)]
+        tiers += [(TIER_REGENERATE, Config.MESSAGE_DRAFT_MODEL)] * max(0, Config.MESSAGE_DRAFT_ATTEMPTS - 1)
+        if Config.MESSAGE_ESCALATION_MODEL and Config.MESSAGE_ESCALATION_MODEL != Config.MESSAGE_DRAFT_MODEL:
+            tiers.append((TIER_ESCALATION, Config.MESSAGE_ESCALATION_MODEL))
+        return tiers
+    
     def _parse_message(self, message_text):
         """Parse the generated message to extract subject and body"""
         try:
@@ -162,6 +394,140 @@ class AIMessageGenerator:
             self.logger.error(f"Error parsing message: {str(e)}")
             return "Coffee Chat Request", message_text
     
+    def batch_size_for(self, company_info, company_name=None):
+        """People per batched request that fit the model's context next to the shared prompt"""
+        company_context = self._company_context(company_name, company_info) if company_name else company_info
+        prompt_tokens = (len(OUTREACH_SYSTEM_PROMPT) + len(BATCH_PROMPT_TEMPLATE) + len(company_context or '')) // 4
+        room = Config.OPENAI_CONTEXT_TOKENS - prompt_tokens
+        per_person = BATCH_PROMPT_PERSON_TOKENS + Config.MESSAGE_BATCH_TOKENS_PER_PERSON
+        return max(1, min(Config.MESSAGE_BATCH_SIZE, room // per_person))
+    
+    def generate_batch_messages(self, people, company_info):
+        """Generate messages for several people at one company in a single completion
+
+        Returns one message dict per person (in order), or None for entries that were
+        missing or failed validation so the caller can re-request them individually.
+        """
+        company_name = people[0].get('company', 'this company')
+        recipients = []
+        for i, person in enumerate(people):
+            recipients.append({
+                'id': i,
+                'name': person.get('first_name', 'there'),
+                'title': person.get('title', 'professional'),
+                'is_scu_alumni': self.check_if_scu_alumni(person)
+            })
+        
+        prompt = BATCH_PROMPT_TEMPLATE.format(
+            company_name=company_name,
+            company_context=self._company_context(company_name, company_info),
+            recipients=json.dumps(recipients)
+        )
+        
+        try:
+            with self.metrics.track('batch', company_name) as call:
+                response = self._create_chat_completion(
+                    call,
+                    model=Config.MESSAGE_DRAFT_MODEL,
+                    messages=[
+                        {"role": "system", "content": OUTREACH_SYSTEM_PROMPT},
+                        {"role": "user", "content": prompt}
+                    ],
+                    max_tokens=Config.MESSAGE_BATCH_TOKENS_PER_PERSON * len(people),
+                    temperature=0.8
+                )
+                entries = self._parse_batch_response(response.choices[0].message.content)
+                
+                results = []
+                for recipient in recipients:
+                    entry = entries.get(recipient['id'])
+                    if not self._valid_batch_entry(entry, recipient['name'], company_name):
+                        results.append(None)
+                        continue
+                    results.append({
+                        'subject': entry['subject'].strip(),
+                        'body': entry['body'].strip(),
+                        'is_scu_alumni': recipient['is_scu_alumni'],
+                        'company_info': company_info
+                    })
+                if None in results:
+                    call.outcome = OUTCOME_PARSE_FAILURE
+        except Exception as e:
+            self.logger.error(f"Error generating batch of {len(people)} messages for {company_name}: {str(e)}")
+            return [None] * len(people)
+        return results
+    
+    def _parse_batch_response(self, text):
+        """{id: entry} from the model's JSON answer (tolerates code fences and surrounding text)"""
+        start, end = text.find('{'), text.rfind('}')
+        if start == -1 or end <= start:
+            return {}
+        payload = json.loads(text[start:end + 1])
+        entries = {}
+        for entry in payload.get('messages') or []:
+            if isinstance(entry, dict):
+                try:
+                    entries[int(entry.get('id'))] = entry
+                except (TypeError, ValueError):
+                    continue
+        return entries
+    
+    def _valid_batch_entry(self, entry, first_name, company_name=None):
+        """The entry passes message validation and addresses the right person"""
+        if not entry or not isinstance(entry.get('subject'), str) or not isinstance(entry.get('body'), str):
+            return False
+        body = entry['body']
+        if validate_message(entry['subject'], body, company_name, Config.MESSAGE_MAX_WORDS):
+            return False
+        return not first_name or first_name.lower() in body.lower()
+    
+    def get_message_template(self, company_name, is_scu_alumni, company_info):
+        """Reusable MessageTemplate for a company and alumni status (one AI call each), or None"""
+        key = (' '.join((company_name or '').lower().split()), bool(is_scu_alumni))
+        if key in self._templates:
+            return self._templates[key]
+
+        with self._lock:
+            template_lock = self._template_locks.setdefault(key, threading.Lock())
+
+        with template_lock:
+            if key in self._templates:
+                return self._templates[key]
+
+            template = None
+            try:
+                prompt = TEMPLATE_PROMPT_TEMPLATE.format(
+                    company_name=company_name,
+                    company_context=self._company_context(company_name, company_info),
+                    alumni_clause="are Santa Clara University alumni - mention the shared SCU connection." if is_scu_alumni
+                    else "are not SCU alumni - don't claim a shared school connection."
+                )
+                with self.metrics.track('template', company_name) as call:
+                    response = self._create_chat_completion(
+                        call,
+                        model=Config.MESSAGE_DRAFT_MODEL,
+                        messages=[
+                            {"role": "system", "content": OUTREACH_SYSTEM_PROMPT},
+                            {"role": "user", "content": prompt}
+                        ],
+                        max_tokens=500,
+                        temperature=0.8
+                    )
+                    subject, body = self._parse_message(response.choices[0].message.content.strip())
+                    template = MessageTemplate(subject, body)
+                    problems = template.problems(company_name, Config.MESSAGE_MAX_WORDS)
+                    if problems:
+                        self.logger.warning(f"Discarding message template for {company_name}: {', '.join(problems)}")
+                        call.outcome = OUTCOME_REJECTED
+                        template = None
+            except Exception as e:
+                self.logger.error(f"Error generating message template for {company_name}: {str(e)}")
+
+            # Failures aren't cached, so the next run (or group) tries again
+            if template is not None:
+                self._templates[key] = template
+            return template
+    
     def _get_fallback_message(self, person_data, is_scu_alumni):
         """Generate a fallback message if AI generation fails"""
         person_name = person_data.get('first_name', 'there')
@@ -204,34 +570,86 @@ aala@scu.edu"""
             'subject': subject,
             'body': body,
             'is_scu_alumni': is_scu_alumni,
-            'company_info': f"Information about {company_name}"
+            'company_info': None
         }
     
     def generate_bulk_messages(self, people_data):
-        """Generate personalized messages for multiple people"""
-        results = []
-        
-        for person in people_data:
+        """Generate personalized messages for multiple people (annotates Person records in place)"""
+        results = MessageGenerationEngine(self).run(people_data)
+        self._log_generation_stats()
+        return results
+    
+    def stream_bulk_messages(self, people_data):
+        """Generate messages in the background, yielding (index, person, text, done) as they progress
+
+        Per-person messages are streamed, so a person's text grows as tokens arrive;
+        messages from templates, batches or batch jobs arrive whole. Every person gets
+        exactly one done=True event. Consume from the UI thread (e.g. Streamlit).
+        """
+        people = [Person.from_dict(person) for person in people_data]
+        indexes = {id(person): index for index, person in enumerate(people)}
+        events = queue.Queue()
+        finished = object()
+        errors = []
+
+        def on_event(person, text, done):
+            events.put((indexes[id(person)], person, text, done))
+
+        def run():
             try:
-                message_data = self.generate_personalized_message(person)
-                person_with_message = {
-                    **person,
-                    'message_subject': message_data['subject'],
-                    'message_body': message_data['body'],
-                    'is_scu_alumni': message_data['is_scu_alumni'],
-                    'company_info': message_data['company_info']
-                }
-                results.append(person_with_message)
-                
+                MessageGenerationEngine(self, on_event=on_event).run(people)
             except Exception as e:
-                self.logger.error(f"Error generating message for {person.get('name', 'Unknown')}: {str(e)}")
-                # Add person without message data
-                results.append({
-                    **person,
-                    'message_subject': 'Coffee Chat Request',
-                    'message_body': 'Message generation failed',
-                    'is_scu_alumni': False,
-                    'company_info': 'Not available'
-                })
-        
-        return results
\ No newline at end of file
+                errors.append(e)
+            finally:
+                events.put(finished)
+
+        threading.Thread(target=run, daemon=True).start()
+        done_indexes = set()
+        while True:
+            event = events.get()
+            if event is finished:
+                break
+            if event[3]:
+                if event[0] in done_indexes:
+                    continue
+                done_indexes.add(event[0])
+            yield event
+
+        if errors:
+            raise errors[0]
+        self._log_generation_stats()
+        for index, person in enumerate(people):
+            if index not in done_indexes:
+                yield index, person, person.get('message_body', ''), True
+    
+    def _log_generation_stats(self):
+        cache_stats = self.company_info_cache.stats()
+        self.logger.info(f"Company info: {cache_stats['fetches']} AI calls, {cache_stats['hits']} cache hits")
+        if cache_stats['summaries']:
+            self.logger.info(
+                f"Prompt compaction: company context {cache_stats['tokens_before']} -> {cache_stats['tokens_after']} "
+                f"tokens across {cache_stats['summaries']} companies"
+            )
+        if self.completion_cache is not None:
+            completion_stats = self.completion_cache.stats()
+            self.logger.info(f"Completion cache: {completion_stats['hits']} hits, {completion_stats['misses']} misses")
+        if self.cascade_stats.messages:
+            self.logger.info(self.cascade_stats.format_summary())
+        self.metrics.log_summary()
+    
+    def apply_message(self, person, message_data):
+        """Store a generated (or fallback) message on a person"""
+        person['message_subject'] = message_data['subject']
+        person['message_body'] = message_data['body']
+        person['is_scu_alumni'] = message_data['is_scu_alumni']
+        # company_info is stored once on the shared company record; placeholders never are
+        company_info = message_data.get('company_info')
+        if company_info and not person.get('company_info') and not self.company_info_cache.failed(person.get('company', 'this company')):
+            person['company_info'] = company_info
+    
+    def apply_failed_message(self, person, error):
+        """Keep the person without message data"""
+        self.logger.error(f"Error generating message for {person.get('name', 'Unknown')}: {str(error)}")
+        person['message_subject'] = 'Coffee Chat Request'
+        person['message_body'] = 'Message generation failed'
+        person['is_scu_alumni'] = False
@@ -4,11 +4,42 @@ import time
 from main_workflow import LinkedInOutreachWorkflow
 from google_sheets_manager import GoogleSheetsManager
 from gmass_integration import GMassIntegration
+from config import Config
+from person import company_registry, as_dicts
 import logging
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 
+def render_message_stream(ai_generator, people_data, companies_label):
+    """Generate messages for people at the given companies, rendering each as its tokens arrive"""
+    st.markdown(f"**✉️ Messages for {companies_label}**")
+    progress = st.progress(0)
+    counter = st.empty()
+    placeholders = {}
+    results = [None] * len(people_data)
+    done = 0
+    
+    for index, person, text, finished in ai_generator.stream_bulk_messages(people_data):
+        placeholder = placeholders.get(index)
+        if placeholder is None:
+            with st.expander(f"{person.get('name', 'Unknown')} - {person.get('title', '')}", expanded=len(placeholders) < 3):
+                placeholder = placeholders[index] = st.empty()
+        
+        status = "✅" if finished else "✍️ writing..."
+        subject = f"**Subject:** {person.get('message_subject', '')}\n\n" if finished else ""
+        # Markdown needs two trailing spaces to keep the message's line breaks
+        body = text.replace('\n', '  \n')
+        placeholder.markdown(f"{status}\n\n{subject}{body}")
+        
+        if finished:
+            results[index] = person
+            done += 1
+            progress.progress(done / len(people_data))
+            counter.text(f"{done}/{len(people_data)} messages ready")
+    
+    return [person for person in results if person is not None]
+
 def main():
     st.set_page_config(
         page_title="LinkedIn Outreach Platform",
@@ -113,6 +144,10 @@ def main():
                         
                         try:
                             workflow = LinkedInOutreachWorkflow()
+                            company_registry.clear()
+                            workflow.ai_generator.start_run()
+                            if Config.COMPANY_INFO_PREFETCH:
+                                workflow.ai_generator.prefetch_company_info(companies)
                             
                             # Update progress
                             progress_bar.progress(20)
@@ -142,22 +177,34 @@ def main():
                             progress_bar.progress(60)
                             status_text.text("Processing companies and finding people...")
                             
-                            # Process companies
+                            # Find people at every company first
                             all_people_data = []
+                            workflow.email_finder.budget.start_run()
+                            workflow.person_deduper.start_run()
                             for i, company in enumerate(companies):
                                 status_text.text(f"Processing {company}...")
                                 
                                 people_data = workflow.linkedin_scraper.search_people_by_company(company)
-                                
+                                people_data = workflow.title_matcher.apply(workflow.person_deduper.apply(people_data))
                                 if people_data:
-                                    people_with_emails = workflow.email_finder.find_emails_for_people(people_data)
-                                    people_with_messages = workflow.ai_generator.generate_bulk_messages(people_with_emails)
-                                    all_people_data.extend(people_with_messages)
-                                    workflow.sheets_manager.add_people_data(people_with_messages)
+                                    all_people_data.extend(people_data)
+                                    workflow.sheets_manager.upsert_people_data(people_data)
                                 
-                                progress_bar.progress(60 + (20 * (i + 1) / len(companies)))
+                                progress_bar.progress(60 + (10 * (i + 1) / len(companies)))
                                 time.sleep(2)  # Rate limiting
                             
+                            # One email and message pass for the whole run, so Hunter credits go to alumni first
+                            if all_people_data:
+                                status_text.text("Finding emails...")
+                                people_with_emails = workflow.email_finder.find_emails_for_people(all_people_data)
+                                if Config.HUNTER_VERIFY_EMAILS:
+                                    people_with_emails = workflow.email_finder.verify_emails_for_people(people_with_emails)
+                                progress_bar.progress(75)
+                                status_text.text("Writing messages...")
+                                all_people_data = render_message_stream(workflow.ai_generator, people_with_emails, ', '.join(companies))
+                                st.session_state['people_data'] = as_dicts(all_people_data)
+                                workflow.sheets_manager.upsert_people_data(all_people_data)
+                            
                             progress_bar.progress(90)
                             status_text.text("Creating email campaigns...")
                             
@@ -170,7 +217,7 @@ def main():
                             st.success("🎉 Outreach workflow completed successfully!")
                             
                             # Store results in session state
-                            st.session_state['people_data'] = all_people_data
+                            st.session_state['people_data'] = as_dicts(all_people_data)
                             st.session_state['companies'] = companies
                             
                         except Exception as e:
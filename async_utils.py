@@ -0,0 +1,32 @@
+"""
+Helpers for driving asyncio engines from the synchronous workflows and Streamlit
+"""
+import asyncio
+import threading
+
+
+def run_sync(coro):
+    """Run a coroutine to completion from synchronous code
+
+    Uses asyncio.run normally. If the calling thread already has a running event loop
+    (e.g. inside a notebook), the coroutine is run on a fresh loop in a helper thread.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    result = {}
+
+    def runner():
+        try:
+            result['value'] = asyncio.run(coro)
+        except BaseException as e:
+            result['error'] = e
+
+    thread = threading.Thread(target=runner, daemon=True)
+    thread.start()
+    thread.join()
+    if 'error' in result:
+        raise result['error']
+    return result.get('value')
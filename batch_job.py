@@ -0,0 +1,246 @@
+"""
+Offline OpenAI Batch API jobs for outreach message generation
+"""
+import hashlib
+import json
+import logging
+import os
+import time
+from config import Config
+from http_client import get_transport
+from llm_metrics import LLMCall, OUTCOME_REJECTED
+from profile_utils import ensure_person_key
+
+BATCH_ENDPOINT = '/v1/chat/completions'
+TERMINAL_STATUSES = ('completed', 'failed', 'expired', 'cancelled')
+
+
+class MessageBatchJob:
+    """Generates messages through the OpenAI Batch API instead of interactive completions
+
+    Each pending person becomes one chat completion line in a JSONL file (custom_id is
+    the person_key, suffixed when two people share one). The file is uploaded and submitted as a batch, then polled until it
+    finishes. Submitted jobs are kept in a state file keyed by the set of people, so an
+    interrupted run picks up the same batch instead of paying for a second one.
+    Results are validated like interactive drafts and stored in the completion cache;
+    anyone without a usable result is returned for the interactive path.
+    """
+
+    def __init__(self, ai_generator, work_dir=None, poll_seconds=None, max_wait_seconds=None):
+        self.ai_generator = ai_generator
+        self.api_base = Config.OPENAI_API_BASE.rstrip('/')
+        self.headers = {'Authorization': f'Bearer {Config.OPENAI_API_KEY}'}
+        self.http = get_transport()
+        self.work_dir = work_dir or Config.OPENAI_BATCH_DIR
+        self.state_path = os.path.join(self.work_dir, 'state.json')
+        self.poll_seconds = poll_seconds if poll_seconds is not None else Config.OPENAI_BATCH_POLL_SECONDS
+        self.max_wait_seconds = max_wait_seconds if max_wait_seconds is not None else Config.OPENAI_BATCH_MAX_WAIT_HOURS * 3600
+        self.setup_logging()
+
+    def setup_logging(self):
+        logging.basicConfig(level=logging.INFO)
+        self.logger = logging.getLogger(__name__)
+
+    def run(self, people):
+        """Generate messages for people via a batch job; returns the people still needing one"""
+        requests = self.build_requests(people)
+        pending = self._apply_cached(requests)
+        if not pending:
+            return []
+
+        job_key = hashlib.sha256('\n'.join(sorted(pending)).encode('utf-8')).hexdigest()[:16]
+        state = self._load_state()
+        job = state.get(job_key)
+        try:
+            if job is None:
+                job = self.submit(job_key, pending)
+            else:
+                self.logger.info(f"Resuming batch {job['batch_id']} for {len(pending)} people")
+
+            batch = self.wait(job_key, job)
+            if batch is None:
+                # Left in the state file, so a later run with the same people can still collect it
+                self.logger.warning(f"Batch {job['batch_id']} not finished in time, generating interactively")
+                return [person for person, _, _, _ in pending.values()]
+            if batch['status'] != 'completed':
+                self.logger.error(f"Batch {job['batch_id']} ended with status {batch['status']}")
+                self._forget(job_key)
+                return [person for person, _, _, _ in pending.values()]
+
+            served = self.ingest(batch, pending)
+            self._forget(job_key)
+        except Exception as e:
+            self.logger.error(f"Batch job failed, generating interactively: {str(e)}")
+            return [person for person, _, _, _ in pending.values()]
+
+        self.logger.info(f"Batch job: {len(served)} of {len(pending)} messages generated offline")
+        return [person for key, (person, _, _, _) in pending.items() if key not in served]
+
+    def build_requests(self, people):
+        """{custom_id: (person, request body, is_scu_alumni, company_info)}"""
+        requests = {}
+        for person in people:
+            company_info = person.get('company_info') or self.ai_generator.get_company_info(person.get('company', 'this company'))
+            is_scu_alumni = self.ai_generator.check_if_scu_alumni(person)
+            body = {
+                'model': Config.MESSAGE_DRAFT_MODEL,
+                'messages': self.ai_generator.build_message_prompt(person, company_info, is_scu_alumni),
+                'max_tokens': 500,
+                'temperature': 0.8
+            }
+            # URL-less people with the same name and company share a person_key; each still needs its own line
+            custom_id = person_key = ensure_person_key(person)
+            copies = 1
+            while custom_id in requests:
+                copies += 1
+                custom_id = f"{person_key}-{copies}"
+            requests[custom_id] = (person, body, is_scu_alumni, company_info)
+        return requests
+
+    def _apply_cached(self, requests):
+        """Apply completions already in the cache (e.g. from an ingested batch); returns the rest"""
+        cache = self.ai_generator.completion_cache
+        if cache is None or self.ai_generator.force_regenerate:
+            return dict(requests)
+        pending = {}
+        for person_key, entry in requests.items():
+            cached = cache.get(cache.make_key(entry[1]))
+            if cached is None or not self._apply_result(entry, cached, record=False):
+                pending[person_key] = entry
+        return pending
+
+    def submit(self, job_key, pending):
+        """Write the JSONL input, upload it and create the batch"""
+        os.makedirs(self.work_dir, exist_ok=True)
+        input_path = os.path.join(self.work_dir, f"{job_key}.jsonl")
+        with open(input_path, 'w', encoding='utf-8') as f:
+            for person_key, (_, body, _, _) in pending.items():
+                f.write(json.dumps({'custom_id': person_key, 'method': 'POST', 'url': BATCH_ENDPOINT, 'body': body}) + '\n')
+
+        # Bytes rather than a file handle, so a retried upload resends the whole file
+        with open(input_path, 'rb') as f:
+            content = f.read()
+        response = self.http.post(
+            f"{self.api_base}/files", service='openai', headers=self.headers,
+            data={'purpose': 'batch'}, files={'file': (os.path.basename(input_path), content, 'application/jsonl')}
+        )
+        response.raise_for_status()
+        input_file_id = response.json()['id']
+
+        response = self.http.post(
+            f"{self.api_base}/batches", service='openai', headers=self.headers,
+            json={'input_file_id': input_file_id, 'endpoint': BATCH_ENDPOINT, 'completion_window': '24h'}
+        )
+        response.raise_for_status()
+        batch = response.json()
+
+        job = {
+            'batch_id': batch['id'],
+            'input_file_id': input_file_id,
+            'input_path': input_path,
+            'requests': len(pending),
+            'submitted_at': time.time()
+        }
+        state = self._load_state()
+        state[job_key] = job
+        self._save_state(state)
+        self.logger.info(f"Submitted batch {batch['id']} with {len(pending)} requests ({input_path})")
+        return job
+
+    def wait(self, job_key, job):
+        """Poll the batch until it finishes; None if it's still running after max_wait_seconds"""
+        deadline = time.monotonic() + self.max_wait_seconds
+        while True:
+            response = self.http.get(f"{self.api_base}/batches/{job['batch_id']}", service='openai', headers=self.headers)
+            response.raise_for_status()
+            batch = response.json()
+            if batch['status'] in TERMINAL_STATUSES:
+                return batch
+            if time.monotonic() >= deadline:
+                self.logger.warning(f"Batch {job['batch_id']} still {batch['status']} after {self.max_wait_seconds:g}s")
+                return None
+            counts = batch.get('request_counts') or {}
+            self.logger.info(f"Batch {job['batch_id']} {batch['status']}: {counts.get('completed', 0)}/{counts.get('total', job['requests'])} done")
+            time.sleep(self.poll_seconds)
+
+    def ingest(self, batch, pending, output_path=None):
+        """Apply the results of a finished batch (or a downloaded output file); returns the served person_keys"""
+        if output_path:
+            with open(output_path, encoding='utf-8') as f:
+                lines = f.read().splitlines()
+        elif batch.get('output_file_id'):
+            response = self.http.get(
+                f"{self.api_base}/files/{batch['output_file_id']}/content", service='openai', headers=self.headers
+            )
+            response.raise_for_status()
+            lines = response.text.splitlines()
+        else:
+            lines = []
+
+        served = set()
+        for line in lines:
+            if not line.strip():
+                continue
+            result = json.loads(line)
+            entry = pending.get(result.get('custom_id'))
+            response = result.get('response') or {}
+            if entry is None or result.get('error') or response.get('status_code') != 200:
+                continue
+            completion = response.get('body') or {}
+            if self._apply_result(entry, completion, turnaround=time.time() - batch.get('created_at', time.time())):
+                served.add(result['custom_id'])
+                cache = self.ai_generator.completion_cache
+                if cache is not None:
+                    cache.set(cache.make_key(entry[1]), entry[1]['model'], completion)
+        return served
+
+    def _apply_result(self, entry, completion, turnaround=0.0, record=True):
+        """Validate one completion and store it on the person; False if it can't be used"""
+        person, body, is_scu_alumni, company_info = entry
+        company_name = person.get('company', 'this company')
+        try:
+            generated_message = completion['choices'][0]['message']['content'].strip()
+        except (KeyError, IndexError, TypeError, AttributeError):
+            return False
+        subject, message_body, problems = self.ai_generator.check_generated_message(generated_message, company_name)
+
+        if record:
+            usage = completion.get('usage') or {}
+            call = LLMCall('batch_job', company_name)
+            call.model = body['model']
+            call.prompt_tokens = usage.get('prompt_tokens', 0)
+            call.completion_tokens = usage.get('completion_tokens', 0)
+            call.latency = turnaround
+            call.attempts = 1
+            if problems:
+                call.outcome = OUTCOME_REJECTED
+            self.ai_generator.metrics.record(call)
+
+        if problems:
+            return False
+        self.ai_generator.apply_message(person, {
+            'subject': subject,
+            'body': message_body,
+            'is_scu_alumni': is_scu_alumni,
+            'company_info': company_info
+        })
+        return True
+
+    def _load_state(self):
+        try:
+            with open(self.state_path, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_state(self, state):
+        os.makedirs(self.work_dir, exist_ok=True)
+        temp_path = f"{self.state_path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f, indent=2)
+        os.replace(temp_path, self.state_path)
+
+    def _forget(self, job_key):
+        state = self._load_state()
+        if state.pop(job_key, None) is not None:
+            self._save_state(state)
@@ -0,0 +1,140 @@
+"""
+Bulk concurrent Hunter.io email verification with caching and streamed results
+"""
+import asyncio
+import logging
+import queue
+import threading
+from config import Config
+from person import Person
+from rate_limiter import build_rate_limiter, RateLimitExceeded
+from email_cache import EmailVerificationCache
+from async_utils import run_sync
+
+_DONE = object()
+
+
+class BulkEmailVerifier:
+    """Verifies many addresses concurrently under Hunter's email-verifier limits
+
+    Addresses are deduplicated (case-insensitive) and checked against the verification
+    cache first; everything else is verified at most `concurrency` at a time. Status and
+    score are written back onto every person sharing the address, and people are yielded
+    as soon as their address is done so exports can start early.
+    """
+
+    def __init__(self, email_finder, concurrency=None):
+        self.email_finder = email_finder
+        self.concurrency = concurrency or Config.HUNTER_VERIFY_CONCURRENCY
+        self.rate_limiter = build_rate_limiter(
+            per_second=Config.HUNTER_VERIFY_REQUESTS_PER_SECOND,
+            per_minute=Config.HUNTER_VERIFY_REQUESTS_PER_MINUTE,
+            name='hunter-verify'
+        )
+        self.cache = EmailVerificationCache() if Config.EMAIL_CACHE_ENABLED else None
+        self._semaphore = None
+        self.setup_logging()
+
+    def setup_logging(self):
+        logging.basicConfig(level=logging.INFO)
+        self.logger = logging.getLogger(__name__)
+
+    async def verify_address(self, email):
+        """Verify one address (cache first, then rate-limited API call)"""
+        if self.cache is not None:
+            cached = self.cache.get(email)
+            if cached is not None:
+                return cached
+
+        budget = self.email_finder.budget
+        cost = Config.HUNTER_VERIFY_CREDIT_COST
+        if not budget.try_reserve(cost):
+            return {'email': email, 'status': 'budget_skipped', 'score': 0, 'sources': [], 'smtp_server': None, 'smtp_check': False}
+
+        try:
+            await self.rate_limiter.acquire(max_wait=Config.HUNTER_MAX_RATE_WAIT)
+        except RateLimitExceeded as e:
+            budget.settle(cost, 0)
+            self.logger.warning(f"Skipping verification of {email}: {str(e)}")
+            return {'email': email, 'status': 'error', 'score': 0, 'sources': [], 'smtp_server': None, 'smtp_check': False}
+
+        verification = await asyncio.to_thread(self.email_finder.verify_email, email)
+        budget.settle(cost, cost if verification.get('status') != 'error' else 0)
+        if self.cache is not None:
+            self.cache.set(email, verification)
+        return verification
+
+    async def verify_stream(self, people_data):
+        """Async generator yielding each Person once its email has been verified"""
+        people = [Person.from_dict(person) for person in people_data]
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        # Group people by address so each address is verified once; addresses the
+        # pattern engine already verified this run aren't paid for twice
+        by_email = {}
+        for person in people:
+            email = (person.get('email') or '').strip().lower()
+            if email and not person.get('email_verification_status'):
+                by_email.setdefault(email, []).append(person)
+            else:
+                yield person
+
+        async def verify(email):
+            async with semaphore:
+                try:
+                    return email, await self.verify_address(email)
+                except Exception as e:
+                    self.logger.error(f"Error verifying {email}: {str(e)}")
+                    return email, {'status': 'error', 'score': 0}
+
+        tasks = [asyncio.create_task(verify(email)) for email in by_email]
+        try:
+            for finished in asyncio.as_completed(tasks):
+                email, verification = await finished
+                for person in by_email[email]:
+                    person['email_verification_status'] = verification.get('status')
+                    person['email_verification_score'] = verification.get('score', 0)
+                    yield person
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        if self.cache is not None:
+            stats = self.cache.stats()
+            self.logger.info(
+                f"Verified {len(by_email)} unique addresses for {len(people)} people "
+                f"(cache: {stats['hits']} hits, {stats['misses']} misses)"
+            )
+
+    def iter_verify(self, people_data):
+        """Synchronous generator over verify_stream (runs the event loop in a helper thread)"""
+        results = queue.Queue()
+
+        async def produce():
+            try:
+                async for person in self.verify_stream(people_data):
+                    results.put(person)
+            except Exception as e:
+                results.put(e)
+            finally:
+                results.put(_DONE)
+
+        thread = threading.Thread(target=run_sync, args=(produce(),), daemon=True)
+        thread.start()
+
+        while True:
+            item = results.get()
+            if item is _DONE:
+                break
+            if isinstance(item, Exception):
+                raise item
+            yield item
+
+        thread.join()
+
+    def verify_people(self, people_data):
+        """Verify everyone and return the Person records in input order"""
+        people = [Person.from_dict(person) for person in people_data]
+        for _ in self.iter_verify(people):
+            pass
+        return people
@@ -0,0 +1,142 @@
+"""
+Per-company cache of the AI-generated company overviews used in outreach messages
+"""
+import logging
+import sqlite3
+import threading
+import time
+from config import Config
+from domain_resolver import normalize_company_name
+from prompt_compaction import compact_company_info, estimate_tokens
+
+DAY_SECONDS = 24 * 3600
+
+
+class CompanyInfoCache:
+    """Fetches each company's overview once and remembers it
+
+    Lookups go memo -> SQLite (COMPANY_INFO_CACHE_TTL_DAYS) -> fetch. Concurrent requests
+    for the same company wait on a per-company lock for the first one's answer. Failed
+    fetches fall back to a placeholder that is memoized for the run but never persisted.
+    Each company's compact prompt summary is derived from its overview once per run.
+    """
+
+    def __init__(self, db_path=None, ttl_days=None):
+        self.ttl_seconds = (ttl_days if ttl_days is not None else Config.COMPANY_INFO_CACHE_TTL_DAYS) * DAY_SECONDS
+        self.hits = 0
+        self.fetches = 0
+        self._memo = {}
+        self._failed = set()
+        self._summaries = {}
+        self.tokens_before = 0
+        self.tokens_after = 0
+        self._company_locks = {}
+        self._lock = threading.Lock()
+        self._db_lock = threading.Lock()
+        self.setup_logging()
+        self._conn = sqlite3.connect(db_path or Config.CACHE_DB_PATH, check_same_thread=False)
+        self._create_table()
+
+    def setup_logging(self):
+        logging.basicConfig(level=logging.INFO)
+        self.logger = logging.getLogger(__name__)
+
+    def _create_table(self):
+        with self._db_lock:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS company_info (
+                    company_key TEXT PRIMARY KEY,
+                    company_name TEXT,
+                    info TEXT NOT NULL,
+                    fetched_at REAL NOT NULL
+                )
+            """)
+            self._conn.commit()
+
+    def start_run(self):
+        """Drop the run memo (including placeholders) so the next run re-reads SQLite and retries failures"""
+        with self._lock:
+            self._memo = {}
+            self._failed = set()
+
+    def failed(self, company_name):
+        """Whether the company's overview is the placeholder from a failed fetch"""
+        return normalize_company_name(company_name) in self._failed
+
+    def get_or_fetch(self, company_name, fetch):
+        """Return the company's overview, calling fetch(company_name) only on a cache miss
+
+        fetch should raise on failure so the placeholder isn't persisted.
+        """
+        company_key = normalize_company_name(company_name)
+        if company_key in self._memo:
+            self.hits += 1
+            return self._memo[company_key]
+
+        with self._lock:
+            company_lock = self._company_locks.setdefault(company_key, threading.Lock())
+
+        with company_lock:
+            if company_key in self._memo:
+                self.hits += 1
+                return self._memo[company_key]
+
+            info = self._get_cached(company_key)
+            if info:
+                self.hits += 1
+            else:
+                self.fetches += 1
+                try:
+                    info = fetch(company_name)
+                    self._set_cached(company_key, company_name, info)
+                except Exception as e:
+                    self.logger.error(f"Error getting company info for {company_name}: {str(e)}")
+                    info = f"Information about {company_name} not available."
+                    self._failed.add(company_key)
+
+            self._memo[company_key] = info
+            return info
+
+    def _get_cached(self, company_key):
+        with self._db_lock:
+            row = self._conn.execute(
+                "SELECT info, fetched_at FROM company_info WHERE company_key = ?",
+                (company_key,)
+            ).fetchone()
+        if row and time.time() - row[1] <= self.ttl_seconds:
+            return row[0]
+        return None
+
+    def _set_cached(self, company_key, company_name, info):
+        with self._db_lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO company_info (company_key, company_name, info, fetched_at) VALUES (?, ?, ?, ?)",
+                (company_key, company_name, info, time.time())
+            )
+            self._conn.commit()
+
+    def summary(self, company_name, info):
+        """Short Mission/Products/Values summary of a company's overview for prompts"""
+        key = (normalize_company_name(company_name), info)
+        summary = self._summaries.get(key)
+        if summary is None:
+            summary = compact_company_info(info, Config.COMPANY_SUMMARY_MAX_WORDS)
+            with self._lock:
+                if key not in self._summaries:
+                    self._summaries[key] = summary
+                    self.tokens_before += estimate_tokens(info)
+                    self.tokens_after += estimate_tokens(summary)
+        return summary
+
+    def stats(self):
+        return {
+            'hits': self.hits,
+            'fetches': self.fetches,
+            'summaries': len(self._summaries),
+            'tokens_before': self.tokens_before,
+            'tokens_after': self.tokens_after
+        }
+
+    def close(self):
+        with self._db_lock:
+            self._conn.close()
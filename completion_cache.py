@@ -0,0 +1,128 @@
+"""
+Content-addressed cache of OpenAI chat completions
+"""
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+import openai
+from config import Config
+
+# Request options that don't change what the model is asked
+NON_SEMANTIC_PARAMS = ('request_timeout', 'stream', 'api_key', 'api_base')
+
+
+class CompletionCache:
+    """Stores completions keyed by a hash of model, parameters and the full messages
+
+    Identical requests (e.g. re-running a workflow after a crash) are answered from
+    SQLite instead of the API. The table is kept under COMPLETION_CACHE_MAX_MB by
+    evicting the least recently used entries.
+    """
+
+    def __init__(self, db_path=None, max_bytes=None):
+        self.max_bytes = max_bytes if max_bytes is not None else int(Config.COMPLETION_CACHE_MAX_MB * 1024 * 1024)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self.setup_logging()
+        self._conn = sqlite3.connect(db_path or Config.CACHE_DB_PATH, check_same_thread=False)
+        self._create_table()
+
+    def setup_logging(self):
+        logging.basicConfig(level=logging.INFO)
+        self.logger = logging.getLogger(__name__)
+
+    def _create_table(self):
+        with self._lock:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS completion_cache (
+                    cache_key TEXT PRIMARY KEY,
+                    model TEXT,
+                    response TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_used_at REAL NOT NULL
+                )
+            """)
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS completion_cache_last_used ON completion_cache (last_used_at)"
+            )
+            self._total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM completion_cache").fetchone()[0]
+            self._conn.commit()
+
+    def make_key(self, request):
+        """sha256 of the request's model, parameters and messages"""
+        content = {key: value for key, value in request.items() if key not in NON_SEMANTIC_PARAMS}
+        encoded = json.dumps(content, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+        return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+    def get(self, cache_key):
+        """The cached completion object, or None"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response FROM completion_cache WHERE cache_key = ?", (cache_key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._conn.execute(
+                "UPDATE completion_cache SET last_used_at = ? WHERE cache_key = ?", (time.time(), cache_key)
+            )
+            self._conn.commit()
+        return openai.util.convert_to_openai_object(json.loads(row[0]))
+
+    def set(self, cache_key, model, response):
+        response_json = json.dumps(response)
+        size = len(response_json)
+        now = time.time()
+        with self._lock:
+            previous = self._conn.execute(
+                "SELECT size FROM completion_cache WHERE cache_key = ?", (cache_key,)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO completion_cache (cache_key, model, response, size, created_at, last_used_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (cache_key, model, response_json, size, now, now)
+            )
+            self._total_bytes += size - (previous[0] if previous else 0)
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+            self._conn.commit()
+
+    def delete(self, cache_key):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT size FROM completion_cache WHERE cache_key = ?", (cache_key,)
+            ).fetchone()
+            if row is None:
+                return
+            self._conn.execute("DELETE FROM completion_cache WHERE cache_key = ?", (cache_key,))
+            self._total_bytes -= row[0]
+            self._conn.commit()
+
+    def _evict(self):
+        """Drop least recently used entries until the cache is back under 90% of its limit"""
+        target = self.max_bytes * 0.9
+        rows = self._conn.execute(
+            "SELECT cache_key, size FROM completion_cache ORDER BY last_used_at"
+        ).fetchall()
+        evicted = []
+        for cache_key, size in rows:
+            if self._total_bytes <= target:
+                break
+            evicted.append((cache_key,))
+            self._total_bytes -= size
+        self._conn.executemany("DELETE FROM completion_cache WHERE cache_key = ?", evicted)
+        self.evictions += len(evicted)
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions, 'bytes': self._total_bytes}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
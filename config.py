@@ -17,9 +17,123 @@ class Config:
     MAX_PEOPLE_PER_COMPANY = int(os.getenv('MAX_PEOPLE_PER_COMPANY', 50))
     SEARCH_KEYWORDS = os.getenv('SEARCH_KEYWORDS', 'software engineer,data scientist,product manager,engineering manager,tech lead,software developer,backend engineer,frontend engineer,machine learning engineer,data engineer,devops engineer,full stack engineer,computer science,engineering,senior software engineer,staff engineer,principal engineer,lead engineer,architect,systems engineer,platform engineer,infrastructure engineer,cloud engineer,security engineer,cybersecurity engineer,QA engineer,test engineer,automation engineer,performance engineer,reliability engineer,site reliability engineer,SRE,software architect,technical architect,solutions architect,enterprise architect,cloud architect,data architect,software consultant,technical consultant,engineering consultant,CTO,VP engineering,director of engineering,head of engineering,engineering director,technical director,research engineer,AI engineer,ML engineer,computer vision engineer,NLP engineer,robotics engineer,embedded engineer,firmware engineer,hardware engineer,electrical engineer,computer engineer,systems administrator,network engineer,database engineer,data analyst,data engineer,analytics engineer,BI engineer,business intelligence engineer,product analyst,technical product manager,engineering product manager,scrum master,agile coach,technical lead,team lead,engineering lead,development lead,programming,coding,developer,programmer,software,tech,technology,computer,computing,IT,information technology,digital,innovation,startup,scale-up,fintech,healthtech,edtech,proptech,adtech,marTech,regtech,insurtech,agtech,cleantech,greentech,biotech,medtech,deep tech,hardware,software,cloud,aws,azure,gcp,kubernetes,docker,terraform,ansible,jenkins,gitlab,github,ci/cd,agile,scrum,kanban,lean,devops,cloudops,secops,dataops,mlops,aiops,platform,infrastructure,backend,frontend,fullstack,web,mobile,ios,android,react,angular,vue,nodejs,python,java,javascript,typescript,go,rust,scala,kotlin,swift,objective-c,c++,c#,php,ruby,perl,clojure,haskell,erlang,elixir,ocaml,f#,dart,flutter,react native,xamarin,cordova,ionic,unity,unreal,game development,gaming,blockchain,cryptocurrency,defi,nft,web3,metaverse,ar,vr,mr,xr,iot,internet of things,edge computing,quantum computing,5g,6g,telecommunications,networking,cybersecurity,information security,penetration testing,ethical hacking,compliance,governance,risk management,privacy,gdpr,ccpa,sox,hipaa,iso,audit,security operations,incident response,threat intelligence,vulnerability management,identity management,access control,encryption,authentication,authorization,zero trust,security architecture,cloud security,application security,network security,data security,infrastructure security,operational security,security engineering,security research,malware analysis,reverse engineering,forensics,digital forensics,computer forensics,network forensics,mobile forensics,cloud forensics,incident forensics,threat hunting,threat modeling,risk assessment,security assessment,penetration testing,vulnerability assessment,security testing,code review,static analysis,dynamic analysis,SAST,DAST,IAST,SCA,software composition analysis,dependency scanning,container security,kubernetes security,serverless security,API security,web application security,mobile security,iot security,cloud security,aws security,azure security,gcp security,security automation,security orchestration,SOAR,SOC,security operations center,threat intelligence,threat hunting,incident response,forensics,malware analysis,reverse engineering,penetration testing,ethical hacking,red team,blue team,purple team,security consultant,security architect,security engineer,security analyst,security researcher,security manager,security director,CISO,chief information security officer,security officer,compliance officer,privacy officer,data protection officer,risk officer,audit manager,security auditor,compliance auditor,internal auditor,external auditor,regulatory compliance,industry compliance,standards compliance,framework compliance,control framework,security framework,governance framework,risk framework,compliance framework,audit framework,assessment framework,security assessment,compliance assessment,risk assessment,audit assessment,security audit,compliance audit,risk audit,internal audit,external audit,regulatory audit,industry audit,standards audit,framework audit,control audit,security control,compliance control,risk control,audit control,internal control,external control,regulatory control,industry control,standards control,framework control,security standard,compliance standard,risk standard,audit standard,internal standard,external standard,regulatory standard,industry standard,framework standard,security policy,compliance policy,risk policy,audit policy,internal policy,external policy,regulatory policy,industry policy,framework policy,security procedure,compliance procedure,risk procedure,audit procedure,internal procedure,external procedure,regulatory procedure,industry procedure,framework procedure,security guideline,compliance guideline,risk guideline,audit guideline,internal guideline,external guideline,regulatory guideline,industry guideline,framework guideline,security best practice,compliance best practice,risk best practice,audit best practice,internal best practice,external best practice,regulatory best practice,industry best practice,framework best practice').split(',')
     
+    # Title relevance: 'deprioritize' moves low scorers behind everyone else, 'drop' removes them
+    TITLE_RELEVANCE_MODE = os.getenv('TITLE_RELEVANCE_MODE', 'deprioritize').lower()
+    TITLE_RELEVANCE_MIN_SCORE = float(os.getenv('TITLE_RELEVANCE_MIN_SCORE', 0.3))
+    TITLE_EXCLUDE_KEYWORDS = os.getenv('TITLE_EXCLUDE_KEYWORDS', 'recruiter,recruiting,talent acquisition,sourcer,sales,account executive,account manager,business development,marketing,human resources,hr,people partner,customer success').split(',')
+    
+    # Collapse repeat copies of a person (alumni + fallback searches, several companies) before email lookup
+    PERSON_DEDUPE_ENABLED = os.getenv('PERSON_DEDUPE_ENABLED', 'true').lower() == 'true'
+    PERSON_DEDUPE_NAME_THRESHOLD = float(os.getenv('PERSON_DEDUPE_NAME_THRESHOLD', 0.92))
+    PERSON_DEDUPE_MAX_BLOCK = int(os.getenv('PERSON_DEDUPE_MAX_BLOCK', 50))
+    
     # LinkedIn Search URLs
     LINKEDIN_BASE_URL = "https://www.linkedin.com"
     LINKEDIN_SEARCH_URL = "https://www.linkedin.com/search/results/people/"
     
+    # Local stand-in servers (python mock_servers.py) for load tests without spending credits
+    USE_MOCK_SERVERS = os.getenv('USE_MOCK_SERVERS', 'false').lower() == 'true'
+    MOCK_SERVER_URL = os.getenv('MOCK_SERVER_URL', 'http://127.0.0.1:8765')
+    
     # Hunter.io API
-    HUNTER_BASE_URL = "https://api.hunter.io/v2"
\ No newline at end of file
+    HUNTER_API_KEY = os.getenv('HUNTER_API_KEY') or ('mock-hunter-key' if USE_MOCK_SERVERS else None)
+    HUNTER_BASE_URL = f"{MOCK_SERVER_URL}/hunter/v2" if USE_MOCK_SERVERS else "https://api.hunter.io/v2"
+    # Published Hunter.io limits for email-finder / domain-search; set HUNTER_MONTHLY_LIMIT to your plan's searches
+    HUNTER_REQUESTS_PER_SECOND = int(os.getenv('HUNTER_REQUESTS_PER_SECOND', 15))
+    HUNTER_REQUESTS_PER_MINUTE = int(os.getenv('HUNTER_REQUESTS_PER_MINUTE', 500))
+    HUNTER_MONTHLY_LIMIT = int(os.getenv('HUNTER_MONTHLY_LIMIT', 0))  # 0 = no local monthly cap
+    HUNTER_CONCURRENCY = int(os.getenv('HUNTER_CONCURRENCY', 5))
+    HUNTER_MAX_RATE_WAIT = float(os.getenv('HUNTER_MAX_RATE_WAIT', 120))  # seconds before giving up on a slot
+    
+    # Hunter credit budgeting (credits per call, per-run cap and account check)
+    HUNTER_RUN_CREDIT_BUDGET = float(os.getenv('HUNTER_RUN_CREDIT_BUDGET', 0))  # 0 = no per-run cap
+    HUNTER_CHECK_ACCOUNT = os.getenv('HUNTER_CHECK_ACCOUNT', 'true').lower() == 'true'
+    HUNTER_FINDER_CREDIT_COST = float(os.getenv('HUNTER_FINDER_CREDIT_COST', 1))
+    HUNTER_VERIFY_CREDIT_COST = float(os.getenv('HUNTER_VERIFY_CREDIT_COST', 0.5))
+    HUNTER_DOMAIN_SEARCH_CREDIT_COST = float(os.getenv('HUNTER_DOMAIN_SEARCH_CREDIT_COST', 1))  # per 10 emails
+    
+    # Local SQLite cache shared by the lookup caches
+    CACHE_DB_PATH = os.getenv('CACHE_DB_PATH', 'outreach_cache.db')
+    EMAIL_CACHE_ENABLED = os.getenv('EMAIL_CACHE_ENABLED', 'true').lower() == 'true'
+    EMAIL_CACHE_FOUND_TTL_DAYS = float(os.getenv('EMAIL_CACHE_FOUND_TTL_DAYS', 90))
+    EMAIL_CACHE_NOT_FOUND_TTL_DAYS = float(os.getenv('EMAIL_CACHE_NOT_FOUND_TTL_DAYS', 7))
+    VERIFY_CACHE_TTL_DAYS = float(os.getenv('VERIFY_CACHE_TTL_DAYS', 30))
+    
+    # Bulk email verification (Hunter email-verifier limits)
+    HUNTER_VERIFY_EMAILS = os.getenv('HUNTER_VERIFY_EMAILS', 'false').lower() == 'true'  # paid, opt-in
+    HUNTER_VERIFY_CONCURRENCY = int(os.getenv('HUNTER_VERIFY_CONCURRENCY', 5))
+    HUNTER_VERIFY_REQUESTS_PER_SECOND = int(os.getenv('HUNTER_VERIFY_REQUESTS_PER_SECOND', 10))
+    HUNTER_VERIFY_REQUESTS_PER_MINUTE = int(os.getenv('HUNTER_VERIFY_REQUESTS_PER_MINUTE', 300))
+    
+    # Company domain resolution (Hunter domain-search once per company, plus manual overrides)
+    DOMAIN_OVERRIDES_FILE = os.getenv('DOMAIN_OVERRIDES_FILE', 'domain_overrides.json')
+    DOMAIN_CACHE_TTL_DAYS = float(os.getenv('DOMAIN_CACHE_TTL_DAYS', 180))
+    
+    # Domain-search harvesting: pull a company's known emails once and match people locally
+    HUNTER_HARVEST_MODE = os.getenv('HUNTER_HARVEST_MODE', 'false').lower() == 'true'
+    HUNTER_HARVEST_MIN_PEOPLE = int(os.getenv('HUNTER_HARVEST_MIN_PEOPLE', 10))  # only harvest bigger batches
+    HUNTER_HARVEST_MAX_EMAILS = int(os.getenv('HUNTER_HARVEST_MAX_EMAILS', 100))
+    
+    # Email pattern inference: learn each domain's format and verify local candidates
+    EMAIL_PATTERN_MODE = os.getenv('EMAIL_PATTERN_MODE', 'false').lower() == 'true'
+    EMAIL_PATTERN_MIN_SAMPLES = float(os.getenv('EMAIL_PATTERN_MIN_SAMPLES', 3))
+    EMAIL_PATTERN_MIN_CONFIDENCE = float(os.getenv('EMAIL_PATTERN_MIN_CONFIDENCE', 0.6))
+    EMAIL_PATTERN_SEED_LOOKUPS = int(os.getenv('EMAIL_PATTERN_SEED_LOOKUPS', 3))  # email-finder calls before inferring
+    
+    # OpenAI API
+    OPENAI_API_KEY = os.getenv('OPENAI_API_KEY') or ('mock-openai-key' if USE_MOCK_SERVERS else None)
+    OPENAI_API_BASE = f"{MOCK_SERVER_URL}/openai/v1" if USE_MOCK_SERVERS else os.getenv('OPENAI_API_BASE', 'https://api.openai.com/v1')
+    COMPANY_INFO_CACHE_TTL_DAYS = float(os.getenv('COMPANY_INFO_CACHE_TTL_DAYS', 30))
+    # Fetch every input company's overview in the background while the browser starts and logs in
+    COMPANY_INFO_PREFETCH = os.getenv('COMPANY_INFO_PREFETCH', 'true').lower() == 'true'
+    # Prompts carry a short Mission/Products/Values summary instead of the full company overview
+    PROMPT_COMPACTION_ENABLED = os.getenv('PROMPT_COMPACTION_ENABLED', 'true').lower() == 'true'
+    COMPANY_SUMMARY_MAX_WORDS = int(os.getenv('COMPANY_SUMMARY_MAX_WORDS', 25))
+    # Concurrent completions, paced to your OpenAI tier's limits (tier-1 gpt-3.5-turbo by default)
+    OPENAI_CONCURRENCY = int(os.getenv('OPENAI_CONCURRENCY', 8))
+    OPENAI_REQUESTS_PER_MINUTE = int(os.getenv('OPENAI_REQUESTS_PER_MINUTE', 3500))
+    OPENAI_TOKENS_PER_MINUTE = int(os.getenv('OPENAI_TOKENS_PER_MINUTE', 60000))
+    OPENAI_CONTEXT_TOKENS = int(os.getenv('OPENAI_CONTEXT_TOKENS', 4096))  # model context window
+    # Batch mode: several people at the same company per completion, as structured JSON
+    MESSAGE_BATCH_MODE = os.getenv('MESSAGE_BATCH_MODE', 'false').lower() == 'true'
+    MESSAGE_BATCH_SIZE = int(os.getenv('MESSAGE_BATCH_SIZE', 5))
+    MESSAGE_BATCH_TOKENS_PER_PERSON = int(os.getenv('MESSAGE_BATCH_TOKENS_PER_PERSON', 350))
+    # Template mode: one AI template per company and alumni status, rendered locally per person
+    MESSAGE_TEMPLATE_MODE = os.getenv('MESSAGE_TEMPLATE_MODE', 'false').lower() == 'true'
+    # Batch job mode: messages go through the OpenAI Batch API (half price, results within 24h);
+    # submitted jobs are tracked in OPENAI_BATCH_DIR so an interrupted run resumes them
+    MESSAGE_BATCH_JOB_MODE = os.getenv('MESSAGE_BATCH_JOB_MODE', 'false').lower() == 'true'
+    OPENAI_BATCH_DIR = os.getenv('OPENAI_BATCH_DIR', 'batch_jobs')
+    OPENAI_BATCH_POLL_SECONDS = float(os.getenv('OPENAI_BATCH_POLL_SECONDS', 60))
+    OPENAI_BATCH_MAX_WAIT_HOURS = float(os.getenv('OPENAI_BATCH_MAX_WAIT_HOURS', 24))
+    # Model cascade: a cheap model drafts, drafts failing local validation are regenerated
+    # (MESSAGE_DRAFT_ATTEMPTS in total) and then escalated (empty escalation model = never)
+    MESSAGE_DRAFT_MODEL = os.getenv('MESSAGE_DRAFT_MODEL', 'gpt-4o-mini')
+    MESSAGE_ESCALATION_MODEL = os.getenv('MESSAGE_ESCALATION_MODEL', 'gpt-4o')
+    MESSAGE_DRAFT_ATTEMPTS = int(os.getenv('MESSAGE_DRAFT_ATTEMPTS', 1))
+    MESSAGE_MAX_WORDS = int(os.getenv('MESSAGE_MAX_WORDS', 200))
+    # Completions cached by a hash of model, parameters and messages; FORCE_REGENERATE skips reads
+    COMPLETION_CACHE_ENABLED = os.getenv('COMPLETION_CACHE_ENABLED', 'true').lower() == 'true'
+    COMPLETION_CACHE_MAX_MB = float(os.getenv('COMPLETION_CACHE_MAX_MB', 50))
+    FORCE_REGENERATE = os.getenv('FORCE_REGENERATE', 'false').lower() == 'true'
+    # USD per 1K tokens for models missing from llm_metrics.MODEL_PRICES
+    OPENAI_PROMPT_PRICE_PER_1K = float(os.getenv('OPENAI_PROMPT_PRICE_PER_1K', 0.0005))
+    OPENAI_COMPLETION_PRICE_PER_1K = float(os.getenv('OPENAI_COMPLETION_PRICE_PER_1K', 0.0015))
+    
+    # GMass API
+    GMASS_API_KEY = os.getenv('GMASS_API_KEY') or ('mock-gmass-key' if USE_MOCK_SERVERS else None)
+    GMASS_BASE_URL = f"{MOCK_SERVER_URL}/gmass" if USE_MOCK_SERVERS else "https://api.gmass.co"
+    
+    # HTTP transport (shared keep-alive pools for Hunter, GMass and OpenAI)
+    HTTP_CONNECT_TIMEOUT = float(os.getenv('HTTP_CONNECT_TIMEOUT', 5))
+    HTTP_READ_TIMEOUT = float(os.getenv('HTTP_READ_TIMEOUT', 30))
+    HTTP_POOL_MAXSIZE = int(os.getenv('HTTP_POOL_MAXSIZE', 20))
+    HTTP2_ENABLED = os.getenv('HTTP2_ENABLED', 'false').lower() == 'true'
+    
+    # Retries with jittered exponential backoff, and per-service circuit breakers
+    HTTP_MAX_RETRIES = int(os.getenv('HTTP_MAX_RETRIES', 3))
+    HTTP_BACKOFF_BASE = float(os.getenv('HTTP_BACKOFF_BASE', 0.5))  # seconds
+    HTTP_BACKOFF_MAX = float(os.getenv('HTTP_BACKOFF_MAX', 30))
+    HTTP_MAX_RETRY_AFTER = float(os.getenv('HTTP_MAX_RETRY_AFTER', 60))  # longer Retry-After = give up
+    CIRCUIT_FAILURE_THRESHOLD = int(os.getenv('CIRCUIT_FAILURE_THRESHOLD', 5))
+    CIRCUIT_RESET_SECONDS = float(os.getenv('CIRCUIT_RESET_SECONDS', 30))
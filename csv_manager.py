@@ -6,6 +6,7 @@ import csv
 import os
 from datetime import datetime
 import logging
+from profile_utils import ensure_person_key
 
 class CSVManager:
     def __init__(self):
@@ -19,7 +20,11 @@ class CSVManager:
         self.logger = logging.getLogger(__name__)
     
     def export_contacts(self, contacts, filename=None):
-        """Export contacts to CSV file"""
+        """Export contacts to CSV file
+
+        `contacts` can be any iterable, including a streaming generator such as
+        BulkEmailVerifier.iter_verify(), so rows are written as results arrive.
+        """
         if not contacts:
             self.logger.warning("No contacts to export")
             return None
@@ -40,27 +45,38 @@ class CSVManager:
                     writer = csv.writer(csvfile)
                     
                     # Write headers
-                    headers = ['Name', 'Title', 'Company', 'Location', 'SCU Alumni', 'Profile URL']
+                    headers = ['Name', 'Title', 'Company', 'Location', 'SCU Alumni', 'Profile URL', 'Person Key',
+                               'Email', 'Email Verification']
                     writer.writerow(headers)
                     
-                    # Write contact data
+                    # Write contact data, skipping repeats of the same person
+                    seen_keys = set()
                     for contact in contacts:
+                        person_key = ensure_person_key(contact)
+                        if person_key in seen_keys:
+                            continue
+                        seen_keys.add(person_key)
+                        
                         row = [
                             contact.get('name', ''),
                             contact.get('title', ''),
                             contact.get('company', ''),
                             contact.get('location', ''),
                             'Yes' if contact.get('is_scu_alumni', False) else 'No',
-                            contact.get('profile_url', '')
+                            contact.get('profile_url', ''),
+                            person_key,
+                            contact.get('email') or '',
+                            contact.get('email_verification_status') or ''
                         ]
                         writer.writerow(row)
+                        csvfile.flush()
             
-            self.logger.info(f"Successfully exported {len(contacts)} contacts to {filename}")
+            self.logger.info(f"Successfully exported {len(seen_keys)} contacts to {filename}")
             return {
                 'success': True,
                 'filename': filename,
                 'filepath': os.path.abspath(filepath),
-                'contact_count': len(contacts)
+                'contact_count': len(seen_keys)
             }
             
         except Exception as e:
@@ -0,0 +1,111 @@
+"""
+Hunter.io domain-search harvesting: fetch a company's known emails once per run
+"""
+import logging
+import math
+import threading
+from config import Config
+from http_client import get_transport
+from name_matching import NameIndex
+
+# Hunter returns at most 100 emails per domain-search page
+HARVEST_PAGE_SIZE = 100
+
+
+class DomainHarvester:
+    """Pulls domain-search results for a domain and indexes them by normalized name"""
+
+    def __init__(self, api_key=None, rate_limiter=None, max_emails=None, budget=None):
+        self.api_key = api_key or Config.HUNTER_API_KEY
+        self.base_url = Config.HUNTER_BASE_URL
+        self.rate_limiter = rate_limiter
+        self.budget = budget
+        self.max_emails = max_emails or Config.HUNTER_HARVEST_MAX_EMAILS
+        self.http = get_transport()
+        self._indexes = {}
+        self.domain_patterns = {}
+        self._lock = threading.Lock()
+        self.api_calls = 0
+        self.setup_logging()
+
+    def setup_logging(self):
+        logging.basicConfig(level=logging.INFO)
+        self.logger = logging.getLogger(__name__)
+
+    def get_index(self, domain):
+        """Return the NameIndex for a domain, harvesting it on first use"""
+        with self._lock:
+            if domain in self._indexes:
+                return self._indexes[domain]
+
+        index = NameIndex(self.harvest(domain))
+        with self._lock:
+            self._indexes[domain] = index
+        self.logger.info(f"Harvested {len(index)} named emails for {domain}")
+        return index
+
+    def harvest(self, domain):
+        """Fetch up to max_emails personal emails (with names) for a domain"""
+        entries = []
+        offset = 0
+
+        try:
+            while offset < self.max_emails:
+                if self.rate_limiter is not None:
+                    self.rate_limiter.acquire_sync(max_wait=Config.HUNTER_MAX_RATE_WAIT)
+
+                limit = min(HARVEST_PAGE_SIZE, self.max_emails - offset)
+
+                # Domain-search is billed per 10 emails returned
+                page_cost = Config.HUNTER_DOMAIN_SEARCH_CREDIT_COST
+                reserved = math.ceil(limit / 10) * page_cost
+                if self.budget is not None and page_cost > 0:
+                    # Shrink the page to what the budget has room for, leaving finder lookups their share
+                    reserved = self.budget.reserve_up_to(reserved, page_cost)
+                    if not reserved:
+                        self.logger.info(f"No Hunter credits left to harvest {domain}")
+                        break
+                    limit = min(limit, int(round(reserved / page_cost)) * 10)
+
+                response = self.http.get(
+                    f"{self.base_url}/domain-search",
+                    params={
+                        'api_key': self.api_key,
+                        'domain': domain,
+                        'type': 'personal',
+                        'limit': limit,
+                        'offset': offset
+                    },
+                    service='hunter'
+                )
+                self.api_calls += 1
+                if not response.ok and self.budget is not None:
+                    self.budget.settle(reserved, 0)
+                response.raise_for_status()
+
+                payload = response.json()
+                data = payload.get('data') or {}
+                if data.get('pattern'):
+                    self.domain_patterns[domain] = data['pattern']
+                emails = data.get('emails') or []
+                if self.budget is not None:
+                    self.budget.settle(reserved, math.ceil(len(emails) / 10) * Config.HUNTER_DOMAIN_SEARCH_CREDIT_COST)
+                for email_data in emails:
+                    if email_data.get('value') and email_data.get('last_name'):
+                        entries.append({
+                            'email': email_data['value'],
+                            'first_name': email_data.get('first_name') or '',
+                            'last_name': email_data.get('last_name') or '',
+                            'confidence': email_data.get('confidence', 0),
+                            'sources': email_data.get('sources', [])
+                        })
+
+                total = ((payload.get('meta') or {}).get('results')) or 0
+                offset += limit
+                if len(emails) < limit or offset >= total:
+                    break
+
+        except Exception as e:
+            self.logger.error(f"Error harvesting emails for {domain}: {str(e)}")
+
+        return entries
@@ -0,0 +1,163 @@
+"""
+Company domain resolution via Hunter.io domain-search, with overrides and a persistent cache
+"""
+import csv
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from config import Config
+from http_client import get_transport
+
+DAY_SECONDS = 24 * 3600
+
+
+def normalize_company_name(company_name):
+    return ' '.join((company_name or '').lower().split())
+
+
+def guess_company_domain(company_name):
+    """Last-resort guess: squash the company name and append .com"""
+    company_domain = company_name.lower().replace(' ', '').replace('inc', '').replace('llc', '').replace('corp', '')
+    return f"{company_domain}.com"
+
+
+class DomainResolver:
+    """Resolves each company to its email domain once and remembers it
+
+    Resolution order: user overrides file, in-memory memo, SQLite cache, Hunter
+    domain-search (one call per company), then the old name-squashing guess.
+    Guesses are only memoized for the run, never persisted.
+    """
+
+    def __init__(self, api_key=None, rate_limiter=None, overrides_file=None, db_path=None, ttl_days=None):
+        self.api_key = api_key or Config.HUNTER_API_KEY
+        self.base_url = Config.HUNTER_BASE_URL
+        self.rate_limiter = rate_limiter
+        self.http = get_transport()
+        self.ttl_seconds = (ttl_days if ttl_days is not None else Config.DOMAIN_CACHE_TTL_DAYS) * DAY_SECONDS
+        self.setup_logging()
+
+        self.overrides = self.load_overrides(overrides_file or Config.DOMAIN_OVERRIDES_FILE)
+        self._memo = {}
+        self._company_locks = {}
+        self._lock = threading.Lock()
+        self._db_lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path or Config.CACHE_DB_PATH, check_same_thread=False)
+        self._create_table()
+
+    def setup_logging(self):
+        logging.basicConfig(level=logging.INFO)
+        self.logger = logging.getLogger(__name__)
+
+    def _create_table(self):
+        with self._db_lock:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS company_domains (
+                    company_key TEXT PRIMARY KEY,
+                    company_name TEXT,
+                    domain TEXT NOT NULL,
+                    source TEXT,
+                    fetched_at REAL NOT NULL
+                )
+            """)
+            self._conn.commit()
+
+    def load_overrides(self, path):
+        """Load {company: domain} overrides from a JSON object or a two-column CSV"""
+        overrides = {}
+        if not path or not os.path.exists(path):
+            return overrides
+
+        try:
+            if path.endswith('.csv'):
+                with open(path, newline='', encoding='utf-8') as f:
+                    for row in csv.reader(f):
+                        if len(row) >= 2 and row[0].strip() and row[0].strip().lower() != 'company':
+                            overrides[normalize_company_name(row[0])] = row[1].strip().lower()
+            else:
+                with open(path, encoding='utf-8') as f:
+                    for company, domain in json.load(f).items():
+                        overrides[normalize_company_name(company)] = domain.strip().lower()
+
+            self.logger.info(f"Loaded {len(overrides)} company domain overrides from {path}")
+
+        except Exception as e:
+            self.logger.error(f"Error loading domain overrides from {path}: {str(e)}")
+
+        return overrides
+
+    def resolve(self, company_name):
+        """Return the email domain for a company"""
+        company_key = normalize_company_name(company_name)
+
+        if company_key in self.overrides:
+            return self.overrides[company_key]
+        if company_key in self._memo:
+            return self._memo[company_key]
+
+        # Only one thread looks up a given company; the rest wait for its answer
+        with self._lock:
+            company_lock = self._company_locks.setdefault(company_key, threading.Lock())
+
+        with company_lock:
+            if company_key in self._memo:
+                return self._memo[company_key]
+
+            domain = self._get_cached(company_key)
+            if not domain:
+                domain = self._search_domain(company_name)
+                if domain:
+                    self._set_cached(company_key, company_name, domain, 'hunter')
+                else:
+                    domain = guess_company_domain(company_name)
+                    self.logger.warning(f"Falling back to guessed domain {domain} for {company_name}")
+
+            self._memo[company_key] = domain
+            return domain
+
+    def _get_cached(self, company_key):
+        with self._db_lock:
+            row = self._conn.execute(
+                "SELECT domain, fetched_at FROM company_domains WHERE company_key = ?",
+                (company_key,)
+            ).fetchone()
+        if row and time.time() - row[1] <= self.ttl_seconds:
+            return row[0]
+        return None
+
+    def _set_cached(self, company_key, company_name, domain, source):
+        with self._db_lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO company_domains (company_key, company_name, domain, source, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (company_key, company_name, domain, source, time.time())
+            )
+            self._conn.commit()
+
+    def _search_domain(self, company_name):
+        """Ask Hunter's domain-search which domain it associates with a company name"""
+        try:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire_sync(max_wait=Config.HUNTER_MAX_RATE_WAIT)
+
+            self.logger.info(f"Resolving domain for {company_name}")
+            response = self.http.get(
+                f"{self.base_url}/domain-search",
+                params={'api_key': self.api_key, 'company': company_name, 'limit': 1},
+                service='hunter'
+            )
+            response.raise_for_status()
+
+            data = response.json().get('data') or {}
+            return (data.get('domain') or '').lower() or None
+
+        except Exception as e:
+            self.logger.error(f"Error resolving domain for {company_name}: {str(e)}")
+            return None
+
+    def close(self):
+        with self._db_lock:
+            self._conn.close()
@@ -0,0 +1,210 @@
+"""
+Persistent SQLite cache for Hunter.io email lookups (with negative caching)
+"""
+import json
+import logging
+import sqlite3
+import threading
+import time
+import unicodedata
+from config import Config
+
+DAY_SECONDS = 24 * 3600
+
+
+def normalize_name_part(value):
+    """Lowercase, strip accents and collapse whitespace"""
+    value = unicodedata.normalize('NFKD', value or '')
+    value = ''.join(ch for ch in value if not unicodedata.combining(ch))
+    return ' '.join(value.lower().split())
+
+
+def normalize_domain(domain):
+    domain = (domain or '').strip().lower()
+    if domain.startswith('www.'):
+        domain = domain[4:]
+    return domain
+
+
+class EmailLookupCache:
+    """Caches email-finder results keyed by normalized (first name, last name, domain)
+
+    Found results keep their score and sources and live for EMAIL_CACHE_FOUND_TTL_DAYS.
+    not_found results are cached too, with the shorter EMAIL_CACHE_NOT_FOUND_TTL_DAYS, so
+    we don't pay again for people Hunter couldn't resolve yesterday. Errors are never cached.
+    """
+
+    CACHEABLE_STATUSES = ('found', 'not_found')
+
+    def __init__(self, db_path=None, found_ttl_days=None, not_found_ttl_days=None):
+        self.db_path = db_path or Config.CACHE_DB_PATH
+        self.ttl_seconds = {
+            'found': (found_ttl_days if found_ttl_days is not None else Config.EMAIL_CACHE_FOUND_TTL_DAYS) * DAY_SECONDS,
+            'not_found': (not_found_ttl_days if not_found_ttl_days is not None else Config.EMAIL_CACHE_NOT_FOUND_TTL_DAYS) * DAY_SECONDS
+        }
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self.setup_logging()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._create_table()
+
+    def setup_logging(self):
+        logging.basicConfig(level=logging.INFO)
+        self.logger = logging.getLogger(__name__)
+
+    def _create_table(self):
+        with self._lock:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS email_lookups (
+                    cache_key TEXT PRIMARY KEY,
+                    email TEXT,
+                    confidence INTEGER,
+                    sources TEXT,
+                    status TEXT NOT NULL,
+                    fetched_at REAL NOT NULL
+                )
+            """)
+            self._conn.commit()
+
+    def make_key(self, first_name, last_name, domain):
+        return '|'.join([normalize_name_part(first_name), normalize_name_part(last_name), normalize_domain(domain)])
+
+    def get(self, first_name, last_name, domain):
+        """Return a cached email result, or None on a miss or expired entry"""
+        cache_key = self.make_key(first_name, last_name, domain)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT email, confidence, sources, status, fetched_at FROM email_lookups WHERE cache_key = ?",
+                (cache_key,)
+            ).fetchone()
+
+            if row is None or time.time() - row[4] > self.ttl_seconds.get(row[3], 0):
+                self.misses += 1
+                return None
+
+            self.hits += 1
+
+        return {
+            'email': row[0],
+            'confidence': row[1] or 0,
+            'sources': json.loads(row[2]) if row[2] else [],
+            'status': row[3]
+        }
+
+    def set(self, first_name, last_name, domain, email_result):
+        """Store a found/not_found result (other statuses are ignored)"""
+        if email_result.get('status') not in self.CACHEABLE_STATUSES:
+            return False
+
+        cache_key = self.make_key(first_name, last_name, domain)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO email_lookups (cache_key, email, confidence, sources, status, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    cache_key,
+                    email_result.get('email'),
+                    email_result.get('confidence', 0),
+                    json.dumps(email_result.get('sources') or []),
+                    email_result['status'],
+                    time.time()
+                )
+            )
+            self._conn.commit()
+        return True
+
+    def purge_expired(self):
+        """Delete expired rows; returns how many were removed"""
+        now = time.time()
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM email_lookups WHERE (status = 'found' AND fetched_at < ?) "
+                "OR (status = 'not_found' AND fetched_at < ?)",
+                (now - self.ttl_seconds['found'], now - self.ttl_seconds['not_found'])
+            )
+            self._conn.commit()
+        return cursor.rowcount
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class EmailVerificationCache:
+    """Caches email-verifier results per address for VERIFY_CACHE_TTL_DAYS (errors are never cached)"""
+
+    def __init__(self, db_path=None, ttl_days=None):
+        self.db_path = db_path or Config.CACHE_DB_PATH
+        self.ttl_seconds = (ttl_days if ttl_days is not None else Config.VERIFY_CACHE_TTL_DAYS) * DAY_SECONDS
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        with self._lock:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS email_verifications (
+                    email TEXT PRIMARY KEY,
+                    status TEXT NOT NULL,
+                    score INTEGER,
+                    smtp_check INTEGER,
+                    fetched_at REAL NOT NULL
+                )
+            """)
+            self._conn.commit()
+
+    def get(self, email):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status, score, smtp_check, fetched_at FROM email_verifications WHERE email = ?",
+                ((email or '').lower(),)
+            ).fetchone()
+
+            if row is None or time.time() - row[3] > self.ttl_seconds:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+
+        return {
+            'email': email,
+            'status': row[0],
+            'score': row[1] or 0,
+            'sources': [],
+            'smtp_server': None,
+            'smtp_check': bool(row[2])
+        }
+
+    def set(self, email, verification):
+        if not email or verification.get('status') in (None, 'error'):
+            return False
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO email_verifications (email, status, score, smtp_check, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (email.lower(), verification['status'], verification.get('score', 0),
+                 int(bool(verification.get('smtp_check'))), time.time())
+            )
+            self._conn.commit()
+        return True
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
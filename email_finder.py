@@ -1,12 +1,33 @@
 import requests
-import time
 import logging
 from config import Config
+from http_client import get_transport
+from rate_limiter import build_rate_limiter
+from email_lookup_engine import EmailLookupEngine
+from email_cache import EmailLookupCache
+from domain_resolver import DomainResolver
+from domain_harvester import DomainHarvester
+from email_patterns import EmailPatternEngine
+from bulk_email_verifier import BulkEmailVerifier
+from hunter_budget import HunterBudget
 
 class EmailFinder:
     def __init__(self):
         self.api_key = Config.HUNTER_API_KEY
         self.base_url = Config.HUNTER_BASE_URL
+        self.http = get_transport()
+        self.rate_limiter = build_rate_limiter(
+            per_second=Config.HUNTER_REQUESTS_PER_SECOND,
+            per_minute=Config.HUNTER_REQUESTS_PER_MINUTE,
+            per_month=Config.HUNTER_MONTHLY_LIMIT,
+            name='hunter'
+        )
+        self.budget = HunterBudget(self.api_key)
+        self.email_cache = EmailLookupCache() if Config.EMAIL_CACHE_ENABLED else None
+        self.domain_resolver = DomainResolver(self.api_key, self.rate_limiter)
+        self.harvester = DomainHarvester(self.api_key, self.rate_limiter, budget=self.budget)
+        self.pattern_engine = EmailPatternEngine()
+        self.verifier = BulkEmailVerifier(self)
         self.setup_logging()
         
     def setup_logging(self):
@@ -28,7 +49,7 @@ class EmailFinder:
                 'last_name': last_name
             }
             
-            response = requests.get(url, params=params)
+            response = self.http.get(url, params=params, service='hunter')
             response.raise_for_status()
             
             data = response.json()
@@ -79,7 +100,7 @@ class EmailFinder:
                 'email': email
             }
             
-            response = requests.get(url, params=params)
+            response = self.http.get(url, params=params, service='hunter')
             response.raise_for_status()
             
             data = response.json()
@@ -116,60 +137,51 @@ class EmailFinder:
             }
     
     def get_company_domain(self, company_name):
-        """Extract domain from company name (simplified approach)"""
-        # This is a simplified approach - in practice, you might want to use
-        # a more sophisticated method to get the actual company domain
-        company_domain = company_name.lower().replace(' ', '').replace('inc', '').replace('llc', '').replace('corp', '')
-        return f"{company_domain}.com"
+        """Resolve a company's email domain (overrides, cache, then one Hunter domain-search per company)"""
+        return self.domain_resolver.resolve(company_name)
     
-    def find_emails_for_people(self, people_data):
-        """Find emails for a list of people"""
-        results = []
+    def split_name(self, name):
+        """Split a full name into first name and the rest"""
+        name_parts = (name or '').split()
+        if len(name_parts) >= 2:
+            return name_parts[0], ' '.join(name_parts[1:])
+        return (name_parts[0] if name_parts else ''), ''
+    
+    def prepare_person(self, person):
+        """Fill in first/last name and company domain on a person; returns (first, last, domain)"""
+        first_name, last_name = self.split_name(person.get('name', ''))
         
-        for person in people_data:
-            try:
-                # Extract first and last name
-                name_parts = person.get('name', '').split()
-                if len(name_parts) >= 2:
-                    first_name = name_parts[0]
-                    last_name = ' '.join(name_parts[1:])
-                else:
-                    first_name = name_parts[0] if name_parts else ''
-                    last_name = ''
-                
-                # Get company domain
-                company = person.get('company', '')
-                company_domain = self.get_company_domain(company)
-                
-                # Find email
-                email_result = self.find_email(first_name, last_name, company_domain)
-                
-                # Combine person data with email data
-                person_with_email = {
-                    **person,
-                    'first_name': first_name,
-                    'last_name': last_name,
-                    'company_domain': company_domain,
-                    'email': email_result['email'],
-                    'email_confidence': email_result['confidence'],
-                    'email_sources': email_result['sources'],
-                    'email_status': email_result['status']
-                }
-                
-                results.append(person_with_email)
-                
-                # Rate limiting - Hunter.io has limits
-                time.sleep(1)
-                
-            except Exception as e:
-                self.logger.error(f"Error processing person {person.get('name', 'Unknown')}: {str(e)}")
-                # Add person without email data
-                results.append({
-                    **person,
-                    'email': None,
-                    'email_confidence': 0,
-                    'email_sources': [],
-                    'email_status': 'error'
-                })
+        # Company domain is stored once on the shared company record
+        company_domain = person.get('company_domain') or self.get_company_domain(person.get('company', ''))
         
-        return results
\ No newline at end of file
+        person['first_name'] = first_name
+        person['last_name'] = last_name
+        person['company_domain'] = company_domain
+        return first_name, last_name, company_domain
+    
+    def empty_result(self, status):
+        """Email result for a person we have no email for"""
+        return {
+            'email': None,
+            'confidence': 0,
+            'sources': [],
+            'status': status
+        }
+    
+    def apply_email_result(self, person, email_result):
+        """Copy an email lookup result onto a person record"""
+        person['email'] = email_result['email']
+        person['email_confidence'] = email_result['confidence']
+        person['email_sources'] = email_result['sources']
+        person['email_status'] = email_result['status']
+        return person
+    
+    def verify_emails_for_people(self, people_data):
+        """Verify every found email in bulk (deduped, cached, concurrent); returns people in input order"""
+        return self.verifier.verify_people(people_data)
+    
+    def find_emails_for_people(self, people_data):
+        """Find emails for a list of people (annotates Person records in place)"""
+        results = EmailLookupEngine(self).run(people_data)
+        self.http.log_latency_summary()
+        return results
@@ -0,0 +1,274 @@
+"""
+Async concurrent Hunter.io email lookups with bounded concurrency and rate limiting
+"""
+import asyncio
+import logging
+import time
+from config import Config
+from person import Person
+from rate_limiter import RateLimitExceeded
+from async_utils import run_sync
+
+
+class EmailLookupEngine:
+    """Looks up emails for many people concurrently, returning results in input order
+
+    Requests are paced by the EmailFinder's Hunter rate limiter (per-second, per-minute and
+    per-month token buckets) and at most `concurrency` lookups are in flight at once.
+    The blocking Hunter calls run in worker threads over the shared pooled HTTP session.
+    """
+
+    def __init__(self, email_finder, concurrency=None):
+        self.email_finder = email_finder
+        self.concurrency = concurrency or Config.HUNTER_CONCURRENCY
+        self.setup_logging()
+
+    def setup_logging(self):
+        logging.basicConfig(level=logging.INFO)
+        self.logger = logging.getLogger(__name__)
+
+    def run(self, people_data):
+        """Synchronous entry point"""
+        return run_sync(self.lookup_all(people_data))
+
+    async def lookup_all(self, people_data):
+        """Find emails for every person; returns Person records in the same order"""
+        people = [Person.from_dict(person) for person in people_data]
+        if not people:
+            return []
+
+        start = time.perf_counter()
+        budget = self.email_finder.budget
+        if Config.HUNTER_CHECK_ACCOUNT and budget.account_available is None:
+            await asyncio.to_thread(budget.refresh_account_usage)
+
+        await self._resolve_company_domains(people)
+
+        # Cache hits are free; everyone else is looked up in priority order (alumni first)
+        pending = budget.prioritize(self._apply_cached_results(people))
+        if Config.HUNTER_HARVEST_MODE:
+            pending = await self._match_harvested(pending)
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        if Config.EMAIL_PATTERN_MODE:
+            pending = await self._resolve_with_patterns(pending, semaphore)
+
+        await asyncio.gather(*(self._lookup_person(person, semaphore) for person in pending))
+
+        elapsed = time.perf_counter() - start
+        self.logger.info(
+            f"Looked up {len(people)} people in {elapsed:.1f}s "
+            f"(concurrency {self.concurrency}, {self.email_finder.rate_limiter.waits} rate-limit waits)"
+        )
+        if self.email_finder.email_cache is not None:
+            cache_stats = self.email_finder.email_cache.stats()
+            self.logger.info(f"Email cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses")
+        budget_summary = budget.summary()
+        self.logger.info(
+            f"Hunter credits spent: {budget_summary['spent']:g}"
+            + (f", {budget_summary['skipped']} lookups skipped by budget" if budget_summary['skipped'] else '')
+        )
+        return people
+
+    async def _resolve_company_domains(self, people):
+        """Resolve each distinct company's domain once, before any per-person lookups"""
+        companies = {}
+        for person in people:
+            if person.company_ref is not None and not person.company_ref.domain:
+                companies[id(person.company_ref)] = person.company_ref
+
+        async def resolve(company):
+            try:
+                company.domain = await asyncio.to_thread(self.email_finder.get_company_domain, company.name)
+            except Exception as e:
+                self.logger.error(f"Error resolving domain for {company.name}: {str(e)}")
+
+        await asyncio.gather(*(resolve(company) for company in companies.values()))
+
+    def _apply_cached_results(self, people):
+        """Fill in names, domains and cached results; returns the people still needing a lookup"""
+        email_cache = self.email_finder.email_cache
+        pending = []
+
+        for person in people:
+            try:
+                first_name, last_name, company_domain = self.email_finder.prepare_person(person)
+
+                # Previously resolved (or known-missing) people don't spend API credits
+                if email_cache is not None:
+                    cached_result = email_cache.get(first_name, last_name, company_domain)
+                    if cached_result is not None:
+                        self.email_finder.apply_email_result(person, cached_result)
+                        self._learn_pattern(person)
+                        continue
+
+                pending.append(person)
+
+            except Exception as e:
+                self.logger.error(f"Error processing person {person.get('name', 'Unknown')}: {str(e)}")
+                self.email_finder.apply_email_result(person, self.email_finder.empty_result('error'))
+
+        return pending
+
+    async def _match_harvested(self, people):
+        """Match people against each big company's harvested domain-search emails
+
+        Only domains with at least HUNTER_HARVEST_MIN_PEOPLE pending people are harvested;
+        everyone left unmatched falls through to per-person email-finder calls.
+        """
+        by_domain = {}
+        for person in people:
+            by_domain.setdefault(person.get('company_domain'), []).append(person)
+
+        harvest_domains = [
+            domain for domain, group in by_domain.items()
+            if domain and len(group) >= Config.HUNTER_HARVEST_MIN_PEOPLE
+        ]
+        if not harvest_domains:
+            return people
+
+        indexes = await asyncio.gather(*(
+            asyncio.to_thread(self.email_finder.harvester.get_index, domain) for domain in harvest_domains
+        ))
+
+        email_cache = self.email_finder.email_cache
+        pattern_engine = self.email_finder.pattern_engine
+        matched = set()
+        for domain, index in zip(harvest_domains, indexes):
+            # Everything harvested also teaches us the domain's email format
+            pattern_engine.learn_hunter_pattern(domain, self.email_finder.harvester.domain_patterns.get(domain))
+            for entry in index.entries:
+                pattern_engine.learn(domain, entry['first_name'], entry['last_name'], entry['email'])
+
+            for person in by_domain[domain]:
+                entry = index.match(person.get('first_name'), person.get('last_name'))
+                if entry is None:
+                    continue
+
+                email_result = {
+                    'email': entry['email'],
+                    'confidence': entry.get('confidence', 0),
+                    'sources': entry.get('sources', []),
+                    'status': 'found'
+                }
+                self.email_finder.apply_email_result(person, email_result)
+                if email_cache is not None:
+                    email_cache.set(person.get('first_name'), person.get('last_name'), domain, email_result)
+                matched.add(id(person))
+
+        self.logger.info(
+            f"Harvest matched {len(matched)} people across {len(harvest_domains)} domains "
+            f"({self.email_finder.harvester.api_calls} domain-search calls)"
+        )
+        return [person for person in people if id(person) not in matched]
+
+    async def _resolve_with_patterns(self, people, semaphore):
+        """Use learned per-domain email formats to build and verify candidates locally
+
+        Domains without a confident pattern get up to EMAIL_PATTERN_SEED_LOOKUPS regular
+        email-finder lookups first, so the rest of that company can use the learned format.
+        Returns the people still unresolved.
+        """
+        pattern_engine = self.email_finder.pattern_engine
+        by_domain = {}
+        for person in people:
+            by_domain.setdefault(person.get('company_domain'), []).append(person)
+
+        seeds = []
+        candidates = []
+        for domain, group in by_domain.items():
+            if not domain:
+                seeds.extend(group)
+            elif pattern_engine.best_pattern(domain) is None:
+                seeds.extend(group[:Config.EMAIL_PATTERN_SEED_LOOKUPS])
+                candidates.extend(group[Config.EMAIL_PATTERN_SEED_LOOKUPS:])
+            else:
+                candidates.extend(group)
+
+        if not candidates:
+            return people
+
+        await asyncio.gather(*(self._lookup_person(person, semaphore) for person in seeds))
+        verified = await asyncio.gather(*(self._verify_candidate(person, semaphore) for person in candidates))
+
+        unresolved = [person for person, ok in zip(candidates, verified) if not ok]
+        self.logger.info(
+            f"Pattern inference resolved {len(candidates) - len(unresolved)} of {len(candidates)} people "
+            f"({len(seeds)} seed lookups)"
+        )
+        return unresolved
+
+    async def _verify_candidate(self, person, semaphore):
+        """Verify the pattern-built address for a person; True if it was confirmed"""
+        first_name = person.get('first_name', '')
+        last_name = person.get('last_name', '')
+        company_domain = person.get('company_domain')
+        candidate = self.email_finder.pattern_engine.candidate(company_domain, first_name, last_name)
+        if not candidate:
+            return False
+
+        async with semaphore:
+            try:
+                verification = await self.email_finder.verifier.verify_address(candidate)
+            except Exception as e:
+                self.logger.warning(f"Could not verify {candidate}: {str(e)}")
+                return False
+
+        if verification.get('status') not in ('deliverable', 'valid'):
+            return False
+
+        email_result = {
+            'email': candidate,
+            'confidence': verification.get('score', 0),
+            'sources': verification.get('sources', []),
+            'status': 'found'
+        }
+        self.email_finder.apply_email_result(person, email_result)
+        person['email_verification_status'] = verification.get('status')
+        person['email_verification_score'] = verification.get('score', 0)
+        if self.email_finder.email_cache is not None:
+            self.email_finder.email_cache.set(first_name, last_name, company_domain, email_result)
+        return True
+
+    def _learn_pattern(self, person):
+        """Feed a found email back into the pattern engine"""
+        if person.get('email_status') == 'found' and person.get('email'):
+            self.email_finder.pattern_engine.learn(
+                person.get('company_domain'), person.get('first_name'), person.get('last_name'), person.get('email')
+            )
+
+    async def _lookup_person(self, person, semaphore):
+        async with semaphore:
+            try:
+                first_name = person.get('first_name', '')
+                last_name = person.get('last_name', '')
+                company_domain = person.get('company_domain')
+
+                budget = self.email_finder.budget
+                cost = Config.HUNTER_FINDER_CREDIT_COST
+                if not budget.try_reserve(cost):
+                    self.email_finder.apply_email_result(person, self.email_finder.empty_result('budget_skipped'))
+                    return
+
+                try:
+                    await self.email_finder.rate_limiter.acquire(max_wait=Config.HUNTER_MAX_RATE_WAIT)
+                except RateLimitExceeded as e:
+                    budget.settle(cost, 0)
+                    self.logger.warning(f"Skipping {person.get('name', 'Unknown')}: {str(e)}")
+                    self.email_finder.apply_email_result(person, self.email_finder.empty_result('quota_exceeded'))
+                    return
+
+                email_result = await asyncio.to_thread(
+                    self.email_finder.find_email, first_name, last_name, company_domain
+                )
+                budget.settle(cost, budget.finder_cost(email_result))
+                self.email_finder.apply_email_result(person, email_result)
+                self._learn_pattern(person)
+
+                email_cache = self.email_finder.email_cache
+                if email_cache is not None:
+                    email_cache.set(first_name, last_name, company_domain, email_result)
+
+            except Exception as e:
+                self.logger.error(f"Error processing person {person.get('name', 'Unknown')}: {str(e)}")
+                self.email_finder.apply_email_result(person, self.email_finder.empty_result('error'))
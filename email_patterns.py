@@ -0,0 +1,164 @@
+"""
+Per-domain email pattern inference (first.last@, flast@, first@, ...)
+"""
+import logging
+import sqlite3
+import threading
+import time
+from config import Config
+from name_matching import name_tokens
+
+# Hunter.io pattern notation: {first}, {last}, {f} = first initial, {l} = last initial
+KNOWN_PATTERNS = (
+    '{first}.{last}', '{first}{last}', '{f}{last}', '{f}.{last}', '{first}_{last}',
+    '{first}-{last}', '{first}', '{last}', '{first}{l}', '{first}.{l}', '{last}.{first}',
+    '{last}{first}', '{last}{f}', '{last}.{f}', '{f}{l}'
+)
+
+
+def name_parts(first_name, last_name):
+    """Normalized {first, last, f, l} values, or None if either name is missing"""
+    first_tokens = name_tokens(first_name)
+    last_tokens = name_tokens(last_name)
+    if not first_tokens or not last_tokens:
+        return None
+    first, last = first_tokens[0], last_tokens[-1]
+    return {'first': first, 'last': last, 'f': first[0], 'l': last[0]}
+
+
+def render_pattern(pattern, first_name, last_name, domain):
+    """Build the address a pattern gives for a person, or None"""
+    parts = name_parts(first_name, last_name)
+    if parts is None or not domain:
+        return None
+    try:
+        local_part = pattern.format(**parts)
+    except (KeyError, IndexError, ValueError):
+        return None
+    return f"{local_part}@{domain.lower()}"
+
+
+def matching_patterns(first_name, last_name, email):
+    """Every known pattern that reproduces the email's local part for this person"""
+    parts = name_parts(first_name, last_name)
+    if parts is None or not email or '@' not in email:
+        return []
+    local_part = email.split('@')[0].lower()
+    return [pattern for pattern in KNOWN_PATTERNS if pattern.format(**parts) == local_part]
+
+
+class EmailPatternEngine:
+    """Learns each domain's email format from known emails and proposes candidates
+
+    Each distinct known email at a domain is counted once, so re-learning from cache hits
+    across runs doesn't inflate confidence. Hunter's own domain-search pattern counts as
+    HUNTER_PATTERN_WEIGHT samples. Counts live in SQLite so later runs start with them.
+    """
+
+    HUNTER_PATTERN_WEIGHT = 3
+
+    def __init__(self, db_path=None, min_samples=None, min_confidence=None):
+        self.min_samples = min_samples or Config.EMAIL_PATTERN_MIN_SAMPLES
+        self.min_confidence = min_confidence or Config.EMAIL_PATTERN_MIN_CONFIDENCE
+        self._lock = threading.Lock()
+        self.setup_logging()
+        self._conn = sqlite3.connect(db_path or Config.CACHE_DB_PATH, check_same_thread=False)
+        self._create_tables()
+
+    def setup_logging(self):
+        logging.basicConfig(level=logging.INFO)
+        self.logger = logging.getLogger(__name__)
+
+    def _create_tables(self):
+        with self._lock:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS email_pattern_samples (
+                    domain TEXT NOT NULL,
+                    email TEXT NOT NULL,
+                    PRIMARY KEY (domain, email)
+                )
+            """)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS email_patterns (
+                    domain TEXT NOT NULL,
+                    pattern TEXT NOT NULL,
+                    weight REAL NOT NULL DEFAULT 0,
+                    updated_at REAL NOT NULL,
+                    PRIMARY KEY (domain, pattern)
+                )
+            """)
+            self._conn.commit()
+
+    def learn(self, domain, first_name, last_name, email):
+        """Record a known email; returns the patterns it supports"""
+        domain = (domain or '').lower()
+        if not domain or not email or not email.lower().endswith(f"@{domain}"):
+            return []
+
+        patterns = matching_patterns(first_name, last_name, email)
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT OR IGNORE INTO email_pattern_samples (domain, email) VALUES (?, ?)",
+                (domain, email.lower())
+            )
+            if cursor.rowcount:
+                # Emails that fit no known pattern still count as samples (lowering confidence)
+                for pattern in patterns or ['?']:
+                    self._add_weight(domain, pattern, 1.0 / max(1, len(patterns)))
+            # Commit even when nothing changed - the INSERT opened a transaction that would
+            # otherwise keep the shared cache database locked for the other connections
+            self._conn.commit()
+        return patterns
+
+    def learn_hunter_pattern(self, domain, pattern):
+        """Record the pattern Hunter's domain-search reports for a domain"""
+        domain = (domain or '').lower()
+        if not domain or pattern not in KNOWN_PATTERNS:
+            return False
+
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT OR IGNORE INTO email_pattern_samples (domain, email) VALUES (?, ?)",
+                (domain, f"hunter:{pattern}")
+            )
+            if cursor.rowcount:
+                self._add_weight(domain, pattern, self.HUNTER_PATTERN_WEIGHT)
+            self._conn.commit()
+        return True
+
+    def _add_weight(self, domain, pattern, weight):
+        self._conn.execute(
+            "INSERT INTO email_patterns (domain, pattern, weight, updated_at) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT(domain, pattern) DO UPDATE SET weight = weight + excluded.weight, updated_at = excluded.updated_at",
+            (domain, pattern, weight, time.time())
+        )
+
+    def best_pattern(self, domain):
+        """Return (pattern, confidence, samples) for a domain, or None if not confident yet"""
+        domain = (domain or '').lower()
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT pattern, weight FROM email_patterns WHERE domain = ? ORDER BY weight DESC",
+                (domain,)
+            ).fetchall()
+
+        total = sum(weight for _, weight in rows)
+        if not rows or total < self.min_samples or rows[0][0] == '?':
+            return None
+
+        pattern, weight = rows[0]
+        confidence = weight / total
+        if confidence < self.min_confidence:
+            return None
+        return pattern, confidence, total
+
+    def candidate(self, domain, first_name, last_name):
+        """Best-guess address for a person at a domain, or None"""
+        best = self.best_pattern(domain)
+        if best is None:
+            return None
+        return render_pattern(best[0], first_name, last_name, domain)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -2,11 +2,13 @@ import requests
 import json
 import logging
 from config import Config
+from http_client import get_transport
 
 class GMassIntegration:
     def __init__(self):
         self.api_key = Config.GMASS_API_KEY
-        self.base_url = "https://api.gmass.co"
+        self.base_url = Config.GMASS_BASE_URL
+        self.http = get_transport()
         self.setup_logging()
         
     def setup_logging(self):
@@ -50,7 +52,7 @@ class GMassIntegration:
                 }
             }
             
-            response = requests.post(url, headers=headers, json=campaign_data)
+            response = self.http.post(url, service='gmass', headers=headers, json=campaign_data)
             response.raise_for_status()
             
             result = response.json()
@@ -73,7 +75,7 @@ class GMassIntegration:
                 'Content-Type': 'application/json'
             }
             
-            response = requests.get(url, headers=headers)
+            response = self.http.get(url, service='gmass', headers=headers)
             response.raise_for_status()
             
             return response.json()
@@ -155,7 +157,7 @@ Best,
                 'test_email': test_email
             }
             
-            response = requests.post(url, headers=headers, json=data)
+            response = self.http.post(url, service='gmass', headers=headers, json=data)
             response.raise_for_status()
             
             self.logger.info(f"Test email sent to {test_email}")
@@ -178,7 +180,7 @@ Best,
                 'send_time': send_time
             }
             
-            response = requests.post(url, headers=headers, json=data)
+            response = self.http.post(url, service='gmass', headers=headers, json=data)
             response.raise_for_status()
             
             self.logger.info(f"Campaign scheduled for {send_time}")
@@ -197,7 +199,7 @@ Best,
                 'Content-Type': 'application/json'
             }
             
-            response = requests.get(url, headers=headers)
+            response = self.http.get(url, service='gmass', headers=headers)
             response.raise_for_status()
             
             return response.json()
@@ -3,6 +3,18 @@ from google.oauth2.service_account import Credentials
 import pandas as pd
 import logging
 from config import Config
+from profile_utils import ensure_person_key, make_person_key
+
+# Sheet columns - 'Person Key' is the stable id used to upsert rows across runs
+SHEET_HEADERS = [
+    'Name', 'Title', 'Company', 'Location', 'Profile URL',
+    'SCU Alumni', 'Email', 'Date Added', 'Status', 'Notes', 'Person Key'
+]
+PERSON_KEY_COLUMN = SHEET_HEADERS.index('Person Key') + 1
+PERSON_KEY_LETTER = chr(ord('A') + PERSON_KEY_COLUMN - 1)
+# Columns the pipeline owns and refreshes on upsert (Email onwards is left to the user)
+SCRAPED_COLUMNS = SHEET_HEADERS.index('Email')
+SCRAPED_LETTER = chr(ord('A') + SCRAPED_COLUMNS - 1)
 
 class GoogleSheetsManager:
     def __init__(self):
@@ -69,14 +81,10 @@ class GoogleSheetsManager:
                 pass
             
             # Add headers
-            headers = [
-                'Name', 'Title', 'Company', 'Location', 'Profile URL',
-                'SCU Alumni', 'Email', 'Date Added', 'Status', 'Notes'
-            ]
-            self.sheet.append_row(headers)
+            self.sheet.append_row(SHEET_HEADERS)
             
             # Format headers (make them bold)
-            self.sheet.format('A1:J1', {
+            self.sheet.format('A1:K1', {
                 'textFormat': {'bold': True},
                 'backgroundColor': {'red': 0.9, 'green': 0.9, 'blue': 0.9}
             })
@@ -97,17 +105,11 @@ class GoogleSheetsManager:
             # Get the first worksheet
             worksheet = spreadsheet.sheet1
             
-            # Define headers
-            headers = [
-                'Name', 'Title', 'Company', 'Location', 'Profile URL', 
-                'SCU Alumni', 'Email', 'Date Added', 'Status', 'Notes'
-            ]
-            
             # Add headers to the first row
-            worksheet.append_row(headers)
+            worksheet.append_row(SHEET_HEADERS)
             
             # Format headers (make them bold)
-            worksheet.format('A1:J1', {
+            worksheet.format('A1:K1', {
                 'textFormat': {'bold': True},
                 'backgroundColor': {'red': 0.9, 'green': 0.9, 'blue': 0.9}
             })
@@ -130,19 +132,7 @@ class GoogleSheetsManager:
             rows_to_add = []
             
             for person in people_data:
-                row = [
-                    person.get('name', ''),
-                    person.get('title', ''),
-                    person.get('company', ''),
-                    person.get('location', ''),
-                    person.get('profile_url', ''),
-                    'Yes' if person.get('is_scu_alumni', False) else 'No',
-                    '',  # Empty email column for manual entry
-                    pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S'),
-                    'New',
-                    ''
-                ]
-                rows_to_add.append(row)
+                rows_to_add.append(self._build_row(person))
             
             # Add all rows at once
             if rows_to_add:
@@ -157,6 +147,91 @@ class GoogleSheetsManager:
             self.logger.error(f"Error adding people data to sheet: {str(e)}")
             return False
     
+    def _build_row(self, person):
+        """Build a sheet row for a person"""
+        return [
+            person.get('name', ''),
+            person.get('title', ''),
+            person.get('company', ''),
+            person.get('location', ''),
+            person.get('profile_url', ''),
+            'Yes' if person.get('is_scu_alumni', False) else 'No',
+            '',  # Empty email column for manual entry
+            pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'New',
+            '',
+            ensure_person_key(person)
+        ]
+    
+    def ensure_person_key_column(self):
+        """Add the Person Key header to sheets created before it existed and backfill keys
+
+        Returns the sheet's Person Key column values (header included).
+        """
+        header = self.sheet.row_values(1)
+        if not header:
+            return []
+        if 'Person Key' in header:
+            return self.sheet.col_values(PERSON_KEY_COLUMN)
+
+        rows = self.sheet.get_all_values()
+        keys = ['Person Key']
+        updates = [{'range': f"{PERSON_KEY_LETTER}1", 'values': [['Person Key']]}]
+        for row_number, row in enumerate(rows[1:], start=2):
+            row = row + [''] * (len(SHEET_HEADERS) - len(row))
+            person_key = make_person_key(row[4], row[0], row[2]) if row[0] else ''
+            keys.append(person_key)
+            if person_key:
+                updates.append({'range': f"{PERSON_KEY_LETTER}{row_number}", 'values': [[person_key]]})
+        self.sheet.batch_update(updates)
+        self.logger.info(f"Added Person Key column and backfilled {len(updates) - 1} rows")
+        return keys
+    
+    def upsert_people_data(self, people_data):
+        """Add or update people in the sheet, matching existing rows on Person Key"""
+        try:
+            if not self.sheet:
+                self.logger.error("No sheet connected. Call connect_to_sheet() first.")
+                return False
+            
+            # Map existing person keys to their 1-based row numbers (row 1 is the header)
+            existing_keys = self.ensure_person_key_column()
+            key_to_row = {key: i + 1 for i, key in enumerate(existing_keys) if key and i > 0}
+            
+            updates = []
+            rows_to_add = []
+            seen_keys = set()
+            
+            for person in people_data:
+                person_key = ensure_person_key(person)
+                if person_key in seen_keys:
+                    continue
+                seen_keys.add(person_key)
+                
+                row = self._build_row(person)
+                if person_key in key_to_row:
+                    row_number = key_to_row[person_key]
+                    # Only the scraped columns are refreshed; a hand-entered Email, Date Added,
+                    # Status and Notes are kept
+                    updates.append({
+                        'range': f"A{row_number}:{SCRAPED_LETTER}{row_number}",
+                        'values': [row[:SCRAPED_COLUMNS]]
+                    })
+                else:
+                    rows_to_add.append(row)
+            
+            if updates:
+                self.sheet.batch_update(updates)
+            if rows_to_add:
+                self.sheet.append_rows(rows_to_add)
+            
+            self.logger.info(f"Upserted people: {len(updates)} updated, {len(rows_to_add)} added")
+            return bool(updates or rows_to_add)
+            
+        except Exception as e:
+            self.logger.error(f"Error upserting people data to sheet: {str(e)}")
+            return False
+    
     def get_sheet_data(self):
         """Get all data from the current sheet"""
         try:
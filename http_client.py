@@ -0,0 +1,205 @@
+"""
+Shared HTTP transport for the Hunter.io, GMass and OpenAI clients
+"""
+import logging
+import math
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+import requests
+from requests.adapters import HTTPAdapter
+from config import Config
+from resilience import get_resilience, parse_retry_after
+
+try:
+    # Optional - only used when HTTP2_ENABLED is set and httpx[http2] is installed
+    import httpx
+except ImportError:
+    httpx = None
+
+
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+# Statuses where the server didn't act on the request, so even a POST is safe to resend
+UNPROCESSED_STATUSES = {429, 503}
+IDEMPOTENT_METHODS = {'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'}
+CONNECT_ERRORS = (requests.exceptions.ConnectTimeout,) + ((httpx.ConnectError, httpx.ConnectTimeout) if httpx else ())
+TRANSIENT_ERRORS = (requests.exceptions.ConnectionError, requests.exceptions.Timeout) + ((httpx.TransportError,) if httpx else ())
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a list of numbers (0 for an empty list)"""
+    if not values:
+        return 0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+class LatencyStats:
+    """Thread-safe per-service latency recorder"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._samples = {}
+
+    def record(self, service, seconds):
+        with self._lock:
+            self._samples.setdefault(service, []).append(seconds)
+
+    def summary(self, service=None):
+        """Return {service: {count, total, mean, p50, p95, max}} (or one service's stats)"""
+        with self._lock:
+            samples = {name: list(values) for name, values in self._samples.items()}
+
+        result = {}
+        for name, values in samples.items():
+            result[name] = {
+                'count': len(values),
+                'total': sum(values),
+                'mean': sum(values) / len(values) if values else 0,
+                'p50': percentile(values, 50),
+                'p95': percentile(values, 95),
+                'max': max(values) if values else 0
+            }
+
+        if service is not None:
+            return result.get(service, {'count': 0, 'total': 0, 'mean': 0, 'p50': 0, 'p95': 0, 'max': 0})
+        return result
+
+    def reset(self):
+        with self._lock:
+            self._samples = {}
+
+
+class HTTPTransport:
+    """Keep-alive connection pools per host with default timeouts, retries and latency recording
+
+    429/5xx responses and connection errors are retried with backoff per service (POSTs
+    only when the server can't have acted on them), behind that service's circuit breaker.
+    """
+
+    def __init__(self, connect_timeout=None, read_timeout=None, pool_maxsize=None, http2=None):
+        self.connect_timeout = connect_timeout if connect_timeout is not None else Config.HTTP_CONNECT_TIMEOUT
+        self.read_timeout = read_timeout if read_timeout is not None else Config.HTTP_READ_TIMEOUT
+        self.pool_maxsize = pool_maxsize or Config.HTTP_POOL_MAXSIZE
+        self.http2 = Config.HTTP2_ENABLED if http2 is None else http2
+        self.latency = LatencyStats()
+        self.resilience = get_resilience()
+        self._sessions = {}
+        self._lock = threading.Lock()
+        self.setup_logging()
+
+        if self.http2 and httpx is None:
+            self.logger.warning("HTTP2_ENABLED is set but httpx is not installed - falling back to HTTP/1.1")
+            self.http2 = False
+
+    def setup_logging(self):
+        logging.basicConfig(level=logging.INFO)
+        self.logger = logging.getLogger(__name__)
+
+    @property
+    def timeout(self):
+        return (self.connect_timeout, self.read_timeout)
+
+    def session_for(self, url):
+        """Return the pooled session for the URL's host, creating it on first use"""
+        host = urlsplit(url).netloc.lower()
+        session = self._sessions.get(host)
+        if session is not None:
+            return session
+
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = self._create_session()
+                self._sessions[host] = session
+                self.logger.debug(f"Created {'HTTP/2' if self.http2 else 'HTTP/1.1'} connection pool for {host}")
+        return session
+
+    def _create_session(self):
+        if self.http2:
+            return httpx.Client(
+                http2=True,
+                timeout=httpx.Timeout(self.read_timeout, connect=self.connect_timeout),
+                limits=httpx.Limits(max_connections=self.pool_maxsize, max_keepalive_connections=self.pool_maxsize)
+            )
+
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_maxsize)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def request(self, method, url, service=None, **kwargs):
+        """Send a request through the host's pool, recording latency under `service`"""
+        service = service or urlsplit(url).netloc
+        if not self.http2:
+            kwargs.setdefault('timeout', self.timeout)
+        else:
+            kwargs.pop('timeout', None)
+
+        session = self.session_for(url)
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+
+        def send():
+            with self.timed(service):
+                return session.request(method, url, **kwargs)
+
+        def classify(response, error):
+            if error is not None:
+                transient = isinstance(error, TRANSIENT_ERRORS)
+                return transient and (idempotent or isinstance(error, CONNECT_ERRORS)), transient or None, None
+            status = response.status_code
+            if status not in RETRYABLE_STATUSES:
+                # A rejected request says nothing about whether the service is healthy
+                return False, None if status >= 400 else False, None
+            retryable = idempotent or status in UNPROCESSED_STATUSES
+            # A 429 means we're going too fast, not that the service is down
+            return retryable, None if status == 429 else True, parse_retry_after(response.headers.get('Retry-After'))
+
+        return self.resilience.call(service, send, classify)
+
+    def get(self, url, service=None, **kwargs):
+        return self.request('GET', url, service=service, **kwargs)
+
+    def post(self, url, service=None, **kwargs):
+        return self.request('POST', url, service=service, **kwargs)
+
+    @contextmanager
+    def timed(self, service):
+        """Record the wall time of the enclosed call under `service`"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.latency.record(service, time.perf_counter() - start)
+
+    def log_latency_summary(self):
+        """Log per-service call latency (useful for comparing pooled vs. unpooled runs)"""
+        for service, stats in self.latency.summary().items():
+            self.logger.info(
+                f"{service}: {stats['count']} calls, mean {stats['mean'] * 1000:.0f}ms, "
+                f"p50 {stats['p50'] * 1000:.0f}ms, p95 {stats['p95'] * 1000:.0f}ms"
+            )
+        self.resilience.log_summary()
+
+    def close(self):
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions = {}
+
+
+_transport = None
+_transport_lock = threading.Lock()
+
+
+def get_transport():
+    """Process-wide transport shared by all API clients"""
+    global _transport
+    if _transport is None:
+        with _transport_lock:
+            if _transport is None:
+                _transport = HTTPTransport()
+    return _transport
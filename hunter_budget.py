@@ -0,0 +1,147 @@
+"""
+Hunter.io credit accounting and value-based lookup budgeting
+"""
+import logging
+import math
+import threading
+from config import Config
+from http_client import get_transport
+from title_relevance import get_title_matcher
+
+# Lookup priority tiers (lower runs first)
+PRIORITY_ALUMNI = 0
+PRIORITY_TITLE_MATCH = 1
+PRIORITY_OTHER = 2
+
+
+class HunterBudget:
+    """Tracks Hunter credits spent this run and decides who gets a lookup
+
+    Credits are reserved before each call and settled afterwards, because Hunter only
+    charges email-finder calls that return an email. The spendable amount is the smaller
+    of the per-run budget (HUNTER_RUN_CREDIT_BUDGET, 0 = unlimited) and what the account
+    endpoint reports as still available. Domain resolution isn't counted - it runs once
+    per company and is cached.
+    """
+
+    def __init__(self, api_key=None, run_budget=None):
+        self.api_key = api_key or Config.HUNTER_API_KEY
+        self.base_url = Config.HUNTER_BASE_URL
+        self.http = get_transport()
+        self._lock = threading.Lock()
+        self.setup_logging()
+        self.start_run(run_budget)
+
+    def setup_logging(self):
+        logging.basicConfig(level=logging.INFO)
+        self.logger = logging.getLogger(__name__)
+
+    def start_run(self, run_budget=None):
+        """Reset per-run counters (call once at the start of a workflow run)"""
+        with self._lock:
+            self.run_budget = Config.HUNTER_RUN_CREDIT_BUDGET if run_budget is None else run_budget
+            self.account_available = None
+            self.spent = 0.0
+            self.reserved = 0.0
+            self.skipped = 0
+            self.exhausted = False
+
+    def refresh_account_usage(self):
+        """Read remaining credits from Hunter's /account endpoint (free to call)"""
+        try:
+            response = self.http.get(f"{self.base_url}/account", params={'api_key': self.api_key}, service='hunter')
+            response.raise_for_status()
+
+            data = response.json().get('data') or {}
+            requests_info = data.get('requests') or {}
+            credits = requests_info.get('credits') or requests_info.get('searches') or {}
+            if 'available' in credits:
+                available = float(credits.get('available', 0)) - float(credits.get('used', 0))
+                with self._lock:
+                    # Stored gross of this run's spend so remaining() can subtract it like the run budget
+                    self.account_available = available + self.spent
+                self.logger.info(f"Hunter account: {available:g} credits remaining this period")
+            return self.account_available
+
+        except Exception as e:
+            self.logger.warning(f"Could not read Hunter account usage: {str(e)}")
+            return None
+
+    def remaining(self):
+        """Credits still spendable this run (None = unlimited)"""
+        limits = []
+        if self.run_budget:
+            limits.append(self.run_budget)
+        if self.account_available is not None:
+            limits.append(self.account_available)
+        if not limits:
+            return None
+        return min(limits) - self.spent - self.reserved
+
+    def try_reserve(self, cost):
+        """Reserve credits for a call; False (and the run is marked exhausted) if they don't fit"""
+        with self._lock:
+            # Once anyone has been skipped, lower-priority work mustn't squeeze into what's left
+            if self.exhausted:
+                self.skipped += 1
+                return False
+            remaining = self.remaining()
+            if remaining is not None and remaining < cost:
+                self.logger.warning(f"Hunter credit budget exhausted ({self.spent:g} spent) - skipping remaining lookups")
+                self.exhausted = True
+                self.skipped += 1
+                return False
+            self.reserved += cost
+            return True
+
+    def reserve_up_to(self, cost, unit):
+        """Reserve as many whole `unit`s of `cost` as fit; returns the amount reserved (may be 0)
+
+        For calls that can be shrunk to the budget, like domain-search pages. Unlike
+        try_reserve this never marks the run exhausted, so cheaper per-person lookups
+        still get whatever is left.
+        """
+        with self._lock:
+            if self.exhausted:
+                return 0
+            remaining = self.remaining()
+            if remaining is not None and remaining < cost:
+                cost = math.floor(remaining / unit) * unit if unit > 0 else 0
+            if cost <= 0:
+                return 0
+            self.reserved += cost
+            return cost
+
+    def settle(self, reserved, actual):
+        """Replace a reservation with the credits the call actually used"""
+        with self._lock:
+            self.reserved -= reserved
+            self.spent += actual
+
+    def finder_cost(self, email_result):
+        """Hunter charges email-finder calls only when an email comes back"""
+        return Config.HUNTER_FINDER_CREDIT_COST if email_result.get('status') == 'found' else 0
+
+    def priority(self, person):
+        """SCU alumni first, then people with relevant titles, then everyone else"""
+        if person.get('is_scu_alumni'):
+            return PRIORITY_ALUMNI
+        score = person.get('title_relevance')
+        if score is None:
+            score = get_title_matcher().score(person.get('title'))
+        if score >= Config.TITLE_RELEVANCE_MIN_SCORE:
+            return PRIORITY_TITLE_MATCH
+        return PRIORITY_OTHER
+
+    def prioritize(self, people):
+        """Stable sort of people by lookup priority"""
+        return sorted(people, key=self.priority)
+
+    def summary(self):
+        return {
+            'spent': self.spent,
+            'run_budget': self.run_budget,
+            'account_available': self.account_available,
+            'skipped': self.skipped,
+            'exhausted': self.exhausted
+        }
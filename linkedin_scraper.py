@@ -10,6 +10,9 @@ from webdriver_manager.chrome import ChromeDriverManager
 from bs4 import BeautifulSoup
 import logging
 from config import Config
+from profile_utils import canonicalize_profile_url, make_person_key
+from person import Person
+from title_relevance import TitleRelevanceMatcher
 
 class LinkedInScraper:
     def __init__(self):
@@ -122,7 +125,7 @@ class LinkedInScraper:
             return False
     
     def search_people_by_company(self, company_name, keywords=None):
-        """Search for people at a specific company"""
+        """Search for people at a specific company (only titles matching `keywords`, if given)"""
         try:
             self.logger.info(f"Searching for people at {company_name}")
             
@@ -181,6 +184,14 @@ class LinkedInScraper:
             for person in people_data:
                 person['company'] = company_name
                 person['is_scu_alumni'] = self._check_scu_alumni(person)
+                self._refresh_person_key(person)
+            
+            if keywords:
+                matcher = TitleRelevanceMatcher(keywords)
+                people_data = [
+                    person for person in people_data
+                    if person['is_scu_alumni'] or matcher.score_person(person) > 0
+                ]
             
             self.logger.info(f"Found {len(people_data)} people at {company_name}")
             return people_data
@@ -257,7 +268,7 @@ class LinkedInScraper:
                 try:
                     person_data = self._extract_person_data(card)
                     if person_data:
-                        people_data.append(person_data)
+                        people_data.append(Person.from_dict(person_data))
                 except Exception as e:
                     self.logger.warning(f"Error parsing person card: {str(e)}")
                     continue
@@ -324,7 +335,8 @@ class LinkedInScraper:
                             href = name_element.get('href', '')
                             if href and not href.startswith('http'):
                                 href = f"{Config.LINKEDIN_BASE_URL}{href}"
-                            person_data['profile_url'] = href
+                            # Canonicalize so /in/ slugs, miniProfileUrn links and tracking params agree
+                            person_data['profile_url'] = canonicalize_profile_url(href) or href
                             self.logger.debug(f"Found name with selector '{selector}': {name_text}")
                             break
             
@@ -451,6 +463,12 @@ class LinkedInScraper:
             if person_data.get('name'):
                 # Check if this person is an SCU alumni
                 person_data['is_scu_alumni'] = self._check_scu_alumni(person_data)
+                # Stable key used by caches, exports and the Sheets upsert
+                person_data['person_key'] = make_person_key(
+                    person_data.get('profile_url'),
+                    person_data.get('name'),
+                    person_data.get('company')
+                )
                 return person_data
                 
         except Exception as e:
@@ -458,6 +476,14 @@ class LinkedInScraper:
             
         return None
     
+    def _refresh_person_key(self, person_data):
+        """Recompute the person key once the search company is known (only changes URL-less keys)"""
+        person_data['person_key'] = make_person_key(
+            person_data.get('profile_url'),
+            person_data.get('name'),
+            person_data.get('company')
+        )
+    
     def _check_scu_alumni(self, person_data):
         """Check if the person is an SCU alumni based on their profile data"""
         try:
@@ -507,6 +533,7 @@ class LinkedInScraper:
             for person in people_data:
                 person['is_scu_alumni'] = True
                 person['company'] = 'Santa Clara University'  # Ensure company is set to SCU
+                self._refresh_person_key(person)
             
             self.logger.info(f"Found {len(people_data)} SCU alumni/faculty/students")
             return people_data
@@ -647,6 +674,7 @@ class LinkedInScraper:
                 for person in people_data:
                     person['is_scu_alumni'] = True
                     person['company'] = company_name
+                    self._refresh_person_key(person)
                 
                 self.logger.info(f"Found {len(people_data)} SCU alumni at {company_name}")
                 return people_data
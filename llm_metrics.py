@@ -0,0 +1,214 @@
+"""
+Token, cost and latency accounting for every OpenAI completion
+"""
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+from config import Config
+from http_client import percentile
+
+# Call outcomes
+OUTCOME_SUCCESS = 'success'
+OUTCOME_FALLBACK = 'fallback'
+OUTCOME_PARSE_FAILURE = 'parse_failure'
+OUTCOME_REJECTED = 'rejected'  # failed local validation and was regenerated or escalated
+OUTCOME_ERROR = 'error'
+
+# USD per 1K (prompt, completion) tokens; unknown models use OPENAI_PROMPT/COMPLETION_PRICE_PER_1K
+MODEL_PRICES = {
+    'gpt-3.5-turbo': (0.0005, 0.0015),
+    'gpt-4o-mini': (0.00015, 0.0006),
+    'gpt-4o': (0.0025, 0.01),
+    'gpt-4-turbo': (0.01, 0.03),
+    'gpt-4': (0.03, 0.06),
+}
+
+# Batch API jobs are billed at half the interactive price
+BATCH_JOB_PRICE_FACTOR = 0.5
+
+
+def estimate_cost(model, prompt_tokens, completion_tokens):
+    """Estimated USD for one completion"""
+    prompt_price, completion_price = MODEL_PRICES.get(
+        model, (Config.OPENAI_PROMPT_PRICE_PER_1K, Config.OPENAI_COMPLETION_PRICE_PER_1K)
+    )
+    return (prompt_tokens * prompt_price + completion_tokens * completion_price) / 1000
+
+
+class LLMCall:
+    """One completion being tracked; fields are filled in by the generator while it runs"""
+
+    __slots__ = ('purpose', 'company', 'model', 'prompt_tokens', 'completion_tokens',
+                 'latency', 'attempts', 'cached', 'outcome', 'error_outcome')
+
+    def __init__(self, purpose, company, error_outcome=OUTCOME_ERROR):
+        self.purpose = purpose
+        self.company = company
+        self.model = None
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.latency = 0.0
+        self.attempts = 0
+        # Answered from the completion cache, so nothing was spent
+        self.cached = False
+        self.outcome = OUTCOME_SUCCESS
+        self.error_outcome = error_outcome
+
+
+class LLMCallTracker:
+    """Context manager that records an LLMCall when the block exits"""
+
+    def __init__(self, metrics, call):
+        self.metrics = metrics
+        self.call = call
+
+    def __enter__(self):
+        return self.call
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self.call.outcome = self.call.error_outcome
+        self.metrics.record(self.call)
+        return False
+
+
+class LLMMetrics:
+    """Records each completion's tokens, model, latency and outcome to the llm_calls table
+
+    Rows are tagged with a run id so a workflow run can be summarised on its own:
+    tokens and estimated cost per company and per prompt purpose, latency
+    percentiles and how often the fallback message had to be used.
+    """
+
+    def __init__(self, db_path=None):
+        self.run_id = None
+        self._lock = threading.Lock()
+        self.setup_logging()
+        self._conn = sqlite3.connect(db_path or Config.CACHE_DB_PATH, check_same_thread=False)
+        self._create_table()
+        self.start_run()
+
+    def setup_logging(self):
+        logging.basicConfig(level=logging.INFO)
+        self.logger = logging.getLogger(__name__)
+
+    def _create_table(self):
+        with self._lock:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS llm_calls (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    run_id TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    purpose TEXT,
+                    company TEXT,
+                    model TEXT,
+                    prompt_tokens INTEGER NOT NULL,
+                    completion_tokens INTEGER NOT NULL,
+                    latency REAL NOT NULL,
+                    attempts INTEGER NOT NULL,
+                    cached INTEGER NOT NULL,
+                    outcome TEXT NOT NULL
+                )
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS llm_calls_run ON llm_calls (run_id)")
+            self._conn.commit()
+
+    def start_run(self):
+        """Start a new run id; later calls are summarised under it"""
+        self.run_id = f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
+        return self.run_id
+
+    def track(self, purpose, company=None, error_outcome=OUTCOME_ERROR):
+        """`with metrics.track('message', company) as call:` records the call on exit
+
+        If the block raises, the call is recorded with error_outcome.
+        """
+        return LLMCallTracker(self, LLMCall(purpose, company, error_outcome))
+
+    def record(self, call):
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO llm_calls (run_id, created_at, purpose, company, model, prompt_tokens, "
+                "completion_tokens, latency, attempts, cached, outcome) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (self.run_id, time.time(), call.purpose, call.company, call.model, call.prompt_tokens,
+                 call.completion_tokens, call.latency, call.attempts, int(call.cached), call.outcome)
+            )
+            self._conn.commit()
+
+    def run_summary(self, run_id=None):
+        """Totals for one run (the current one by default)"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT purpose, company, model, prompt_tokens, completion_tokens, latency, cached, outcome "
+                "FROM llm_calls WHERE run_id = ?",
+                (run_id or self.run_id,)
+            ).fetchall()
+
+        summary = {
+            'run_id': run_id or self.run_id,
+            'calls': len(rows),
+            'cached': 0,
+            'prompt_tokens': 0,
+            'completion_tokens': 0,
+            'cost': 0.0,
+            'outcomes': {},
+            'by_company': {},
+            'by_purpose': {},
+        }
+        latencies = []
+        messages = fallbacks = 0
+        for purpose, company, model, prompt_tokens, completion_tokens, latency, cached, outcome in rows:
+            summary['outcomes'][outcome] = summary['outcomes'].get(outcome, 0) + 1
+            # Rejected/unparseable drafts were retried, so only a person's final row counts
+            if purpose == 'message' and outcome in (OUTCOME_SUCCESS, OUTCOME_FALLBACK):
+                messages += 1
+                fallbacks += outcome == OUTCOME_FALLBACK
+            if cached:
+                summary['cached'] += 1
+                continue
+            cost = estimate_cost(model, prompt_tokens, completion_tokens)
+            if purpose == 'batch_job':
+                # Batch turnaround isn't request latency
+                cost *= BATCH_JOB_PRICE_FACTOR
+            else:
+                latencies.append(latency)
+            summary['prompt_tokens'] += prompt_tokens
+            summary['completion_tokens'] += completion_tokens
+            summary['cost'] += cost
+            for group, key in (('by_company', company or 'Unknown'), ('by_purpose', purpose)):
+                totals = summary[group].setdefault(key, {'calls': 0, 'tokens': 0, 'cost': 0.0})
+                totals['calls'] += 1
+                totals['tokens'] += prompt_tokens + completion_tokens
+                totals['cost'] += cost
+
+        summary['latency_p50'] = percentile(latencies, 50)
+        summary['latency_p95'] = percentile(latencies, 95)
+        summary['fallback_rate'] = fallbacks / messages if messages else 0.0
+        return summary
+
+    def format_summary(self, summary=None):
+        """Human-readable run summary"""
+        summary = summary or self.run_summary()
+        lines = [
+            f"LLM calls: {summary['calls']} ({summary['cached']} from cache; "
+            f"{', '.join(f'{count} {outcome}' for outcome, count in sorted(summary['outcomes'].items())) or 'none'})",
+            f"Tokens: {summary['prompt_tokens']} prompt + {summary['completion_tokens']} completion, "
+            f"estimated ${summary['cost']:.4f}",
+            f"Latency: p50 {summary['latency_p50']:.2f}s, p95 {summary['latency_p95']:.2f}s",
+            f"Fallback messages: {summary['fallback_rate']:.1%}",
+        ]
+        for title, group in (('By prompt', 'by_purpose'), ('By company', 'by_company')):
+            if summary[group]:
+                lines.append(f"{title}:")
+            for key, totals in sorted(summary[group].items(), key=lambda item: -item[1]['cost']):
+                lines.append(f"  {key}: {totals['calls']} calls, {totals['tokens']} tokens, ${totals['cost']:.4f}")
+        return '\n'.join(lines)
+
+    def log_summary(self):
+        self.logger.info(f"LLM usage for run {self.run_id}:\n{self.format_summary()}")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
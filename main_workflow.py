@@ -6,6 +6,9 @@ from google_sheets_manager import GoogleSheetsManager
 from gmass_integration import GMassIntegration
 from ai_message_generator import AIMessageGenerator
 from config import Config
+from title_relevance import get_title_matcher
+from person_dedupe import PersonDeduper
+from person import company_registry
 
 class LinkedInOutreachWorkflow:
     def __init__(self):
@@ -15,6 +18,8 @@ class LinkedInOutreachWorkflow:
         self.sheets_manager = GoogleSheetsManager()
         self.gmass_integration = GMassIntegration()
         self.ai_generator = AIMessageGenerator()
+        self.title_matcher = get_title_matcher()
+        self.person_deduper = PersonDeduper()
         
     def setup_logging(self):
         logging.basicConfig(level=logging.INFO)
@@ -24,6 +29,12 @@ class LinkedInOutreachWorkflow:
         """Run the complete outreach workflow"""
         try:
             self.logger.info("Starting LinkedIn Outreach Workflow")
+            # Each run resolves domains and overviews afresh (cached lookups are still reused)
+            company_registry.clear()
+            self.ai_generator.start_run()
+            # Company overviews load in the background while the browser starts and logs in
+            if Config.COMPANY_INFO_PREFETCH:
+                self.ai_generator.prefetch_company_info(companies)
             
             # Step 1: Setup LinkedIn scraper and login
             self.logger.info("Step 1: Setting up LinkedIn scraper...")
@@ -45,7 +56,9 @@ class LinkedInOutreachWorkflow:
                     self.logger.error("Failed to connect to Google Sheet. Exiting workflow.")
                     return False
             
-            # Step 3: Process each company
+            # Step 3: Find people at every company
+            self.email_finder.budget.start_run()
+            self.person_deduper.start_run()
             all_people_data = []
             
             for company in companies:
@@ -53,26 +66,36 @@ class LinkedInOutreachWorkflow:
                 
                 # Search for people at the company
                 people_data = self.linkedin_scraper.search_people_by_company(company)
+                # People already found (under another spelling or company) skip Hunter and OpenAI
+                people_data = self.person_deduper.apply(people_data)
+                # Recruiters, sales etc. are dropped or moved to the back before the paid stages
+                people_data = self.title_matcher.apply(people_data)
                 
                 if people_data:
-                    # Find emails for the people
-                    people_with_emails = self.email_finder.find_emails_for_people(people_data)
-                    
-                    # Generate personalized messages
-                    people_with_messages = self.ai_generator.generate_bulk_messages(people_with_emails)
-                    
-                    all_people_data.extend(people_with_messages)
-                    
-                    # Add to Google Sheets
-                    self.sheets_manager.add_people_data(people_with_messages)
-                    
-                    self.logger.info(f"Processed {len(people_with_messages)} people from {company}")
+                    all_people_data.extend(people_data)
+                    # Saved as each company finishes so an interrupted run keeps what it scraped
+                    self.sheets_manager.upsert_people_data(people_data)
+                    self.logger.info(f"Found {len(people_data)} people at {company}")
                 else:
                     self.logger.warning(f"No people found for company: {company}")
                 
                 # Add delay between companies to avoid rate limiting
                 time.sleep(5)
             
+            # Emails and messages run once for the whole run, so Hunter credits go to
+            # alumni at every company before anyone else and batch jobs cover every company
+            if all_people_data:
+                people_with_emails = self.email_finder.find_emails_for_people(all_people_data)
+                if Config.HUNTER_VERIFY_EMAILS:
+                    people_with_emails = self.email_finder.verify_emails_for_people(people_with_emails)
+                
+                # Generate personalized messages
+                all_people_data = self.ai_generator.generate_bulk_messages(people_with_emails)
+                
+                # Refresh the same rows (matched on Person Key) with the enriched records
+                self.sheets_manager.upsert_people_data(all_people_data)
+                self.logger.info(f"Processed {len(all_people_data)} people from {len(companies)} companies")
+            
             # Step 4: Create GMass campaigns
             self.logger.info("Step 4: Creating GMass campaigns...")
             self._create_gmass_campaigns(all_people_data)
@@ -138,6 +161,7 @@ class LinkedInOutreachWorkflow:
             scu_alumni = len([p for p in people_data if p.get('is_scu_alumni', False)])
             
             companies = list(set([p.get('company', 'Unknown') for p in people_data]))
+            llm_usage = self.ai_generator.metrics.format_summary().replace('\n', '\n            ')
             
             report = f"""
             LinkedIn Outreach Workflow Summary
@@ -151,8 +175,12 @@ class LinkedInOutreachWorkflow:
             Companies Processed: {len(companies)}
             {', '.join(companies)}
             
+            {self.person_deduper.format_summary()}
+            
             Google Sheet URL: {self.sheets_manager.get_sheet_url()}
             
+            {llm_usage}
+            
             Next Steps:
             1. Review the Google Sheet for accuracy
             2. Test the GMass campaigns with a small group
@@ -173,6 +201,10 @@ class LinkedInOutreachWorkflow:
         """Run workflow for a single company"""
         try:
             self.logger.info(f"Running workflow for company: {company_name}")
+            company_registry.clear()
+            self.ai_generator.start_run()
+            if Config.COMPANY_INFO_PREFETCH:
+                self.ai_generator.prefetch_company_info([company_name])
             
             # Setup LinkedIn scraper
             self.linkedin_scraper.setup_driver()
@@ -187,11 +219,15 @@ class LinkedInOutreachWorkflow:
                 self.logger.warning(f"No people found for {company_name}")
                 return False
             
-            # Limit to max_people
-            people_data = people_data[:max_people]
+            # Limit to max_people, most relevant titles first
+            self.person_deduper.start_run()
+            people_data = self.title_matcher.apply(self.person_deduper.apply(people_data))[:max_people]
+            self.email_finder.budget.start_run()
             
             # Find emails
             people_with_emails = self.email_finder.find_emails_for_people(people_data)
+            if Config.HUNTER_VERIFY_EMAILS:
+                people_with_emails = self.email_finder.verify_emails_for_people(people_with_emails)
             
             # Generate messages
             people_with_messages = self.ai_generator.generate_bulk_messages(people_with_emails)
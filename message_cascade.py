@@ -0,0 +1,126 @@
+"""
+Local validation of generated messages and per-tier stats for the model cascade
+"""
+import re
+import threading
+from http_client import percentile
+
+# Lines every message body must end with
+SIGNATURE_LINES = ('Best regards,', 'Abhinav Ala', '(469)-381-4729', 'aala@scu.edu')
+COMPANY_SUFFIX_RE = re.compile(r'[,.]?\s+(inc|llc|ltd|corp|corporation|co|company|plc|gmbh)\.?$', re.IGNORECASE)
+PARENTHETICAL_RE = re.compile(r'\(([^)]*)\)')
+COMPANY_WORD_RE = re.compile(r"[a-z0-9][a-z0-9&'.-]*")
+COMPANY_STOPWORDS = {'the', 'a', 'an', 'of', 'and'}
+
+# Cascade tiers
+TIER_DRAFT = 'draft'
+TIER_REGENERATE = 'regenerate'
+TIER_ESCALATION = 'escalation'
+
+
+def _strip_suffixes(name):
+    name = ' '.join((name or '').split())
+    while True:
+        stripped = COMPANY_SUFFIX_RE.sub('', name)
+        if stripped == name:
+            return name.lower()
+        name = stripped
+
+
+def company_mentions(company_name):
+    """Names a message may use for a company: the name without legal suffixes, any
+    parenthesized short name and the first significant word
+
+    "Alphabet Inc. (Google)" -> ('alphabet', 'google'); "Meta Platforms" -> ('meta platforms', 'meta')
+    """
+    name = company_name or ''
+    base = _strip_suffixes(PARENTHETICAL_RE.sub(' ', name))
+    mentions = []
+    for alias in [base] + [_strip_suffixes(short) for short in PARENTHETICAL_RE.findall(name)]:
+        if alias and alias not in mentions:
+            mentions.append(alias)
+    words = [word for word in COMPANY_WORD_RE.findall(base) if word not in COMPANY_STOPWORDS]
+    if words and len(words[0]) > 1 and words[0] not in mentions:
+        mentions.append(words[0])
+    return tuple(mentions)
+
+
+def mentions_company(text, company_name):
+    """Whether text names the company by any of its mentions (whole words only)"""
+    text = (text or '').lower()
+    return any(
+        re.search(rf"(?<![a-z0-9]){re.escape(mention)}(?![a-z0-9])", text)
+        for mention in company_mentions(company_name)
+    )
+
+
+def validate_message(subject, body, company_name=None, max_words=200):
+    """Problems that disqualify a draft (an empty list means it can be sent)"""
+    problems = []
+    if not (subject or '').strip():
+        problems.append('missing subject')
+    words = len((body or '').split())
+    if words > max_words:
+        problems.append(f'{words} words')
+    lines = {line.strip() for line in (body or '').splitlines()}
+    missing = [line for line in SIGNATURE_LINES if line not in lines]
+    if missing:
+        problems.append(f"missing signature: {' | '.join(missing)}")
+    if company_mentions(company_name) and not mentions_company(f"{subject}\n{body}", company_name):
+        problems.append(f'no mention of {company_name}')
+    return problems
+
+
+class CascadeStats:
+    """Thread-safe per-tier call counts, pass rates and latencies"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.tiers = {}
+            self.messages = 0
+            self.escalated = 0
+
+    def record(self, tier, model, latency, passed):
+        with self._lock:
+            stats = self.tiers.setdefault(tier, {'model': model, 'calls': 0, 'passed': 0, 'latencies': []})
+            stats['calls'] += 1
+            stats['passed'] += passed
+            stats['latencies'].append(latency)
+            if tier == TIER_DRAFT:
+                self.messages += 1
+            elif tier == TIER_ESCALATION:
+                self.escalated += 1
+
+    def summary(self):
+        with self._lock:
+            tiers = {
+                tier: {
+                    'model': stats['model'],
+                    'calls': stats['calls'],
+                    'pass_rate': stats['passed'] / stats['calls'],
+                    'latency_p50': percentile(stats['latencies'], 50),
+                    'latency_p95': percentile(stats['latencies'], 95)
+                }
+                for tier, stats in self.tiers.items()
+            }
+            return {
+                'messages': self.messages,
+                'escalation_rate': self.escalated / self.messages if self.messages else 0.0,
+                'tiers': tiers
+            }
+
+    def format_summary(self):
+        summary = self.summary()
+        lines = [f"Message cascade: {summary['messages']} drafts, {summary['escalation_rate']:.1%} escalated"]
+        for tier in (TIER_DRAFT, TIER_REGENERATE, TIER_ESCALATION):
+            stats = summary['tiers'].get(tier)
+            if stats:
+                lines.append(
+                    f"  {tier} ({stats['model']}): {stats['calls']} calls, {stats['pass_rate']:.1%} passed, "
+                    f"p50 {stats['latency_p50']:.2f}s, p95 {stats['latency_p95']:.2f}s"
+                )
+        return '\n'.join(lines)
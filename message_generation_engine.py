@@ -0,0 +1,201 @@
+"""
+Async concurrent outreach message generation with bounded parallelism
+"""
+import asyncio
+import logging
+import time
+from config import Config
+from http_client import percentile
+from person import Person
+from async_utils import run_sync
+from batch_job import MessageBatchJob
+
+
+class MessageGenerationEngine:
+    """Generates messages for many people concurrently, returning them in input order
+
+    At most `concurrency` completions are in flight at once. Request and token pacing is
+    done by AIMessageGenerator's OpenAI limiters (OPENAI_REQUESTS_PER_MINUTE and
+    OPENAI_TOKENS_PER_MINUTE), so every completion shares the same budget. Each
+    distinct company's overview is fetched once, before the per-person messages.
+
+    With MESSAGE_BATCH_JOB_MODE, messages are first generated offline through the OpenAI
+    Batch API. With MESSAGE_TEMPLATE_MODE, each company and alumni status gets one AI
+    template that is rendered locally per person. With MESSAGE_BATCH_MODE, people at the
+    same company are packed into batched requests. Anyone those modes can't serve gets
+    the normal per-person prompt.
+    """
+
+    def __init__(self, ai_generator, concurrency=None, on_event=None):
+        self.ai_generator = ai_generator
+        self.concurrency = concurrency or Config.OPENAI_CONCURRENCY
+        # on_event(person, text, done): per-person messages stream their text, then done=True
+        self.on_event = on_event
+        self.latencies = []
+        # Overviews by company name, including placeholders that are kept off the shared company record
+        self.company_info = {}
+        self.setup_logging()
+
+    def setup_logging(self):
+        logging.basicConfig(level=logging.INFO)
+        self.logger = logging.getLogger(__name__)
+
+    def run(self, people_data):
+        """Synchronous entry point"""
+        return run_sync(self.generate_all(people_data))
+
+    async def generate_all(self, people_data):
+        """Generate a message for every person; returns Person records in the same order"""
+        people = [Person.from_dict(person) for person in people_data]
+        if not people:
+            return []
+
+        start = time.perf_counter()
+        semaphore = asyncio.Semaphore(self.concurrency)
+        await self._load_company_info(people, semaphore)
+
+        pending = people
+        if Config.MESSAGE_BATCH_JOB_MODE:
+            pending = self._emit_served(pending, await asyncio.to_thread(MessageBatchJob(self.ai_generator).run, pending))
+        if Config.MESSAGE_TEMPLATE_MODE and pending:
+            pending = self._emit_served(pending, await self._render_templates(pending, semaphore))
+        if Config.MESSAGE_BATCH_MODE and pending:
+            pending = self._emit_served(pending, await self._generate_batches(pending, semaphore))
+        await asyncio.gather(*(self._generate_person(person, semaphore) for person in pending))
+
+        elapsed = time.perf_counter() - start
+        self.logger.info(f"Generated {len(people)} messages in {elapsed:.1f}s (concurrency {self.concurrency})")
+        if self.latencies:
+            self.logger.info(
+                f"Completion latency: p50 {percentile(self.latencies, 50):.2f}s, "
+                f"p95 {percentile(self.latencies, 95):.2f}s, max {max(self.latencies):.2f}s"
+            )
+        return people
+
+    def _emit(self, person, text, done=False):
+        if self.on_event is not None:
+            self.on_event(person, text, done)
+
+    def _emit_served(self, before, pending):
+        """Report everyone a stage served as done; returns the people still pending"""
+        if self.on_event is not None:
+            pending_ids = {id(person) for person in pending}
+            for person in before:
+                if id(person) not in pending_ids:
+                    self._emit(person, person.get('message_body', ''), True)
+        return pending
+
+    async def _load_company_info(self, people, semaphore):
+        """Fetch each distinct company's overview once and store it on the shared company record"""
+        companies = {}
+        for person in people:
+            if not person.get('company_info'):
+                companies.setdefault(person.get('company', 'this company'), []).append(person)
+
+        async def load(company_name, company_people):
+            async with semaphore:
+                info = await asyncio.to_thread(self.ai_generator.get_company_info, company_name)
+            self.company_info[company_name] = info
+            if self.ai_generator.company_info_cache.failed(company_name):
+                return
+            for person in company_people:
+                person['company_info'] = info
+
+        await asyncio.gather(*(load(name, group) for name, group in companies.items()))
+
+    def _company_info(self, person):
+        return person.get('company_info') or self.company_info.get(person.get('company', 'this company'))
+
+    async def _render_templates(self, people, semaphore):
+        """Render messages from per-company templates; returns the people still needing one"""
+        groups = {}
+        for person in people:
+            is_scu_alumni = self.ai_generator.check_if_scu_alumni(person)
+            groups.setdefault((person.get('company', 'this company'), is_scu_alumni), []).append(person)
+
+        async def load(company_name, is_scu_alumni, group):
+            async with semaphore:
+                return await asyncio.to_thread(
+                    self.ai_generator.get_message_template, company_name, is_scu_alumni, self._company_info(group[0])
+                )
+
+        templates = await asyncio.gather(*(load(name, alumni, group) for (name, alumni), group in groups.items()))
+
+        pending = []
+        rendered = 0
+        start = time.perf_counter()
+        for ((_, is_scu_alumni), group), template in zip(groups.items(), templates):
+            if template is None:
+                pending.extend(group)
+                continue
+            for person in group:
+                subject, body = template.render(person)
+                self.ai_generator.apply_message(person, {
+                    'subject': subject,
+                    'body': body,
+                    'is_scu_alumni': is_scu_alumni,
+                    'company_info': self._company_info(person)
+                })
+                rendered += 1
+        render_seconds = time.perf_counter() - start
+
+        if rendered:
+            self.logger.info(
+                f"Template mode: rendered {rendered} messages from {sum(1 for t in templates if t)} templates "
+                f"({render_seconds / rendered * 1e6:.0f}us per message)"
+            )
+        # Keep input order for the fallback paths
+        pending_ids = {id(person) for person in pending}
+        return [person for person in people if id(person) in pending_ids]
+
+    async def _generate_batches(self, people, semaphore):
+        """Generate messages in per-company batches; returns the people still needing one"""
+        by_company = {}
+        for person in people:
+            by_company.setdefault(person.get('company', 'this company'), []).append(person)
+
+        batches = []
+        for company_people in by_company.values():
+            size = self.ai_generator.batch_size_for(self._company_info(company_people[0]), company_people[0].get('company'))
+            batches.extend(company_people[i:i + size] for i in range(0, len(company_people), size))
+
+        pending = []
+
+        async def generate(batch):
+            async with semaphore:
+                start = time.perf_counter()
+                results = await asyncio.to_thread(
+                    self.ai_generator.generate_batch_messages, batch, self._company_info(batch[0])
+                )
+                elapsed = time.perf_counter() - start
+            for person, message_data in zip(batch, results):
+                if message_data is None:
+                    pending.append(person)
+                    continue
+                self.ai_generator.apply_message(person, message_data)
+                self.latencies.append(elapsed)
+
+        # Single-person "batches" gain nothing over the normal prompt
+        await asyncio.gather(*(generate(batch) for batch in batches if len(batch) > 1))
+        pending.extend(person for batch in batches if len(batch) == 1 for person in batch)
+
+        batched = sum(len(batch) for batch in batches if len(batch) > 1)
+        self.logger.info(
+            f"Batch mode: {batched} people in {sum(1 for batch in batches if len(batch) > 1)} requests, "
+            f"{len(pending)} generated individually"
+        )
+        return pending
+
+    async def _generate_person(self, person, semaphore):
+        async with semaphore:
+            start = time.perf_counter()
+            on_token = (lambda text: self._emit(person, text)) if self.on_event is not None else None
+            try:
+                message_data = await asyncio.to_thread(
+                    self.ai_generator.generate_personalized_message, person, self._company_info(person), on_token
+                )
+                self.ai_generator.apply_message(person, message_data)
+            except Exception as e:
+                self.ai_generator.apply_failed_message(person, e)
+            self.latencies.append(time.perf_counter() - start)
+        self._emit(person, person.get('message_body', ''), True)
@@ -0,0 +1,55 @@
+"""
+Precompiled outreach message templates with per-person slots
+"""
+import re
+from message_cascade import validate_message
+
+# Slots the model may use; anything else in braces is kept as literal text
+TEMPLATE_SLOTS = ('first_name', 'title', 'company')
+SLOT_RE = re.compile(r'\{(' + '|'.join(TEMPLATE_SLOTS) + r')\}')
+
+
+def compile_template(text):
+    """Split text into (literal, slot) pairs once so rendering is just a join"""
+    parts = []
+    position = 0
+    for match in SLOT_RE.finditer(text):
+        parts.append((text[position:match.start()], match.group(1)))
+        position = match.end()
+    parts.append((text[position:], None))
+    return tuple(parts)
+
+
+def render_compiled(parts, values):
+    return ''.join(literal + (values.get(slot) or '' if slot else '') for literal, slot in parts)
+
+
+class MessageTemplate:
+    """A company-level subject and body with {first_name}/{title}/{company} slots"""
+
+    __slots__ = ('subject', 'body', 'slots', '_subject_parts', '_body_parts')
+
+    def __init__(self, subject, body):
+        self.subject = subject
+        self.body = body
+        self.slots = set(SLOT_RE.findall(subject)) | set(SLOT_RE.findall(body))
+        self._subject_parts = compile_template(subject)
+        self._body_parts = compile_template(body)
+
+    def problems(self, company_name=None, max_words=200):
+        """Why the template can't be used: no name slot, or a rendered sample fails the draft checks"""
+        problems = [] if '{first_name}' in self.body else ['no {first_name} slot']
+        subject, body = self.render({'first_name': 'Alexandra', 'title': 'Senior Software Engineer', 'company': company_name})
+        return problems + validate_message(subject, body, company_name, max_words)
+
+    def is_valid(self, company_name=None, max_words=200):
+        return not self.problems(company_name, max_words)
+
+    def render(self, person):
+        """(subject, body) for one person"""
+        values = {
+            'first_name': person.get('first_name') or 'there',
+            'title': person.get('title') or 'professional',
+            'company': person.get('company') or 'your company'
+        }
+        return render_compiled(self._subject_parts, values), render_compiled(self._body_parts, values)
@@ -0,0 +1,590 @@
+"""
+Local stand-in for the Hunter.io, GMass and OpenAI APIs, for offline load tests and benchmarks
+
+Run `python mock_servers.py` and set USE_MOCK_SERVERS=true (and MOCK_SERVER_URL if you
+change the port) to point every client at it. Each service answers under its own path
+prefix (/hunter/v2, /gmass/api, /openai/v1) with configurable latency, error rate and
+rate limit, and responses are deterministic so repeated runs hit the same emails.
+"""
+import argparse
+import hashlib
+import json
+import logging
+import math
+import random
+import re
+import threading
+import time
+import uuid
+from email.parser import BytesParser
+from email.policy import HTTP
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+from email_patterns import render_pattern
+from rate_limiter import TokenBucket
+
+MOCK_FIRST_NAMES = (
+    'James', 'Mary', 'Robert', 'Patricia', 'John', 'Jennifer', 'Michael', 'Linda', 'David', 'Elizabeth',
+    'William', 'Barbara', 'Richard', 'Susan', 'Joseph', 'Jessica', 'Thomas', 'Sarah', 'Priya', 'Wei'
+)
+MOCK_LAST_NAMES = (
+    'Smith', 'Johnson', 'Williams', 'Brown', 'Jones', 'Garcia', 'Miller', 'Davis', 'Rodriguez', 'Martinez',
+    'Hernandez', 'Lopez', 'Gonzalez', 'Wilson', 'Anderson', 'Thomas', 'Taylor', 'Moore', 'Patel', 'Chen'
+)
+MOCK_DOMAIN_PATTERNS = ('{first}.{last}', '{f}{last}', '{first}', '{first}{l}')
+
+# Per-service defaults: mean latency, share of requests failing with a 5xx, requests per second
+DEFAULT_SERVICE_SETTINGS = {
+    'hunter': {'latency_ms': 150, 'error_rate': 0.0, 'rate_limit': 15},
+    'gmass': {'latency_ms': 100, 'error_rate': 0.0, 'rate_limit': 10},
+    'openai': {'latency_ms': 800, 'error_rate': 0.0, 'rate_limit': 50, 'token_ms': 10}
+}
+
+BATCH_RECIPIENTS_RE = re.compile(r'Recipients \(JSON\):\s*(?P<recipients>\[.*?\])\s*\n')
+BATCH_COMPANY_RE = re.compile(r'They all work at (?P<company>.+?)\.\s')
+TEMPLATE_PROMPT_RE = re.compile(r'template to people who work at (?P<company>.+?)\.\s')
+PERSON_PROMPT_RE = re.compile(r'message to (?P<name>.+?), who works as an? (?P<title>.+?) at (?P<company>.+?)\.\s')
+
+
+def stable_hash(*parts):
+    """Deterministic integer from strings (Python's hash() is salted per process)"""
+    digest = hashlib.sha1('|'.join(str(part).lower() for part in parts).encode('utf-8')).hexdigest()
+    return int(digest[:12], 16)
+
+
+def mock_domain_pattern(domain):
+    return MOCK_DOMAIN_PATTERNS[stable_hash('pattern', domain) % len(MOCK_DOMAIN_PATTERNS)]
+
+
+def estimate_tokens(text):
+    """Rough OpenAI token count (~4 characters per token)"""
+    return max(1, len(text or '') // 4)
+
+
+class MockState:
+    """Settings, rate limit buckets and counters shared by all handler threads"""
+
+    def __init__(self, services=None, found_rate=0.8, monthly_credits=10000, roster_size=200, seed=None,
+                 invalid_rate=0.0, invalid_models=('gpt-4o-mini', 'gpt-3.5-turbo'), batch_seconds=2.0):
+        self.services = {name: dict(settings) for name, settings in DEFAULT_SERVICE_SETTINGS.items()}
+        for name, settings in (services or {}).items():
+            self.services.setdefault(name, {}).update(settings)
+        self.found_rate = found_rate
+        self.monthly_credits = monthly_credits
+        self.roster_size = roster_size
+        # Share of messages from the cheap models that come back without the signature
+        self.invalid_rate = invalid_rate
+        self.invalid_models = invalid_models
+        self.random = random.Random(seed)
+        self.credits_used = 0
+        self.requests = {}
+        self.errors = {}
+        self.throttled = {}
+        self.campaigns = {}
+        # OpenAI batch jobs: uploaded/output files and batches, finished batch_seconds after creation
+        self.files = {}
+        self.batches = {}
+        self.batch_seconds = batch_seconds
+        self._buckets = {
+            name: TokenBucket(settings['rate_limit'], 1, name=f"mock {name}")
+            for name, settings in self.services.items() if settings.get('rate_limit')
+        }
+        self._lock = threading.Lock()
+
+    def _count(self, counter, key):
+        counter[key] = counter.get(key, 0) + 1
+
+    def admit(self, service, route):
+        """Apply latency, rate limit and error injection; returns (status, headers) to fail with or None"""
+        settings = self.services.get(service, {})
+        with self._lock:
+            self._count(self.requests, route)
+            bucket = self._buckets.get(service)
+            wait = bucket.wait_time() if bucket else 0
+            if wait > 0:
+                self._count(self.throttled, route)
+                return 429, {'Retry-After': str(max(1, math.ceil(wait)))}
+            if bucket:
+                bucket.take()
+            latency = settings.get('latency_ms', 0) / 1000.0 * self.random.uniform(0.5, 1.5)
+            failed = self.random.random() < settings.get('error_rate', 0)
+
+        time.sleep(latency)
+        if failed:
+            with self._lock:
+                self._count(self.errors, route)
+            return 503, {}
+        return None
+
+    def charge(self, credits):
+        with self._lock:
+            self.credits_used += credits
+
+    def roster(self, domain):
+        """Deterministic employee list for a domain"""
+        people = []
+        for i in range(self.roster_size):
+            first = MOCK_FIRST_NAMES[stable_hash(domain, 'first', i) % len(MOCK_FIRST_NAMES)]
+            last = MOCK_LAST_NAMES[stable_hash(domain, 'last', i) % len(MOCK_LAST_NAMES)]
+            people.append((first, last))
+        return people
+
+    def summary(self):
+        with self._lock:
+            return {
+                'requests': dict(self.requests),
+                'errors': dict(self.errors),
+                'throttled': dict(self.throttled),
+                'credits_used': self.credits_used
+            }
+
+
+class MockAPIHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        logging.getLogger(__name__).debug(format % args)
+
+    @property
+    def state(self):
+        return self.server.state
+
+    def do_GET(self):
+        self._dispatch('GET')
+
+    def do_POST(self):
+        self._dispatch('POST')
+
+    def _dispatch(self, method):
+        parts = urlsplit(self.path)
+        self.query = {key: values[0] for key, values in parse_qs(parts.query).items()}
+        length = int(self.headers.get('Content-Length') or 0)
+        raw_body = self.rfile.read(length) if length else b''
+        self.raw_body = raw_body
+        try:
+            self.body = json.loads(raw_body) if raw_body else {}
+        except ValueError:
+            self.body = {}
+
+        path = parts.path.rstrip('/')
+        service = path.split('/')[1] if path.count('/') >= 1 else ''
+        route = re.sub(r'/[0-9a-f-]{8,}', '/{id}', path)
+        handler = ROUTES.get((method, route))
+        if handler is None:
+            return self._send(404, {'error': f"No mock for {method} {path}"})
+
+        rejection = self.state.admit(service, route)
+        if rejection is not None:
+            status, headers = rejection
+            return self._send(status, {'error': 'rate limited' if status == 429 else 'service unavailable'}, headers)
+
+        result = handler(self, path)
+        # Streaming handlers write their own response and return None
+        if result is not None:
+            self._send(*result)
+
+    def _send(self, status, payload, headers=None):
+        # bytes payloads (file downloads) are sent as they are
+        raw = isinstance(payload, bytes)
+        body = payload if raw else json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/octet-stream' if raw else 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    # Hunter.io
+
+    def hunter_email_finder(self, path):
+        first, last, domain = self.query.get('first_name', ''), self.query.get('last_name', ''), self.query.get('domain', '')
+        found = domain and (stable_hash(first, last, domain) % 1000) < self.state.found_rate * 1000
+        email = render_pattern(mock_domain_pattern(domain), first, last, domain) if found else None
+        if not email:
+            return 200, {'data': {'email': None, 'score': 0, 'sources': []}}
+        self.state.charge(1)
+        return 200, {'data': {'email': email, 'score': 70 + stable_hash(email) % 30, 'sources': []}}
+
+    def hunter_email_verifier(self, path):
+        email = self.query.get('email', '')
+        self.state.charge(0.5)
+        roll = stable_hash('verify', email) % 10
+        result = 'deliverable' if roll < 7 else ('risky' if roll < 9 else 'undeliverable')
+        return 200, {'data': {
+            'email': email, 'result': result, 'status': 'valid' if result == 'deliverable' else 'accept_all',
+            'score': 90 if result == 'deliverable' else 50, 'sources': [], 'smtp_server': True, 'smtp_check': result != 'undeliverable'
+        }}
+
+    def hunter_domain_search(self, path):
+        domain = self.query.get('domain')
+        if not domain:
+            company = self.query.get('company', '')
+            domain = re.sub(r'[^a-z0-9]', '', company.lower()) + '.com' if company else None
+            return 200, {'data': {'domain': domain, 'organization': company, 'emails': []}}
+
+        limit = int(self.query.get('limit', 10))
+        offset = int(self.query.get('offset', 0))
+        pattern = mock_domain_pattern(domain)
+        roster = self.state.roster(domain)
+        emails = [
+            {'value': render_pattern(pattern, first, last, domain), 'first_name': first, 'last_name': last, 'confidence': 90}
+            for first, last in roster[offset:offset + limit]
+        ]
+        self.state.charge(math.ceil(len(emails) / 10))
+        return 200, {'data': {'domain': domain, 'pattern': pattern, 'emails': emails}, 'meta': {'results': len(roster)}}
+
+    def hunter_account(self, path):
+        return 200, {'data': {'requests': {'searches': {
+            'used': self.state.credits_used, 'available': self.state.monthly_credits
+        }}}}
+
+    # GMass
+
+    def gmass_create_campaign(self, path):
+        campaign_id = uuid.uuid4().hex
+        self.state.campaigns[campaign_id] = {'recipients': len(self.body.get('recipients', [])), 'status': 'draft'}
+        return 200, {'campaign_id': campaign_id, 'name': self.body.get('name'), 'recipients': len(self.body.get('recipients', []))}
+
+    def gmass_templates(self, path):
+        return 200, []
+
+    def gmass_campaign_action(self, path):
+        return 200, {'success': True}
+
+    def gmass_campaign_stats(self, path):
+        campaign = self.state.campaigns.get(path.split('/')[-2], {})
+        sent = campaign.get('recipients', 0)
+        return 200, {'sent': sent, 'opens': sent // 2, 'clicks': sent // 10, 'replies': sent // 20}
+
+    # OpenAI
+
+    def openai_chat_completion(self, path):
+        completion = self._chat_completion(self.body)
+        if self.body.get('stream'):
+            return self._stream_chat_completion(completion)
+        return 200, completion
+
+    def _stream_chat_completion(self, completion):
+        """Send a completion as server-sent events, one word per chunk, token_ms apart"""
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+
+        delay = self.state.services.get('openai', {}).get('token_ms', 0) / 1000.0
+        base = {key: completion[key] for key in ('id', 'created', 'model')}
+        deltas = [{'role': 'assistant'}]
+        deltas += [{'content': piece} for piece in re.findall(r'\S+\s*|\s+', completion['choices'][0]['message']['content'])]
+        for delta in deltas:
+            time.sleep(delay)
+            self._write_event({**base, 'object': 'chat.completion.chunk',
+                               'choices': [{'index': 0, 'delta': delta, 'finish_reason': None}]})
+        self._write_event({**base, 'object': 'chat.completion.chunk',
+                           'choices': [{'index': 0, 'delta': {}, 'finish_reason': 'stop'}]})
+        self._write_chunk(b'data: [DONE]\n\n')
+        self._write_chunk(b'')
+
+    def _write_event(self, payload):
+        self._write_chunk(f"data: {json.dumps(payload)}\n\n".encode('utf-8'))
+
+    def _write_chunk(self, data):
+        self.wfile.write(f"{len(data):x}\r\n".encode('ascii') + data + b"\r\n")
+        self.wfile.flush()
+
+    def _chat_completion(self, request):
+        messages = request.get('messages') or []
+        prompt = '\n'.join(message.get('content', '') for message in messages)
+        content = self._mock_completion(prompt)
+        if content.startswith('Subject:') and request.get('model') in self.state.invalid_models:
+            with self.state._lock:
+                invalid = self.state.random.random() < self.state.invalid_rate
+            if invalid:
+                content = content.split('\n\nBest regards,')[0]
+        prompt_tokens, completion_tokens = estimate_tokens(prompt), estimate_tokens(content)
+        return {
+            'id': f"chatcmpl-{uuid.uuid4().hex[:12]}",
+            'object': 'chat.completion',
+            'created': int(time.time()),
+            'model': request.get('model', 'gpt-3.5-turbo'),
+            'choices': [{'index': 0, 'message': {'role': 'assistant', 'content': content}, 'finish_reason': 'stop'}],
+            'usage': {'prompt_tokens': prompt_tokens, 'completion_tokens': completion_tokens, 'total_tokens': prompt_tokens + completion_tokens}
+        }
+
+    def openai_upload_file(self, path):
+        content_type = self.headers.get('Content-Type', '')
+        message = BytesParser(policy=HTTP).parsebytes(f"Content-Type: {content_type}\r\n\r\n".encode() + self.raw_body)
+        content, filename, purpose = b'', 'upload.jsonl', 'batch'
+        for part in message.iter_parts() if message.is_multipart() else ():
+            if part.get_filename():
+                content, filename = part.get_payload(decode=True), part.get_filename()
+            elif part.get_param('name', header='content-disposition') == 'purpose':
+                purpose = part.get_payload(decode=True).decode()
+        return 200, self._store_file(content, filename, purpose)
+
+    def _store_file(self, content, filename, purpose):
+        file_id = uuid.uuid4().hex
+        with self.state._lock:
+            self.state.files[file_id] = content
+        return {'id': file_id, 'object': 'file', 'bytes': len(content), 'created_at': int(time.time()),
+                'filename': filename, 'purpose': purpose}
+
+    def openai_file_content(self, path):
+        content = self.state.files.get(path.split('/')[-2])
+        if content is None:
+            return 404, {'error': {'message': 'No such file'}}
+        return 200, content
+
+    def openai_create_batch(self, path):
+        input_file = self.state.files.get(self.body.get('input_file_id'))
+        if input_file is None:
+            return 404, {'error': {'message': 'No such file'}}
+        batch = {
+            'id': uuid.uuid4().hex,
+            'object': 'batch',
+            'endpoint': self.body.get('endpoint'),
+            'input_file_id': self.body['input_file_id'],
+            'completion_window': self.body.get('completion_window', '24h'),
+            'status': 'validating',
+            'created_at': int(time.time()),
+            'output_file_id': None,
+            'error_file_id': None,
+            'request_counts': {'total': len(input_file.splitlines()), 'completed': 0, 'failed': 0}
+        }
+        with self.state._lock:
+            self.state.batches[batch['id']] = (time.monotonic(), batch)
+        return 200, batch
+
+    def openai_get_batch(self, path):
+        created, batch = self.state.batches.get(path.split('/')[-1], (None, None))
+        if batch is None:
+            return 404, {'error': {'message': 'No such batch'}}
+        if batch['status'] == 'validating':
+            batch['status'] = 'in_progress'
+        elif batch['status'] == 'in_progress' and time.monotonic() - created >= self.state.batch_seconds:
+            self._finish_batch(batch)
+        return 200, batch
+
+    def _finish_batch(self, batch):
+        """Answer every request in the batch's input file and store the output file"""
+        output = []
+        for line in self.state.files[batch['input_file_id']].decode('utf-8').splitlines():
+            request = json.loads(line)
+            output.append(json.dumps({
+                'id': f"batch_req_{uuid.uuid4().hex[:12]}",
+                'custom_id': request.get('custom_id'),
+                'response': {'status_code': 200, 'request_id': uuid.uuid4().hex, 'body': self._chat_completion(request['body'])},
+                'error': None
+            }))
+        output_file = self._store_file(('\n'.join(output) + '\n').encode('utf-8'), 'batch_output.jsonl', 'batch_output')
+        batch.update({
+            'status': 'completed',
+            'output_file_id': output_file['id'],
+            'completed_at': int(time.time()),
+            'request_counts': {'total': len(output), 'completed': len(output), 'failed': 0}
+        })
+
+    def _mock_completion(self, prompt):
+        batch = BATCH_RECIPIENTS_RE.search(prompt)
+        if batch is not None:
+            company = BATCH_COMPANY_RE.search(prompt)
+            company = company.group('company') if company else 'your company'
+            messages = []
+            for recipient in json.loads(batch.group('recipients')):
+                subject, body = self._mock_message(recipient['name'], recipient['title'], company).split('\n\n', 1)
+                messages.append({'id': recipient['id'], 'subject': subject.replace('Subject: ', ''), 'body': body})
+            return json.dumps({'messages': messages})
+
+        template = TEMPLATE_PROMPT_RE.search(prompt)
+        if template is not None:
+            return self._mock_message('{first_name}', '{title}', template.group('company'))
+
+        match = PERSON_PROMPT_RE.search(prompt)
+        if match is None:
+            company = re.search(r'overview of (?P<company>.+?) including', prompt)
+            return self._mock_company_overview(company.group('company').strip() if company else 'The company')
+
+        return self._mock_message(match.group('name'), match.group('title'), match.group('company'))
+
+    def _mock_company_overview(self, name):
+        """An overview about as long and structured as a real one (~250 tokens)"""
+        return (
+            f"1. Mission/Purpose: {name}'s mission is to build reliable software that helps teams everywhere do their "
+            f"best work, and to make powerful tools accessible to businesses of every size.\n"
+            f"2. Products/Services: {name} offers a cloud platform for collaboration, analytics dashboards, developer "
+            f"APIs and an enterprise security suite, serving customers in more than 100 countries.\n"
+            f"3. Core Values: Customer obsession, engineering excellence, ownership, and an inclusive culture where "
+            f"diverse perspectives are welcomed and people are trusted to make decisions.\n"
+            f"4. Why Work There: Engineers at {name} work on large-scale distributed systems, ship quickly with strong "
+            f"mentorship, and see their work used by millions of people every day.\n"
+            f"5. Company Culture: Collaborative and fast-paced, with hack weeks, internal tech talks, flexible hybrid "
+            f"work and a strong focus on learning and career growth for early-career engineers."
+        )
+
+    def _mock_message(self, name, title, company):
+        return (
+            f"Subject: Coffee chat about your work at {company}\n\n"
+            f"Hi {name},\n\n"
+            f"I'm Abhinav, a Computer Science student at Santa Clara University, and your path to {title} at {company} "
+            f"stood out to me. I'm preparing to apply for the 2026 Software Engineer Internship and would love to hear "
+            f"about your journey. Would you have 15 minutes for a virtual coffee chat?\n\n"
+            f"Best regards,\nAbhinav Ala\n(469)-381-4729\naala@scu.edu"
+        )
+
+
+ROUTES = {
+    ('GET', '/hunter/v2/email-finder'): MockAPIHandler.hunter_email_finder,
+    ('GET', '/hunter/v2/email-verifier'): MockAPIHandler.hunter_email_verifier,
+    ('GET', '/hunter/v2/domain-search'): MockAPIHandler.hunter_domain_search,
+    ('GET', '/hunter/v2/account'): MockAPIHandler.hunter_account,
+    ('POST', '/gmass/api/campaigns'): MockAPIHandler.gmass_create_campaign,
+    ('GET', '/gmass/api/templates'): MockAPIHandler.gmass_templates,
+    ('POST', '/gmass/api/campaigns/{id}/test'): MockAPIHandler.gmass_campaign_action,
+    ('POST', '/gmass/api/campaigns/{id}/schedule'): MockAPIHandler.gmass_campaign_action,
+    ('GET', '/gmass/api/campaigns/{id}/stats'): MockAPIHandler.gmass_campaign_stats,
+    ('POST', '/openai/v1/chat/completions'): MockAPIHandler.openai_chat_completion,
+    ('POST', '/openai/v1/files'): MockAPIHandler.openai_upload_file,
+    ('GET', '/openai/v1/files/{id}/content'): MockAPIHandler.openai_file_content,
+    ('POST', '/openai/v1/batches'): MockAPIHandler.openai_create_batch,
+    ('GET', '/openai/v1/batches/{id}'): MockAPIHandler.openai_get_batch
+}
+
+
+class MockAPIServer(ThreadingHTTPServer):
+    """Threaded HTTP server answering for all three services"""
+
+    daemon_threads = True
+
+    def __init__(self, host='127.0.0.1', port=8765, state=None):
+        super().__init__((host, port), MockAPIHandler)
+        self.state = state or MockState()
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """Serve from a background thread (for tests and in-process benchmarks)"""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+def use_mock_servers(url):
+    """Point Config at a running mock server (for clients created after this call)"""
+    from config import Config
+    Config.USE_MOCK_SERVERS = True
+    Config.MOCK_SERVER_URL = url
+    Config.HUNTER_BASE_URL = f"{url}/hunter/v2"
+    Config.GMASS_BASE_URL = f"{url}/gmass"
+    Config.OPENAI_API_BASE = f"{url}/openai/v1"
+    Config.HUNTER_API_KEY = Config.HUNTER_API_KEY or 'mock-hunter-key'
+    Config.GMASS_API_KEY = Config.GMASS_API_KEY or 'mock-gmass-key'
+    Config.OPENAI_API_KEY = Config.OPENAI_API_KEY or 'mock-openai-key'
+
+
+def start_mock_server(port=0, **state_options):
+    """Start a mock server on a background thread and point Config at it"""
+    server = MockAPIServer(port=port, state=MockState(**state_options)).start()
+    use_mock_servers(server.url)
+    return server
+
+
+def run_benchmark(people_count, companies=5):
+    """Run email lookup, verification and message generation for synthetic people against the mock"""
+    from ai_message_generator import AIMessageGenerator
+    from email_finder import EmailFinder
+    from http_client import get_transport
+
+    people = []
+    for i in range(people_count):
+        first, last = MOCK_FIRST_NAMES[i % len(MOCK_FIRST_NAMES)], MOCK_LAST_NAMES[(i // len(MOCK_FIRST_NAMES)) % len(MOCK_LAST_NAMES)]
+        people.append({
+            'name': f"{first} {last}",
+            'title': 'Software Engineer',
+            'company': f"Mockcorp {i % companies}",
+            'profile_url': f"https://www.linkedin.com/in/mock-{i}",
+            'is_scu_alumni': i % 7 == 0
+        })
+
+    timings = {}
+    email_finder = EmailFinder()
+    start = time.perf_counter()
+    people = email_finder.find_emails_for_people(people)
+    timings['email lookup'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    people = email_finder.verify_emails_for_people(people)
+    timings['verification'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    AIMessageGenerator().generate_bulk_messages(people)
+    timings['message generation'] = time.perf_counter() - start
+
+    for stage, seconds in timings.items():
+        print(f"{stage}: {seconds:.2f}s ({people_count / seconds:.1f} people/s)" if seconds else f"{stage}: 0s")
+    get_transport().log_latency_summary()
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for the Hunter.io, GMass and OpenAI APIs")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency-ms', type=float, help="Mean latency for every service")
+    parser.add_argument('--openai-latency-ms', type=float, help="Mean latency for OpenAI completions")
+    parser.add_argument('--error-rate', type=float, help="Share of requests answered with a 503 (0-1)")
+    parser.add_argument('--rate-limit', type=float, help="Requests per second per service before 429s")
+    parser.add_argument('--found-rate', type=float, default=0.8, help="Share of email-finder lookups that find an email")
+    parser.add_argument('--token-ms', type=float, help="Delay between streamed OpenAI tokens")
+    parser.add_argument('--batch-seconds', type=float, default=2.0, help="Seconds before an OpenAI batch job completes")
+    parser.add_argument('--invalid-rate', type=float, default=0.0, help="Share of cheap-model messages missing the signature (0-1)")
+    parser.add_argument('--benchmark', type=int, metavar='PEOPLE', help="Run the pipeline against an in-process mock and exit")
+    args = parser.parse_args()
+
+    services = {}
+    for name in DEFAULT_SERVICE_SETTINGS:
+        settings = {}
+        if args.latency_ms is not None:
+            settings['latency_ms'] = args.latency_ms
+        if args.error_rate is not None:
+            settings['error_rate'] = args.error_rate
+        if args.rate_limit is not None:
+            settings['rate_limit'] = args.rate_limit
+        services[name] = settings
+    if args.openai_latency_ms is not None:
+        services['openai']['latency_ms'] = args.openai_latency_ms
+    if args.token_ms is not None:
+        services['openai']['token_ms'] = args.token_ms
+
+    logging.basicConfig(level=logging.INFO)
+    if args.benchmark:
+        server = start_mock_server(services=services, found_rate=args.found_rate, invalid_rate=args.invalid_rate,
+                                   batch_seconds=args.batch_seconds)
+        try:
+            run_benchmark(args.benchmark)
+            print(json.dumps(server.state.summary(), indent=2))
+        finally:
+            server.stop()
+        return
+
+    state = MockState(services=services, found_rate=args.found_rate, invalid_rate=args.invalid_rate,
+                      batch_seconds=args.batch_seconds)
+    server = MockAPIServer(args.host, args.port, state)
+    print(f"Mock Hunter/GMass/OpenAI server on {server.url} - set USE_MOCK_SERVERS=true and MOCK_SERVER_URL={server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
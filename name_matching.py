@@ -0,0 +1,114 @@
+"""
+Name normalization and local matching of scraped people against harvested email owners
+"""
+import re
+import unicodedata
+
+# Common English nicknames -> canonical first name
+NICKNAMES = {
+    'abby': 'abigail', 'al': 'albert', 'alex': 'alexander', 'andy': 'andrew', 'drew': 'andrew',
+    'ben': 'benjamin', 'bill': 'william', 'billy': 'william', 'will': 'william', 'liam': 'william',
+    'bob': 'robert', 'bobby': 'robert', 'rob': 'robert', 'robbie': 'robert', 'bert': 'robert',
+    'cathy': 'catherine', 'kate': 'katherine', 'katie': 'katherine', 'kathy': 'katherine',
+    'chris': 'christopher', 'dan': 'daniel', 'danny': 'daniel', 'dave': 'david',
+    'deb': 'deborah', 'debbie': 'deborah', 'ed': 'edward', 'eddie': 'edward', 'ted': 'edward',
+    'fred': 'frederick', 'greg': 'gregory', 'jack': 'john', 'johnny': 'john', 'jim': 'james',
+    'jimmy': 'james', 'jamie': 'james', 'jen': 'jennifer', 'jenny': 'jennifer', 'jeff': 'jeffrey',
+    'joe': 'joseph', 'joey': 'joseph', 'jon': 'jonathan', 'josh': 'joshua', 'ken': 'kenneth',
+    'larry': 'lawrence', 'liz': 'elizabeth', 'beth': 'elizabeth', 'betty': 'elizabeth',
+    'matt': 'matthew', 'mike': 'michael', 'mikey': 'michael', 'nate': 'nathan', 'nick': 'nicholas',
+    'pat': 'patrick', 'pete': 'peter', 'phil': 'philip', 'rich': 'richard', 'rick': 'richard',
+    'dick': 'richard', 'ron': 'ronald', 'sam': 'samuel', 'steve': 'steven', 'stephen': 'steven',
+    'sue': 'susan', 'tom': 'thomas', 'tommy': 'thomas', 'tony': 'anthony', 'vicky': 'victoria',
+    'zach': 'zachary', 'zack': 'zachary'
+}
+
+# Trailing credentials / suffixes that show up in LinkedIn display names
+NAME_SUFFIXES = {'jr', 'sr', 'ii', 'iii', 'iv', 'phd', 'mba', 'md', 'pe', 'cpa', 'pmp', 'msc', 'bsc', 'ms', 'bs'}
+
+PARENTHETICAL_RE = re.compile(r'\([^)]*\)|\[[^\]]*\]')
+NON_ALPHA_RE = re.compile(r"[^a-z\s-]")
+
+
+def strip_accents(value):
+    value = unicodedata.normalize('NFKD', value or '')
+    return ''.join(ch for ch in value if not unicodedata.combining(ch))
+
+
+def name_tokens(name):
+    """Normalized name tokens with accents, punctuation, pronouns and credentials removed"""
+    name = PARENTHETICAL_RE.sub(' ', strip_accents(name).lower())
+    # "Jane Doe, PhD" -> "Jane Doe"
+    name = name.split(',')[0]
+    name = NON_ALPHA_RE.sub('', name).replace('-', ' ')
+    return [token for token in name.split() if token not in NAME_SUFFIXES]
+
+
+def canonical_first_name(first_name):
+    token = (name_tokens(first_name) or [''])[0]
+    return NICKNAMES.get(token, token)
+
+
+def name_key(first_name, last_name):
+    """(canonical first name, last surname token) - middle names are ignored"""
+    first_tokens = name_tokens(first_name)
+    last_tokens = name_tokens(last_name)
+    if not last_tokens and len(first_tokens) > 1:
+        # Full name passed as first_name
+        first_tokens, last_tokens = first_tokens[:1], first_tokens[-1:]
+    first = first_tokens[0] if first_tokens else ''
+    last = last_tokens[-1] if last_tokens else ''
+    return NICKNAMES.get(first, first), last
+
+
+class NameIndex:
+    """Index of known (name, email) entries for one domain, matched by normalized name"""
+
+    def __init__(self, entries=()):
+        self.entries = []
+        self._by_name = {}
+        self._by_initial = {}
+        for entry in entries:
+            self.add(entry)
+
+    def add(self, entry):
+        """Add a harvested entry: dict with first_name, last_name and email"""
+        first, last = name_key(entry.get('first_name'), entry.get('last_name'))
+        if not last or not entry.get('email'):
+            return
+        self.entries.append(entry)
+        if first:
+            self._by_name.setdefault((first, last), []).append(entry)
+        self._by_initial.setdefault((first[:1], last), []).append(entry)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def match(self, first_name, last_name):
+        """Return the single entry matching a person, or None if missing or ambiguous"""
+        first, last = name_key(first_name, last_name)
+        if not first or not last:
+            return None
+
+        candidates = self._unique_emails(self._by_name.get((first, last), []))
+        if len(candidates) == 1:
+            return candidates[0]
+        if candidates:
+            return None
+
+        # Fall back to initial + surname when one side only has an initial ("J. Smith"),
+        # and only when that's unambiguous
+        candidates = [
+            entry for entry in self._by_initial.get((first[:1], last), [])
+            if len(first) == 1 or len(name_key(entry.get('first_name'), entry.get('last_name'))[0]) <= 1
+        ]
+        candidates = self._unique_emails(candidates)
+        if len(candidates) == 1:
+            return candidates[0]
+        return None
+
+    def _unique_emails(self, entries):
+        seen = {}
+        for entry in entries:
+            seen.setdefault(entry['email'].lower(), entry)
+        return list(seen.values())
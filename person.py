@@ -0,0 +1,163 @@
+"""
+Compact person records shared by the scraper, email finder, message generator and exporters
+"""
+# Per-person fields stored in slots
+PERSON_FIELDS = (
+    'person_key', 'name', 'title', 'location', 'profile_url', 'is_scu_alumni',
+    'first_name', 'last_name', 'email', 'email_confidence', 'email_sources', 'email_status',
+    'email_verification_status', 'email_verification_score', 'title_relevance',
+    'message_subject', 'message_body'
+)
+
+# Company-level fields live once per company and are reached through company_ref
+COMPANY_FIELDS = {
+    'company': 'name',
+    'company_domain': 'domain',
+    'company_info': 'info'
+}
+
+
+class Company:
+    """Company-level data shared by reference between every person at the company"""
+    __slots__ = ('name', 'domain', 'info')
+
+    def __init__(self, name, domain=None, info=None):
+        self.name = name
+        self.domain = domain
+        self.info = info
+
+    def __repr__(self):
+        return f"Company({self.name!r})"
+
+
+class CompanyRegistry:
+    """Interns Company objects by normalized name so each company is stored once"""
+
+    def __init__(self):
+        self._companies = {}
+
+    def get(self, name):
+        """Return the shared Company for a name, creating it on first use"""
+        name = name or ''
+        key = ' '.join(name.lower().split())
+        company = self._companies.get(key)
+        if company is None:
+            company = Company(name)
+            self._companies[key] = company
+        return company
+
+    def clear(self):
+        """Forget every company (call at the start of a run so domains/overviews aren't carried over)"""
+        self._companies = {}
+
+    def __len__(self):
+        return len(self._companies)
+
+    def __iter__(self):
+        return iter(self._companies.values())
+
+
+# Process-wide registry so every stage sees the same Company objects
+company_registry = CompanyRegistry()
+
+
+class Person:
+    """A scraped person
+
+    Supports the dict-style access (get, [], keys, **unpacking) the rest of the code
+    base already uses, so stages can annotate records in place instead of copying them.
+    Unknown keys are kept in a small side dict.
+    """
+    __slots__ = PERSON_FIELDS + ('company_ref', 'extra')
+
+    def __init__(self, **fields):
+        self.company_ref = None
+        self.extra = None
+        # Set the company first so company_domain/company_info land on the right Company
+        if 'company' in fields:
+            self['company'] = fields.pop('company')
+        for key, value in fields.items():
+            self[key] = value
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a Person from a plain dict (no-op for existing Person objects)"""
+        if isinstance(data, cls):
+            return data
+        return cls(**dict(data))
+
+    def __getitem__(self, key):
+        if key in COMPANY_FIELDS:
+            if self.company_ref is None:
+                raise KeyError(key)
+            value = getattr(self.company_ref, COMPANY_FIELDS[key])
+            if value is None and key != 'company':
+                raise KeyError(key)
+            return value
+        if key in PERSON_FIELDS:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key)
+        if self.extra is not None and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key == 'company':
+            self.company_ref = company_registry.get(value or '')
+        elif key in COMPANY_FIELDS:
+            if self.company_ref is None:
+                self.company_ref = company_registry.get('')
+            setattr(self.company_ref, COMPANY_FIELDS[key], value)
+        elif key in PERSON_FIELDS:
+            setattr(self, key, value)
+        else:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[key] = value
+
+    def __contains__(self, key):
+        try:
+            self[key]
+            return True
+        except KeyError:
+            return False
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def update(self, values):
+        for key, value in values.items():
+            self[key] = value
+
+    def keys(self):
+        keys = [field for field in PERSON_FIELDS if hasattr(self, field)]
+        if self.company_ref is not None:
+            keys.extend(key for key in COMPANY_FIELDS if key in self)
+        if self.extra:
+            keys.extend(self.extra)
+        return keys
+
+    def items(self):
+        return [(key, self[key]) for key in self.keys()]
+
+    def to_dict(self):
+        """Plain dict copy (for DataFrames and JSON)"""
+        return dict(self.items())
+
+    def __repr__(self):
+        return f"Person({self.get('name')!r}, company={self.get('company')!r})"
+
+
+def as_people(people_data):
+    """Convert a list of dicts and/or Person objects into Person objects"""
+    return [Person.from_dict(person) for person in people_data]
+
+
+def as_dicts(people_data):
+    """Convert a list of dicts and/or Person objects into plain dicts (for DataFrames and JSON)"""
+    return [Person.from_dict(person).to_dict() for person in people_data]
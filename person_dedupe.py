@@ -0,0 +1,155 @@
+"""
+Near-duplicate detection for scraped people before the paid email and message stages
+"""
+import logging
+from difflib import SequenceMatcher
+from config import Config
+from name_matching import name_key
+from profile_utils import canonicalize_profile_url, normalize_person_text
+
+# Fields that belong to the kept record's company and are never copied from a duplicate
+KEEP_FIELDS = ('person_key', 'company', 'company_domain', 'company_info')
+
+# Set once a record has been through email lookup or message generation
+PROCESSED_FIELDS = ('email_status', 'message_body')
+
+
+def person_name_key(person):
+    """(canonical first name, last surname token) for a scraped person"""
+    if person.get('first_name') or person.get('last_name'):
+        return name_key(person.get('first_name'), person.get('last_name'))
+    return name_key(person.get('name'), None)
+
+
+def names_match(key_a, key_b, threshold=0.92):
+    """Same surname with equal names, nicknames or a matching initial, or a near-identical spelling"""
+    (first_a, last_a), (first_b, last_b) = key_a, key_b
+    if not last_a or not last_b:
+        return False
+    if last_a == last_b:
+        if first_a == first_b:
+            return True
+        # "J. Smith" vs "John Smith"
+        if first_a and first_b and min(len(first_a), len(first_b)) == 1 and first_a[0] == first_b[0]:
+            return True
+    return SequenceMatcher(None, f"{first_a} {last_a}", f"{first_b} {last_b}").ratio() >= threshold
+
+
+class _Record:
+    """What the index keeps per kept person"""
+    __slots__ = ('person', 'url', 'name', 'company')
+
+    def __init__(self, person, url, name, company):
+        self.person = person
+        self.url = url
+        self.name = name
+        self.company = company
+
+
+class PersonDeduper:
+    """Collapses repeat copies of a person across searches and companies
+
+    Records are indexed under blocking keys - the canonical profile URL, and
+    company + surname + first initial / company + first name + surname prefix for
+    spelling variants - so each new person is only compared with the few records that
+    share a key, never with everyone seen so far. Two records with different profile
+    URLs are never merged. The index lives for a run, so the second company's search
+    also drops people already kept from the first. Duplicates of a record that has
+    already been looked up or messaged are dropped without changing it, since its
+    email, message and sheet row were based on what it had then.
+    """
+
+    def __init__(self, threshold=None, max_block_size=None):
+        self.threshold = Config.PERSON_DEDUPE_NAME_THRESHOLD if threshold is None else threshold
+        self.max_block_size = Config.PERSON_DEDUPE_MAX_BLOCK if max_block_size is None else max_block_size
+        self.setup_logging()
+        self.start_run()
+
+    def setup_logging(self):
+        logging.basicConfig(level=logging.INFO)
+        self.logger = logging.getLogger(__name__)
+
+    def start_run(self):
+        self._blocks = {}
+        self.seen = 0
+        self.collapsed = 0
+
+    def _block_keys(self, record):
+        keys = []
+        if record.url:
+            keys.append(('url', record.url))
+        first, last = record.name
+        if last:
+            keys.append(('initial', record.company, last, first[:1]))
+            if first:
+                keys.append(('first', record.company, first, last[:2]))
+        return keys
+
+    def _is_duplicate(self, record, other):
+        if record.url and other.url:
+            return record.url == other.url
+        return record.company == other.company and names_match(record.name, other.name, self.threshold)
+
+    def _record(self, person):
+        return _Record(
+            person,
+            canonicalize_profile_url(person.get('profile_url')),
+            person_name_key(person),
+            normalize_person_text(person.get('company'))
+        )
+
+    def _find(self, record, keys):
+        for key in keys:
+            for other in self._blocks.get(key, ()):
+                if self._is_duplicate(record, other):
+                    return other
+        return None
+
+    def apply(self, people):
+        """Drop people already seen this run, merging what they add into the kept copy"""
+        people = list(people)
+        if not Config.PERSON_DEDUPE_ENABLED:
+            return people
+        kept = []
+        for person in people:
+            record = self._record(person)
+            keys = self._block_keys(record)
+            duplicate = self._find(record, keys)
+            if duplicate is not None:
+                self.merge(duplicate.person, person)
+                if not duplicate.url and record.url:
+                    duplicate.url = record.url
+                    self._blocks.setdefault(('url', record.url), []).append(duplicate)
+                continue
+
+            for key in keys:
+                block = self._blocks.setdefault(key, [])
+                # Very common names only get compared with the latest records
+                if len(block) >= self.max_block_size:
+                    del block[0]
+                block.append(record)
+            kept.append(person)
+
+        self.seen += len(people)
+        collapsed = len(people) - len(kept)
+        self.collapsed += collapsed
+        if collapsed:
+            self.logger.info(f"Collapsed {collapsed} duplicate people ({len(kept)} of {len(people)} kept)")
+        return kept
+
+    def merge(self, kept, duplicate):
+        """Fill the kept record's missing fields from a duplicate (unless it's already been processed)"""
+        if any(kept.get(field) for field in PROCESSED_FIELDS):
+            self.logger.debug(f"Not merging into already processed record for {kept.get('name')}")
+            return
+        if duplicate.get('is_scu_alumni'):
+            kept['is_scu_alumni'] = True
+        for key in duplicate.keys():
+            if key in KEEP_FIELDS:
+                continue
+            value = duplicate.get(key)
+            if value not in (None, '', [], {}) and kept.get(key) in (None, '', [], {}):
+                kept[key] = value
+
+    def format_summary(self):
+        return f"Duplicates collapsed: {self.collapsed} of {self.seen} people"
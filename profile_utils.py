@@ -0,0 +1,94 @@
+"""
+LinkedIn profile URL canonicalization and stable person keys
+"""
+import hashlib
+import re
+from urllib.parse import urlsplit, parse_qs, unquote
+from config import Config
+
+# Matches the member id inside a miniProfile URN, e.g. urn:li:fs_miniProfile:ACoAAB1234
+MINI_PROFILE_URN_RE = re.compile(r'urn:li:(?:fs_|fsd_)?(?:miniProfile|profile|member):([A-Za-z0-9_-]+)')
+
+# Matches /in/<slug> anywhere in a path (locale prefixes like /in/slug/en are tolerated)
+PROFILE_SLUG_RE = re.compile(r'/in/([^/?#]+)')
+
+# Member ids (ACoAAB1234...) are case-sensitive, unlike vanity slugs
+MEMBER_ID_RE = re.compile(r'^ACoA[A-Za-z0-9_-]+$')
+
+PERSON_KEY_LENGTH = 16
+
+
+def canonicalize_profile_url(url):
+    """Return the canonical https://www.linkedin.com/in/<id> form of a profile link, or '' if none"""
+    if not url:
+        return ''
+
+    url = url.strip()
+    if url.startswith('/'):
+        url = f"{Config.LINKEDIN_BASE_URL}{url}"
+
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return ''
+
+    host = parts.netloc.lower()
+    if host and host != 'linkedin.com' and not host.endswith('.linkedin.com'):
+        return ''
+
+    # /in/<slug> links - drop tracking query strings, trailing segments and case differences
+    path = unquote(parts.path)
+    slug_match = PROFILE_SLUG_RE.search(path)
+    if slug_match:
+        slug = slug_match.group(1).strip()
+        if not MEMBER_ID_RE.match(slug):
+            slug = slug.lower()
+        if slug:
+            return f"{Config.LINKEDIN_BASE_URL}/in/{slug}"
+
+    # miniProfileUrn links - the member id is stable, so key on it
+    query = parse_qs(parts.query)
+    for param in ('miniProfileUrn', 'profileUrn', 'memberUrn'):
+        for value in query.get(param, []):
+            urn_match = MINI_PROFILE_URN_RE.search(unquote(value))
+            if urn_match:
+                return f"{Config.LINKEDIN_BASE_URL}/in/{urn_match.group(1)}"
+
+    urn_match = MINI_PROFILE_URN_RE.search(unquote(url))
+    if urn_match:
+        return f"{Config.LINKEDIN_BASE_URL}/in/{urn_match.group(1)}"
+
+    return ''
+
+
+def normalize_person_text(value):
+    """Lowercase and collapse whitespace for key building"""
+    return ' '.join((value or '').lower().split())
+
+
+def make_person_key(profile_url=None, name=None, company=None):
+    """Build a stable hashed key for a person
+
+    The canonical profile URL is preferred. When a card has no usable profile link
+    the key falls back to normalized name + company, which is still stable across runs.
+    """
+    canonical_url = canonicalize_profile_url(profile_url)
+    if canonical_url:
+        source = f"url:{canonical_url}"
+    else:
+        source = f"name:{normalize_person_text(name)}|company:{normalize_person_text(company)}"
+
+    return hashlib.sha1(source.encode('utf-8')).hexdigest()[:PERSON_KEY_LENGTH]
+
+
+def ensure_person_key(person_data):
+    """Make sure a person record carries a person_key and returns it"""
+    person_key = person_data.get('person_key')
+    if not person_key:
+        person_key = make_person_key(
+            person_data.get('profile_url'),
+            person_data.get('name'),
+            person_data.get('company')
+        )
+        person_data['person_key'] = person_key
+    return person_key
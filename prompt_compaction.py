@@ -0,0 +1,77 @@
+"""
+Compact structured company summaries for outreach prompts
+"""
+import re
+
+# Summary fields and the section headings that feed them
+SUMMARY_FIELDS = (
+    ('Mission', ('mission', 'purpose')),
+    ('Products', ('product', 'service', 'what they do', 'offering')),
+    ('Values', ('value', 'principle')),
+)
+
+# "1. Main Mission/Purpose: ...", "- **Core Values** - ...", "### **Products & services**"
+HEADING_RE = re.compile(
+    r"^\s*(?:#{1,6}\s*|\d+[.)]\s*|[-*•]\s+)?"
+    r"(?:\*\*(?P<bold>[^*]{3,40}?):?\*\*\s*[:\-–]?|(?P<plain>[A-Za-z][A-Za-z /&'()-]{2,40}?)\s*:)\s*(?P<body>.*)$"
+)
+MARKDOWN_HEADING_RE = re.compile(r'^\s*#{1,6}\s*\**(?P<heading>[^*:#]{3,40}?):?\**\s*$')
+BULLET_RE = re.compile(r'^\s*(?:[-*•]|\d+[.)])\s+')
+SENTENCE_END_RE = re.compile(r'(?<=[.!?])\s+(?=[A-Z0-9"])')
+MARKUP_RE = re.compile(r'[*_#`]+')
+
+
+def estimate_tokens(text):
+    """Rough OpenAI token count (~4 characters per token)"""
+    return len(text or '') // 4
+
+
+def _clip(text, max_words):
+    """First sentence of text, cut to max_words"""
+    text = ' '.join(MARKUP_RE.sub('', text).split())
+    sentence = SENTENCE_END_RE.split(text, 1)[0]
+    words = sentence.split()
+    if len(words) > max_words:
+        return ' '.join(words[:max_words]).rstrip(',;:') + '...'
+    return sentence
+
+
+def split_sections(text):
+    """[(heading, body)] for a numbered/bulleted overview; text before any heading is dropped"""
+    sections = []
+    for line in (text or '').splitlines():
+        markdown = MARKDOWN_HEADING_RE.match(line)
+        match = HEADING_RE.match(line)
+        if markdown:
+            sections.append([markdown.group('heading').strip().lower(), ''])
+        elif match:
+            sections.append([(match.group('bold') or match.group('plain')).strip().lower(), match.group('body')])
+        elif sections and line.strip():
+            # Bullet lists under a heading become one "a; b; c" line
+            separator = '; ' if BULLET_RE.match(line) and sections[-1][1] else ' '
+            sections[-1][1] += separator + BULLET_RE.sub('', line).strip()
+    return [(heading, body.strip()) for heading, body in sections]
+
+
+def compact_company_info(text, max_words=25):
+    """Distill a free-text company overview to short Mission/Products/Values lines
+
+    Falls back to the overview's first sentences if it has no recognisable sections.
+    """
+    if not text:
+        return ''
+    sections = split_sections(text)
+    lines = []
+    for label, keywords in SUMMARY_FIELDS:
+        for heading, body in sections:
+            if body and any(keyword in heading for keyword in keywords):
+                lines.append(f"{label}: {_clip(body, max_words)}")
+                break
+    if lines:
+        return '\n'.join(lines)
+
+    text = ' '.join(MARKUP_RE.sub('', text).split())
+    words = text.split()
+    if len(words) <= max_words * len(SUMMARY_FIELDS):
+        return text
+    return ' '.join(words[:max_words * len(SUMMARY_FIELDS)]).rstrip(',;:') + '...'
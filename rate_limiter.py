@@ -0,0 +1,155 @@
+"""
+Token bucket rate limiting shared by the async API engines
+"""
+import asyncio
+import sqlite3
+import threading
+import time
+from config import Config
+
+
+class RateLimitExceeded(Exception):
+    """Raised when a request would have to wait longer than the caller allows"""
+
+    def __init__(self, name, wait_seconds):
+        super().__init__(f"{name} limit reached (next slot in {wait_seconds:.0f}s)")
+        self.name = name
+        self.wait_seconds = wait_seconds
+
+
+class TokenBucket:
+    """Classic token bucket: `capacity` tokens, refilled at `capacity / period` tokens per second"""
+
+    def __init__(self, capacity, period, name=None):
+        self.capacity = float(capacity)
+        self.rate = float(capacity) / float(period)
+        self.name = name or f"{capacity}/{period}s"
+        self.tokens = float(capacity)
+        self.updated_at = time.monotonic()
+
+    def _refill(self, now):
+        elapsed = now - self.updated_at
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.updated_at = now
+
+    def wait_time(self, tokens=1, now=None):
+        """Seconds until `tokens` are available (0 if available now)"""
+        self._refill(now if now is not None else time.monotonic())
+        deficit = tokens - self.tokens
+        return 0 if deficit <= 0 else deficit / self.rate
+
+    def take(self, tokens=1):
+        self.tokens -= tokens
+
+
+class PersistentTokenBucket(TokenBucket):
+    """Token bucket whose level is kept in SQLite, for periods longer than a process (e.g. a month)
+
+    The level is stored against wall-clock time under the bucket's name, so a monthly
+    cap carries across runs instead of starting full at every process start.
+    """
+
+    def __init__(self, capacity, period, name, db_path=None):
+        super().__init__(capacity, period, name=name)
+        self._conn = sqlite3.connect(db_path or Config.CACHE_DB_PATH, check_same_thread=False)
+        self._db_lock = threading.Lock()
+        with self._db_lock:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS rate_limit_buckets (
+                    name TEXT PRIMARY KEY,
+                    tokens REAL NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+            """)
+            self._conn.commit()
+            row = self._conn.execute(
+                "SELECT tokens, updated_at FROM rate_limit_buckets WHERE name = ?", (self.name,)
+            ).fetchone()
+        if row:
+            self.tokens = min(self.capacity, row[0])
+            self.updated_at = row[1]
+        else:
+            self.updated_at = time.time()
+
+    def wait_time(self, tokens=1, now=None):
+        # Monotonic time doesn't survive a restart, so this bucket always runs on wall-clock time
+        return super().wait_time(tokens, time.time())
+
+    def take(self, tokens=1):
+        super().take(tokens)
+        with self._db_lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO rate_limit_buckets (name, tokens, updated_at) VALUES (?, ?, ?)",
+                (self.name, self.tokens, self.updated_at)
+            )
+            self._conn.commit()
+
+    def close(self):
+        with self._db_lock:
+            self._conn.close()
+
+
+class RateLimiter:
+    """Combines several token buckets (e.g. per-second, per-minute, per-month) into one limiter
+
+    Tokens are taken from every bucket at once, so a request only goes out when all limits allow it.
+    Usable from threads (acquire_sync) and from asyncio code (acquire).
+    """
+
+    def __init__(self, buckets):
+        self.buckets = [bucket for bucket in buckets if bucket is not None]
+        self._lock = threading.Lock()
+        self.waits = 0
+
+    def _try_take(self, tokens, max_wait):
+        """Take tokens if possible, otherwise return how long to wait"""
+        with self._lock:
+            now = time.monotonic()
+            wait = 0
+            limiting = None
+            for bucket in self.buckets:
+                bucket_wait = bucket.wait_time(tokens, now)
+                if bucket_wait > wait:
+                    wait = bucket_wait
+                    limiting = bucket
+
+            if wait <= 0:
+                for bucket in self.buckets:
+                    bucket.take(tokens)
+                return 0
+
+            if max_wait is not None and wait > max_wait:
+                raise RateLimitExceeded(limiting.name, wait)
+
+            self.waits += 1
+            return wait
+
+    async def acquire(self, tokens=1, max_wait=None):
+        while True:
+            wait = self._try_take(tokens, max_wait)
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+    def acquire_sync(self, tokens=1, max_wait=None):
+        while True:
+            wait = self._try_take(tokens, max_wait)
+            if wait <= 0:
+                return
+            time.sleep(wait)
+
+
+def build_rate_limiter(per_second=None, per_minute=None, per_month=None, name='api'):
+    """Build a RateLimiter from the usual published API limits (falsy limits are skipped)
+
+    The per-month bucket is persisted in CACHE_DB_PATH so it holds across runs.
+    """
+    buckets = []
+    if per_second:
+        buckets.append(TokenBucket(per_second, 1, name=f"{name} per-second"))
+    if per_minute:
+        buckets.append(TokenBucket(per_minute, 60, name=f"{name} per-minute"))
+    if per_month:
+        buckets.append(PersistentTokenBucket(per_month, 30 * 24 * 3600, name=f"{name} per-month"))
+    return RateLimiter(buckets)
@@ -0,0 +1,217 @@
+"""
+Retries with jittered exponential backoff and per-service circuit breakers for API clients
+"""
+import email.utils
+import logging
+import random
+import threading
+import time
+from config import Config
+
+# Breaker states
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a service whose breaker is open"""
+
+    def __init__(self, service, retry_in):
+        super().__init__(f"{service} circuit open after repeated failures (retrying in {retry_in:.0f}s)")
+        self.service = service
+        self.retry_in = retry_in
+
+
+def parse_retry_after(value):
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date), or None"""
+    if value is None:
+        return None
+    value = str(value).strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def backoff_delay(attempt, base=None, cap=None, retry_after=None):
+    """Full-jitter exponential backoff for retry number `attempt` (0-based)
+
+    A server-provided Retry-After wins over the computed delay.
+    """
+    if retry_after is not None:
+        return retry_after
+    base = Config.HTTP_BACKOFF_BASE if base is None else base
+    cap = Config.HTTP_BACKOFF_MAX if cap is None else cap
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+class CircuitBreaker:
+    """Opens after `failure_threshold` consecutive failures and fails fast for `reset_timeout` seconds
+
+    After the timeout one probe call is let through (half-open): success closes the
+    breaker, failure opens it again, and a neutral result (rate limited, rejected
+    request) frees the slot for another probe.
+    """
+
+    def __init__(self, name, failure_threshold=None, reset_timeout=None):
+        self.name = name
+        self.failure_threshold = failure_threshold or Config.CIRCUIT_FAILURE_THRESHOLD
+        self.reset_timeout = reset_timeout if reset_timeout is not None else Config.CIRCUIT_RESET_SECONDS
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.trips = 0
+        self.rejected = 0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def before_call(self):
+        """Raise CircuitOpenError if the call shouldn't go out"""
+        with self._lock:
+            if self.state == CLOSED:
+                return
+
+            retry_in = self.opened_at + self.reset_timeout - time.monotonic()
+            if self.state == OPEN and retry_in <= 0:
+                self.state = HALF_OPEN
+            if self.state == HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return
+
+            self.rejected += 1
+            raise CircuitOpenError(self.name, max(0.0, retry_in))
+
+    def record_success(self):
+        with self._lock:
+            self.state = CLOSED
+            self.failures = 0
+            self._probe_in_flight = False
+
+    def record_neutral(self):
+        """The call says nothing about the service's health; only release a half-open probe"""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self._probe_in_flight = False
+            if self.state == HALF_OPEN or (self.state == CLOSED and self.failures >= self.failure_threshold):
+                self.state = OPEN
+                self.opened_at = time.monotonic()
+                self.trips += 1
+                logging.getLogger(__name__).warning(
+                    f"{self.name} circuit opened after {self.failures} consecutive failures"
+                )
+
+
+class Resilience:
+    """Per-service breakers plus retry/trip counters shared by every API client"""
+
+    def __init__(self, max_retries=None):
+        self.max_retries = Config.HTTP_MAX_RETRIES if max_retries is None else max_retries
+        self.retries = {}
+        self._breakers = {}
+        self._lock = threading.Lock()
+        self.setup_logging()
+
+    def setup_logging(self):
+        logging.basicConfig(level=logging.INFO)
+        self.logger = logging.getLogger(__name__)
+
+    def breaker(self, service):
+        with self._lock:
+            breaker = self._breakers.get(service)
+            if breaker is None:
+                breaker = CircuitBreaker(service)
+                self._breakers[service] = breaker
+            return breaker
+
+    def call(self, service, func, classify, max_retries=None):
+        """Run func() with retries and the service's circuit breaker
+
+        classify(result, error) returns (retryable, failure, retry_after): whether to try
+        again, whether the attempt counts against the breaker (True), as a success
+        (False) or neither (None, e.g. a 429 or a rejected request), and any
+        server-requested delay in seconds. Errors are re-raised once retries run out; a retryable
+        response is returned as-is.
+        """
+        max_retries = self.max_retries if max_retries is None else max_retries
+        breaker = self.breaker(service)
+
+        attempt = 0
+        while True:
+            breaker.before_call()
+            result, error = None, None
+            try:
+                result = func()
+            except Exception as e:
+                error = e
+
+            retryable, failure, retry_after = classify(result, error)
+            if failure:
+                breaker.record_failure()
+            elif failure is None:
+                breaker.record_neutral()
+            else:
+                breaker.record_success()
+
+            # Stop once this attempt tripped the breaker, or for a Retry-After longer than we'd ever back off
+            if (retryable and attempt < max_retries and breaker.state != OPEN
+                    and (retry_after is None or retry_after <= Config.HTTP_MAX_RETRY_AFTER)):
+                delay = backoff_delay(attempt, retry_after=retry_after)
+                with self._lock:
+                    self.retries[service] = self.retries.get(service, 0) + 1
+                self.logger.info(f"Retrying {service} call in {delay:.1f}s (attempt {attempt + 2}/{max_retries + 1})")
+                time.sleep(delay)
+                attempt += 1
+                continue
+
+            if error is not None:
+                raise error
+            return result
+
+    def summary(self):
+        """Return {service: {retries, trips, rejected, state}}"""
+        with self._lock:
+            breakers = dict(self._breakers)
+            retries = dict(self.retries)
+        return {
+            service: {
+                'retries': retries.get(service, 0),
+                'trips': breaker.trips,
+                'rejected': breaker.rejected,
+                'state': breaker.state
+            }
+            for service, breaker in breakers.items()
+        }
+
+    def log_summary(self):
+        for service, stats in self.summary().items():
+            if stats['retries'] or stats['trips']:
+                self.logger.info(
+                    f"{service}: {stats['retries']} retries, {stats['trips']} circuit trips, "
+                    f"{stats['rejected']} calls failed fast"
+                )
+
+
+_resilience = None
+_resilience_lock = threading.Lock()
+
+
+def get_resilience():
+    """Process-wide breakers and counters shared by all API clients"""
+    global _resilience
+    if _resilience is None:
+        with _resilience_lock:
+            if _resilience is None:
+                _resilience = Resilience()
+    return _resilience
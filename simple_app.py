@@ -2,6 +2,7 @@ import streamlit as st
 import pandas as pd
 import time
 from simple_workflow import SimpleLinkedInWorkflow
+from person import as_dicts
 import logging
 
 # Configure logging
@@ -237,7 +238,7 @@ def main():
                                 
                                 if people_data:
                                     all_people_data.extend(people_data)
-                                    workflow.sheets_manager.add_people_data(people_data)
+                                    workflow.sheets_manager.upsert_people_data(people_data)
                                 
                                 progress_bar.progress(60 + (20 * (i + 1) / len(companies)))
                                 time.sleep(2)  # Rate limiting
@@ -258,7 +259,7 @@ def main():
                             st.info(f"📊 **Your new Google Sheet:** [Open Sheet]({workflow.sheets_manager.get_sheet_url()})")
                         
                         # Store results in session state
-                        st.session_state['people_data'] = all_people_data
+                        st.session_state['people_data'] = as_dicts(all_people_data)
                         st.session_state['companies'] = companies
                         st.session_state['sheet_id'] = final_sheet_id
                         
@@ -3,6 +3,8 @@ import time
 from linkedin_scraper import LinkedInScraper
 from google_sheets_manager import GoogleSheetsManager
 from csv_manager import CSVManager
+from person_dedupe import PersonDeduper
+from person import company_registry, as_dicts
 from config import Config
 
 class SimpleLinkedInWorkflow:
@@ -11,6 +13,7 @@ class SimpleLinkedInWorkflow:
         self.linkedin_scraper = LinkedInScraper()
         self.sheets_manager = GoogleSheetsManager()
         self.csv_manager = CSVManager()
+        self.person_deduper = PersonDeduper()
         
     def setup_logging(self):
         logging.basicConfig(level=logging.INFO)
@@ -43,18 +46,20 @@ class SimpleLinkedInWorkflow:
             
             # Step 3: Process each company
             all_people_data = []
+            company_registry.clear()
+            self.person_deduper.start_run()
             
             for company in companies:
                 self.logger.info(f"Processing company: {company}")
                 
                 # Search for people at the company
-                people_data = self.linkedin_scraper.search_people_by_company(company)
+                people_data = self.person_deduper.apply(self.linkedin_scraper.search_people_by_company(company))
                 
                 if people_data:
                     all_people_data.extend(people_data)
                     
                     # Add to Google Sheets
-                    self.sheets_manager.add_people_data(people_data)
+                    self.sheets_manager.upsert_people_data(people_data)
                     
                     self.logger.info(f"Processed {len(people_data)} people from {company}")
                 else:
@@ -159,6 +164,8 @@ class SimpleLinkedInWorkflow:
                 return {'success': False, 'error': 'LinkedIn login failed'}
             
             # Step 2: Process each company and collect data using the alumni hiring workflow
+            company_registry.clear()
+            self.person_deduper.start_run()
             
             for company in companies:
                 self.logger.info(f"Processing company: {company}")
@@ -169,6 +176,7 @@ class SimpleLinkedInWorkflow:
                     people_data = self.linkedin_scraper.search_company_alumni(company)
                     
                     if people_data:
+                        people_data = self.person_deduper.apply(people_data)
                         all_people_data.extend(people_data)
                         self.logger.info(f"Processed {len(people_data)} SCU alumni from {company}")
                     else:
@@ -183,6 +191,8 @@ class SimpleLinkedInWorkflow:
                                 for person in fallback_data:
                                     person['is_scu_alumni'] = True
                                     person['company'] = company
+                                # The same person can turn up under another company's search
+                                fallback_data = self.person_deduper.apply(fallback_data)
                                 all_people_data.extend(fallback_data)
                                 self.logger.info(f"Fallback found {len(fallback_data)} people from {company}")
                             else:
@@ -210,7 +220,7 @@ class SimpleLinkedInWorkflow:
                         'filename': export_result['filename'],
                         'filepath': export_result['filepath'],
                         'contact_count': export_result['contact_count'],
-                        'data': all_people_data
+                        'data': as_dicts(all_people_data)
                     }
                 else:
                     return {
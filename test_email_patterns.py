@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Test per-domain email pattern inference
+"""
+import os
+import tempfile
+from email_patterns import EmailPatternEngine, matching_patterns, render_pattern
+
+def test_matching_patterns():
+    assert matching_patterns('Jane', 'Doe', 'jane.doe@acme.com') == ['{first}.{last}']
+    assert matching_patterns('José', 'García', 'jgarcia@acme.com') == ['{f}{last}']
+    assert render_pattern('{f}{last}', 'Robert', 'van der Berg', 'Acme.com') == 'rberg@acme.com'
+    print("✅ Pattern matching works")
+
+def test_pattern_engine_learns_and_persists():
+    """Patterns need enough distinct samples, and survive a restart"""
+    db_path = os.path.join(tempfile.mkdtemp(), 'patterns.db')
+    engine = EmailPatternEngine(db_path=db_path, min_samples=3, min_confidence=0.6)
+
+    engine.learn('acme.com', 'Jane', 'Doe', 'jane.doe@acme.com')
+    engine.learn('acme.com', 'Jane', 'Doe', 'jane.doe@acme.com')  # duplicate - counted once
+    assert engine.best_pattern('acme.com') is None
+
+    engine.learn('acme.com', 'John', 'Smith', 'john.smith@acme.com')
+    engine.learn('acme.com', 'Ann', 'Lee', 'alee@acme.com')
+    assert engine.best_pattern('acme.com') is not None
+    engine.close()
+
+    engine = EmailPatternEngine(db_path=db_path, min_samples=3, min_confidence=0.6)
+    pattern, confidence, samples = engine.best_pattern('acme.com')
+    assert pattern == '{first}.{last}'
+    assert samples == 3 and round(confidence, 2) == 0.67
+    assert engine.candidate('acme.com', 'Bob', 'Jones') == 'bob.jones@acme.com'
+    engine.close()
+    print("✅ Pattern engine learns and persists")
+
+if __name__ == "__main__":
+    test_matching_patterns()
+    test_pattern_engine_learns_and_persists()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Test Hunter credit budgeting and lookup priority across companies
+"""
+from domain_harvester import DomainHarvester
+from hunter_budget import HunterBudget, PRIORITY_ALUMNI, PRIORITY_OTHER, PRIORITY_TITLE_MATCH
+
+COMPANY_A = [
+    {'name': 'Ann Recruiter', 'company': 'Acme', 'title': 'Technical Recruiter'},
+    {'name': 'Sam Seller', 'company': 'Acme', 'title': 'Account Executive'},
+    {'name': 'Eve Engineer', 'company': 'Acme', 'title': 'Senior Software Engineer'}
+]
+COMPANY_B = [
+    {'name': 'Bea Alum', 'company': 'Globex', 'title': 'Recruiter', 'is_scu_alumni': True},
+    {'name': 'Cal Alum', 'company': 'Globex', 'title': 'Data Scientist', 'is_scu_alumni': True}
+]
+
+def spend(budget, people):
+    """Reserve one credit per person in priority order, like the lookup engine"""
+    served = []
+    for person in budget.prioritize(people):
+        if budget.try_reserve(1):
+            budget.settle(1, 1)
+            served.append(person['name'])
+    return served
+
+def test_priority_tiers():
+    budget = HunterBudget('test-key', run_budget=0)
+    assert budget.priority(COMPANY_B[0]) == PRIORITY_ALUMNI
+    assert budget.priority(COMPANY_A[2]) == PRIORITY_TITLE_MATCH
+    assert budget.priority(COMPANY_A[0]) == PRIORITY_OTHER
+    print("✅ Alumni, then title matches, then everyone else")
+
+def test_alumni_first_across_companies():
+    """Credits go to alumni at a later company before anyone at an earlier one"""
+    budget = HunterBudget('test-key', run_budget=3)
+    served = spend(budget, COMPANY_A + COMPANY_B)
+    assert served == ['Bea Alum', 'Cal Alum', 'Eve Engineer']
+    assert budget.skipped == 2 and budget.exhausted
+
+    # Spending company by company lets the first company use up the budget
+    budget.start_run(run_budget=3)
+    assert spend(budget, COMPANY_A) + spend(budget, COMPANY_B) == ['Eve Engineer', 'Ann Recruiter', 'Sam Seller']
+    print("✅ Alumni are looked up first across the whole run")
+
+class FakeResponse:
+    ok = True
+
+    def __init__(self, payload):
+        self.payload = payload
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.payload
+
+class FakeHunter:
+    """Domain-search stub that records the requested page sizes"""
+
+    def __init__(self):
+        self.limits = []
+
+    def get(self, url, params=None, service=None):
+        self.limits.append(params['limit'])
+        emails = [{'value': f"p{i}@acme.com", 'first_name': 'P', 'last_name': f"L{i}"} for i in range(min(params['limit'], 25))]
+        return FakeResponse({'data': {'emails': emails}, 'meta': {'results': 25}})
+
+def test_harvest_shrinks_to_budget():
+    """A harvest page that doesn't fit is shrunk, and finder lookups still get the rest"""
+    budget = HunterBudget('test-key', run_budget=4)
+    harvester = DomainHarvester('test-key', max_emails=100, budget=budget)
+    harvester.http = FakeHunter()
+    entries = harvester.harvest('acme.com')
+    # A full page would reserve 10 credits; it's cut to 40 emails and 25 come back (3 credits)
+    assert harvester.http.limits == [40]
+    assert len(entries) == 25
+    assert not budget.exhausted
+
+    assert spend(budget, COMPANY_B) == ['Bea Alum']
+    assert budget.exhausted and budget.skipped == 1
+    print("✅ Harvest pages shrink to fit the budget without blocking finder lookups")
+
+if __name__ == "__main__":
+    test_priority_tiers()
+    test_alumni_first_across_companies()
+    test_harvest_shrinks_to_budget()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Test per-run token, cost and outcome accounting for LLM calls
+"""
+import os
+import tempfile
+from llm_metrics import LLMMetrics, OUTCOME_FALLBACK, OUTCOME_PARSE_FAILURE, OUTCOME_REJECTED, estimate_cost
+
+def _metrics():
+    return LLMMetrics(os.path.join(tempfile.mkdtemp(), 'metrics.db'))
+
+def test_run_summary():
+    """Totals per company, fallback rate and cached calls"""
+    metrics = _metrics()
+    with metrics.track('message', 'Acme') as call:
+        call.model, call.prompt_tokens, call.completion_tokens, call.latency = 'gpt-3.5-turbo', 400, 200, 1.0
+    with metrics.track('message', 'Acme') as call:
+        call.model, call.prompt_tokens, call.completion_tokens, call.latency = 'gpt-3.5-turbo', 400, 200, 3.0
+        call.outcome = OUTCOME_PARSE_FAILURE
+    with metrics.track('message', 'Globex') as call:
+        call.model, call.prompt_tokens, call.completion_tokens, call.cached = 'gpt-3.5-turbo', 400, 200, True
+    try:
+        with metrics.track('message', 'Globex', error_outcome=OUTCOME_FALLBACK) as call:
+            call.model = 'gpt-3.5-turbo'
+            raise TimeoutError()
+    except TimeoutError:
+        pass
+
+    summary = metrics.run_summary()
+    assert summary['calls'] == 4 and summary['cached'] == 1
+    assert summary['outcomes'] == {'success': 2, 'parse_failure': 1, 'fallback': 1}
+    assert summary['prompt_tokens'] == 800 and summary['completion_tokens'] == 400
+    assert summary['by_company']['Acme']['tokens'] == 1200
+    assert abs(summary['cost'] - 2 * estimate_cost('gpt-3.5-turbo', 400, 200)) < 1e-9
+    # The parse failure was retried; 1 of the 3 people ended with the fallback
+    assert abs(summary['fallback_rate'] - 1 / 3) < 1e-9
+    assert summary['latency_p95'] == 3.0
+    print("✅ Run summary totals tokens, cost and fallbacks")
+
+def test_fallback_rate_with_escalation():
+    """Rejected cascade drafts don't count as people; only each person's final row does"""
+    metrics = _metrics()
+    # Draft rejected, escalation passes
+    with metrics.track('message', 'Acme') as call:
+        call.model, call.outcome = 'gpt-4o-mini', OUTCOME_REJECTED
+    with metrics.track('message', 'Acme') as call:
+        call.model = 'gpt-4o'
+    # Draft rejected, escalation rejected too -> fallback message
+    with metrics.track('message', 'Acme') as call:
+        call.model, call.outcome = 'gpt-4o-mini', OUTCOME_REJECTED
+    with metrics.track('message', 'Acme') as call:
+        call.model, call.outcome = 'gpt-4o', OUTCOME_FALLBACK
+
+    summary = metrics.run_summary()
+    assert summary['calls'] == 4
+    assert summary['fallback_rate'] == 0.5
+    print("✅ Fallback rate counts one outcome per person")
+
+def test_runs_are_separate():
+    """A new run starts from zero"""
+    metrics = _metrics()
+    with metrics.track('company_info', 'Acme') as call:
+        call.prompt_tokens = 100
+    first_run = metrics.run_id
+    metrics.start_run()
+    assert metrics.run_summary()['calls'] == 0
+    assert metrics.run_summary(first_run)['prompt_tokens'] == 100
+    print("✅ Runs are summarised separately")
+
+if __name__ == "__main__":
+    test_run_summary()
+    test_fallback_rate_with_escalation()
+    test_runs_are_separate()
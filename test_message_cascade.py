@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Test draft validation and tier stats for the message cascade
+"""
+from message_cascade import CascadeStats, company_mentions, validate_message
+
+SIGNATURE = "Best regards,\nAbhinav Ala\n(469)-381-4729\naala@scu.edu"
+BODY = f"Hi Ana,\n\nI'm a CS student at SCU and would love to hear about your work at Acme.\n\n{SIGNATURE}"
+
+def test_valid_message():
+    """A short message with subject, signature and company passes"""
+    assert validate_message("Coffee chat?", BODY, "Acme, Inc.") == []
+    assert company_mentions("Acme Corp, Inc.") == ("acme",)
+    print("✅ Valid draft passes")
+
+def test_company_aliases():
+    """Drafts may use a company's short or parenthesized name"""
+    assert company_mentions("Alphabet Inc. (Google)") == ("alphabet", "google")
+    assert company_mentions("Amazon Web Services (AWS)") == ("amazon web services", "aws", "amazon")
+    for company, mention in (
+        ("Meta Platforms", "Meta"),
+        ("Amazon Web Services (AWS)", "AWS"),
+        ("Amazon Web Services (AWS)", "Amazon"),
+        ("Alphabet Inc. (Google)", "Google"),
+        ("The Walt Disney Company", "Walt Disney"),
+    ):
+        body = BODY.replace("Acme", mention)
+        assert validate_message("Coffee chat?", body, company) == [], (company, mention)
+    # Whole words only: "metadata" doesn't mention Meta
+    assert validate_message("Hi", BODY.replace("Acme", "metadata tooling"), "Meta Platforms") == ['no mention of Meta Platforms']
+    print("✅ Company short names and aliases are accepted")
+
+def test_rejections():
+    """Each rule reports its own problem"""
+    assert validate_message("", BODY, "Acme") == ['missing subject']
+    assert validate_message("Hi", BODY.replace("aala@scu.edu", ""), "Acme") == ['missing signature: aala@scu.edu']
+    assert validate_message("Hi", BODY, "Globex") == ['no mention of Globex']
+    long_body = "word " * 200 + "\n" + SIGNATURE + "\nAcme"
+    assert validate_message("Hi", long_body, "Acme") == ['207 words']
+    print("✅ Invalid drafts are rejected with reasons")
+
+def test_cascade_stats():
+    """Escalation rate is per drafted message"""
+    stats = CascadeStats()
+    stats.record('draft', 'gpt-4o-mini', 0.5, True)
+    stats.record('draft', 'gpt-4o-mini', 0.7, False)
+    stats.record('escalation', 'gpt-4o', 2.0, True)
+    summary = stats.summary()
+    assert summary['messages'] == 2 and summary['escalation_rate'] == 0.5
+    assert summary['tiers']['draft']['pass_rate'] == 0.5
+    assert summary['tiers']['escalation']['latency_p95'] == 2.0
+    stats.reset()
+    assert stats.summary()['messages'] == 0
+    print("✅ Cascade stats track pass and escalation rates")
+
+if __name__ == "__main__":
+    test_valid_message()
+    test_company_aliases()
+    test_rejections()
+    test_cascade_stats()
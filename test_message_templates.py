@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Test local rendering of per-company message templates
+"""
+from message_templates import MessageTemplate
+
+def test_template_rendering():
+    """Slots are filled per person; unknown braces stay literal"""
+    template = MessageTemplate(
+        "Coffee chat, {first_name}?",
+        "Hi {first_name},\n\nYour work as a {title} at Acme {team} inspires me.\n\n"
+        "Best regards,\nAbhinav Ala\n(469)-381-4729\naala@scu.edu"
+    )
+    assert template.is_valid('Acme')
+    assert template.slots == {'first_name', 'title'}
+
+    subject, body = template.render({'first_name': 'Jane', 'title': 'Staff Engineer'})
+    assert subject == "Coffee chat, Jane?"
+    assert body.startswith("Hi Jane,") and "as a Staff Engineer at Acme {team}" in body
+
+    subject, body = template.render({})
+    assert body.startswith("Hi there,")
+    print("✅ Template rendering works")
+
+def test_invalid_templates():
+    assert not MessageTemplate("Hello", "Hi Jane,\n\nBest regards,\nAbhinav Ala").is_valid()
+    assert not MessageTemplate("Hello", "Hi {first_name},\n\nThanks").is_valid()
+    signature = "\n\nBest regards,\nAbhinav Ala\n(469)-381-4729\naala@scu.edu"
+    # The rendered template goes through the same checks as generated drafts
+    assert MessageTemplate("Hello", "Hi {first_name}, I admire {company}." + signature).problems('Acme') == []
+    assert MessageTemplate("Hello", "Hi {first_name}." + signature).problems('Acme') == ['no mention of Acme']
+    long_body = "Hi {first_name}, " + "word " * 250 + "at {company}." + signature
+    assert MessageTemplate("Hello", long_body).problems('Acme') == ['260 words']
+    assert not MessageTemplate("Hello", "Hi {first_name} at {company},\n\nBest regards,\nAbhinav Ala").is_valid('Acme')
+    print("✅ Templates failing the name slot, signature, length or company checks are rejected")
+
+if __name__ == "__main__":
+    test_template_rendering()
+    test_invalid_templates()
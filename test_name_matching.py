@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+Test local name matching against harvested domain-search emails
+"""
+from name_matching import NameIndex, name_tokens
+
+def test_name_index_matching():
+    """Accents, middle names, nicknames and credentials still match; ambiguity doesn't"""
+    index = NameIndex([
+        {'first_name': 'Robert', 'last_name': 'Smith', 'email': 'rsmith@acme.com'},
+        {'first_name': 'José', 'last_name': 'García', 'email': 'jgarcia@acme.com'},
+        {'first_name': 'John', 'last_name': 'Doe', 'email': 'jdoe@acme.com'},
+        {'first_name': 'Ann', 'last_name': 'Lee', 'email': 'ann.lee@acme.com'},
+        {'first_name': 'Ann', 'last_name': 'Lee', 'email': 'alee2@acme.com'}
+    ])
+
+    assert index.match('Bob', 'Smith')['email'] == 'rsmith@acme.com'
+    assert index.match('Jose', 'Luis Garcia')['email'] == 'jgarcia@acme.com'
+    assert index.match('J.', 'Doe, MBA')['email'] == 'jdoe@acme.com'
+    assert index.match('Jane', 'Doe') is None
+    assert index.match('Ann', 'Lee') is None
+    print("✅ Name index matching works")
+
+def test_name_tokens():
+    assert name_tokens('Jane Doe (She/Her), PhD') == ['jane', 'doe']
+    assert name_tokens("Seán O'Brien-Murphy Jr") == ['sean', 'obrien', 'murphy']
+    print("✅ Name normalization works")
+
+if __name__ == "__main__":
+    test_name_index_matching()
+    test_name_tokens()
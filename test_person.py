@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Test Person records and the shared company registry
+"""
+import pandas as pd
+from person import Person, as_dicts, company_registry
+
+def test_dict_access():
+    """Person behaves like the dicts the other stages expect"""
+    person = Person(name='Jane Doe', company='Acme', title='Engineer', notes='met at career fair')
+    assert person['name'] == 'Jane Doe'
+    assert person.get('email') is None
+    assert 'email' not in person
+    person['email'] = 'jane@acme.com'
+    assert 'email' in person
+    assert person['notes'] == 'met at career fair'
+    assert person.to_dict() == {
+        'name': 'Jane Doe', 'title': 'Engineer', 'email': 'jane@acme.com', 'company': 'Acme', 'notes': 'met at career fair'
+    }
+    print("✅ Dict-style access works")
+
+def test_company_sharing():
+    """People at the same company share one Company; from_dict returns Person objects unchanged"""
+    company_registry.clear()
+    first = Person.from_dict({'name': 'Jane Doe', 'company': 'Acme'})
+    second = Person.from_dict({'name': 'John Roe', 'company': ' acme'})
+    assert first.company_ref is second.company_ref
+    first['company_domain'] = 'acme.com'
+    assert second['company_domain'] == 'acme.com'
+    assert Person.from_dict(first) is first
+
+    # A new run starts with fresh company records
+    company_registry.clear()
+    assert len(company_registry) == 0
+    assert Person(name='Ann Poe', company='Acme').get('company_domain') is None
+    assert first['company_domain'] == 'acme.com'
+    print("✅ Company data is shared per run")
+
+def test_as_dicts():
+    """Person objects become plain dicts before reaching pandas"""
+    people = as_dicts([Person(name='Jane Doe', company='Acme'), {'name': 'John Roe', 'company': 'Globex'}])
+    assert all(type(person) is dict for person in people)
+    df = pd.DataFrame(people)
+    assert list(df['name']) == ['Jane Doe', 'John Roe']
+    assert list(df['company']) == ['Acme', 'Globex']
+    print("✅ Plain dicts for DataFrames")
+
+if __name__ == "__main__":
+    test_dict_access()
+    test_company_sharing()
+    test_as_dicts()
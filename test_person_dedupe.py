@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Test near-duplicate person detection
+"""
+import time
+from person_dedupe import PersonDeduper, names_match, person_name_key
+
+def test_names_match():
+    """Nicknames, initials and small misspellings match; different first names don't"""
+    assert names_match(person_name_key({'name': 'Bob Smith'}), person_name_key({'name': 'Robert Smith'}))
+    assert names_match(person_name_key({'name': 'J. Smith'}), person_name_key({'name': 'John Smith'}))
+    assert names_match(person_name_key({'name': 'Jonathon Smith'}), person_name_key({'name': 'Jonathan Smith'}))
+    assert names_match(person_name_key({'name': 'José García, PhD'}), person_name_key({'name': 'Jose Garcia'}))
+    assert not names_match(person_name_key({'name': 'John Smith'}), person_name_key({'name': 'Joan Smith'}))
+    assert not names_match(person_name_key({'name': 'Jane Doe'}), person_name_key({'name': 'Jane Smith'}))
+    print("✅ Name similarity check")
+
+def test_collapses_duplicates():
+    """Same profile URL or same company + matching name collapse into the first copy"""
+    deduper = PersonDeduper(threshold=0.92, max_block_size=50)
+    people = [
+        {'name': 'Robert Smith', 'company': 'Acme', 'profile_url': 'https://www.linkedin.com/in/rsmith?trk=a', 'title': ''},
+        {'name': 'Bob Smith', 'company': 'Acme', 'title': 'Software Engineer', 'is_scu_alumni': True},
+        {'name': 'R. Smith', 'company': 'Globex', 'profile_url': 'https://linkedin.com/in/RSmith/'},
+        {'name': 'Robert Smith', 'company': 'Acme', 'profile_url': 'https://www.linkedin.com/in/other-rsmith'},
+        {'name': 'Jane Doe', 'company': 'Acme'}
+    ]
+    kept = deduper.apply(people)
+    assert [person['name'] for person in kept] == ['Robert Smith', 'Robert Smith', 'Jane Doe']
+    assert kept[0]['title'] == 'Software Engineer'
+    assert kept[0]['is_scu_alumni'] is True
+    assert kept[0]['company'] == 'Acme'
+    assert deduper.collapsed == 2
+
+    # The index lives for the run, so a later company's search drops them too
+    assert deduper.apply([{'name': 'Jane Doe', 'company': 'acme '}]) == []
+    deduper.start_run()
+    assert len(deduper.apply([{'name': 'Jane Doe', 'company': 'Acme'}])) == 1
+    print("✅ Duplicates collapsed by profile URL and name + company")
+
+def test_processed_records_are_not_changed():
+    """A duplicate at a later company doesn't promote a person who was already messaged"""
+    deduper = PersonDeduper(threshold=0.92, max_block_size=50)
+    first_company = deduper.apply([{'name': 'Jane Doe', 'company': 'Acme', 'profile_url': '/in/janedoe'}])
+    # First company's people went through email lookup and message generation
+    first_company[0].update({'email_status': 'found', 'message_body': 'Hi Jane', 'is_scu_alumni': False})
+
+    second_company = deduper.apply([
+        {'name': 'Jane Doe', 'company': 'Globex', 'profile_url': '/in/janedoe', 'is_scu_alumni': True, 'location': 'SF'}
+    ])
+    assert second_company == []
+    assert first_company[0]['is_scu_alumni'] is False
+    assert 'location' not in first_company[0]
+    print("✅ Already processed records aren't changed by later duplicates")
+
+def letters(number):
+    """0 -> 'a', 25 -> 'z', 26 -> 'ba' (digits are stripped from names)"""
+    text = ''
+    while True:
+        number, digit = divmod(number, 26)
+        text = chr(ord('a') + digit) + text
+        if not number:
+            return text
+
+def test_scales_linearly():
+    """100k records (10% repeats) dedupe without pairwise comparisons"""
+    people = [
+        {'name': f"a{letters(index % 300)} z{letters(index)}", 'company': f"Company {letters(index % 50)}",
+         'profile_url': f"https://www.linkedin.com/in/p{index}"}
+        for index in range(90000)
+    ]
+    people += [{'name': person['name'], 'company': person['company']} for person in people[:10000]]
+    start = time.perf_counter()
+    kept = PersonDeduper(threshold=0.92, max_block_size=50).apply(people)
+    elapsed = time.perf_counter() - start
+    assert len(kept) == 90000
+    assert elapsed < 30, elapsed
+    print(f"✅ 100k records deduped in {elapsed:.1f}s")
+
+if __name__ == "__main__":
+    test_names_match()
+    test_collapses_duplicates()
+    test_processed_records_are_not_changed()
+    test_scales_linearly()
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Test profile URL canonicalization and person keys
+"""
+from profile_utils import canonicalize_profile_url, make_person_key
+
+def test_canonicalize_profile_url():
+    """Slug links with tracking params, relative links and locale suffixes agree"""
+    expected = 'https://www.linkedin.com/in/john-doe-123'
+    variants = [
+        'https://www.linkedin.com/in/John-Doe-123?trk=public_profile&miniProfileUrn=urn%3Ali%3Afs_miniProfile%3AACoAAB',
+        '/in/john-doe-123/',
+        'https://linkedin.com/in/john-doe-123/en',
+        'https://www.linkedin.com/in/john-doe-123#experience'
+    ]
+    for url in variants:
+        assert canonicalize_profile_url(url) == expected, url
+
+    urn_url = 'https://www.linkedin.com/search/results/people/headless?miniProfileUrn=urn%3Ali%3Afs_miniProfile%3AACoAABxyz'
+    assert canonicalize_profile_url(urn_url) == 'https://www.linkedin.com/in/ACoAABxyz'
+
+    # Member ids keep their case whether they come as a slug or a miniProfileUrn
+    assert canonicalize_profile_url('https://www.linkedin.com/in/ACoAABxyz/') == 'https://www.linkedin.com/in/ACoAABxyz'
+
+    assert canonicalize_profile_url('https://example.com/in/john') == ''
+    assert canonicalize_profile_url('https://evil-linkedin.com/in/john') == ''
+    assert canonicalize_profile_url('https://de.linkedin.com/in/john') == 'https://www.linkedin.com/in/john'
+    assert canonicalize_profile_url('') == ''
+    print("✅ Profile URL canonicalization works")
+
+def test_make_person_key():
+    """Keys are stable across URL variants and fall back to name + company"""
+    key = make_person_key('https://www.linkedin.com/in/john-doe-123?trk=x', 'John Doe', 'Google')
+    assert key == make_person_key('/in/John-Doe-123', 'J. Doe', 'Alphabet')
+    assert len(key) == 16
+
+    assert make_person_key(None, 'John  Doe', 'Google') == make_person_key('', 'john doe', 'GOOGLE')
+    assert make_person_key(None, 'John Doe', 'Google') != make_person_key(None, 'John Doe', 'Meta')
+    print("✅ Person keys are stable")
+
+if __name__ == "__main__":
+    test_canonicalize_profile_url()
+    test_make_person_key()
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Test compaction of company overviews into short prompt summaries
+"""
+from prompt_compaction import compact_company_info, estimate_tokens
+
+OVERVIEW = """Here is an overview of Acme:
+
+1. **Main Mission/Purpose**: Acme's mission is to make building software simple for every team. It was founded in 2010.
+2. **What they do (products/services)**:
+   - Cloud hosting
+   - Developer APIs
+3. **Core Values**: Customer obsession, ownership and craft.
+4. **Why work there**: Great mentorship and interesting scale problems.
+5. **Company culture**: Collaborative and fast-paced.
+"""
+
+def test_structured_overview():
+    """Mission, products and values are kept; everything else is dropped"""
+    summary = compact_company_info(OVERVIEW)
+    assert summary == (
+        "Mission: Acme's mission is to make building software simple for every team.\n"
+        "Products: Cloud hosting; Developer APIs\n"
+        "Values: Customer obsession, ownership and craft."
+    )
+    assert estimate_tokens(summary) < estimate_tokens(OVERVIEW) / 2
+    print("✅ Structured overview compacted to mission/products/values")
+
+def test_long_sections_are_clipped():
+    """Each field is cut to max_words"""
+    summary = compact_company_info("Mission: " + ' '.join(['word'] * 50), max_words=5)
+    assert summary == "Mission: word word word word word..."
+    print("✅ Long sections are clipped")
+
+def test_unstructured_overview():
+    """Free text without headings falls back to its opening words"""
+    assert compact_company_info("Acme makes rockets.") == "Acme makes rockets."
+    assert len(compact_company_info("word " * 200, max_words=10).split()) == 30
+    assert compact_company_info('') == ''
+    print("✅ Unstructured overviews fall back to the opening text")
+
+if __name__ == "__main__":
+    test_structured_overview()
+    test_long_sections_are_clipped()
+    test_unstructured_overview()
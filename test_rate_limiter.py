@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Test token buckets and the persisted monthly bucket
+"""
+import os
+import tempfile
+from rate_limiter import PersistentTokenBucket, RateLimiter, RateLimitExceeded, TokenBucket
+
+def test_token_bucket():
+    """A full bucket serves its capacity, then waits for the refill"""
+    bucket = TokenBucket(2, 1)
+    limiter = RateLimiter([bucket])
+    limiter.acquire_sync()
+    limiter.acquire_sync()
+    assert 0 < bucket.wait_time() <= 0.5
+    print("✅ Token bucket refills at capacity / period")
+
+def test_monthly_bucket_survives_restart():
+    """Tokens taken in one process are still missing when the next one starts"""
+    with tempfile.TemporaryDirectory() as work_dir:
+        db_path = os.path.join(work_dir, 'cache.db')
+        bucket = PersistentTokenBucket(3, 30 * 24 * 3600, 'hunter per-month', db_path=db_path)
+        limiter = RateLimiter([bucket])
+        for _ in range(3):
+            limiter.acquire_sync(max_wait=0)
+        bucket.close()
+
+        restarted = PersistentTokenBucket(3, 30 * 24 * 3600, 'hunter per-month', db_path=db_path)
+        try:
+            RateLimiter([restarted]).acquire_sync(max_wait=60)
+            assert False, "monthly cap reset on restart"
+        except RateLimitExceeded as e:
+            assert e.name == 'hunter per-month'
+        finally:
+            restarted.close()
+    print("✅ Monthly bucket persists across restarts")
+
+if __name__ == "__main__":
+    test_token_bucket()
+    test_monthly_bucket_survives_restart()
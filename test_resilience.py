@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Test retry backoff and circuit breaking for the API clients
+"""
+from resilience import CircuitBreaker, CircuitOpenError, Resilience, backoff_delay, parse_retry_after
+
+def test_backoff_and_retry_after():
+    """Backoff stays within the capped exponential window; Retry-After wins"""
+    for attempt in range(6):
+        assert 0 <= backoff_delay(attempt, base=0.5, cap=4) <= min(4, 0.5 * 2 ** attempt)
+    assert backoff_delay(3, retry_after=7) == 7
+    assert parse_retry_after('12') == 12
+    assert parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT') == 0
+    assert parse_retry_after('soon') is None
+    print("✅ Backoff and Retry-After parsing work")
+
+def test_circuit_breaker():
+    """Opens after repeated failures, lets one probe through after the timeout"""
+    breaker = CircuitBreaker('hunter', failure_threshold=2, reset_timeout=0)
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == 'open' and breaker.trips == 1
+
+    breaker.before_call()  # half-open probe
+    try:
+        breaker.before_call()
+        assert False, "second call should fail fast while the probe is out"
+    except CircuitOpenError:
+        pass
+    breaker.record_success()
+    assert breaker.state == 'closed'
+    print("✅ Circuit breaker opens and recovers")
+
+def test_neutral_results():
+    """429s and rejected requests neither reset the failure count nor close a half-open breaker"""
+    resilience = Resilience(max_retries=0)
+    breaker = resilience.breaker('hunter')
+    breaker.failure_threshold, breaker.reset_timeout = 2, 0
+    neutral = lambda status, error: (False, None, None)
+
+    breaker.record_failure()
+    resilience.call('hunter', lambda: 429, neutral)
+    assert breaker.failures == 1 and breaker.state == 'closed'
+    breaker.record_failure()
+    assert breaker.state == 'open'
+
+    # The half-open probe comes back 429: still half-open, and the next call may probe
+    resilience.call('hunter', lambda: 429, neutral)
+    assert breaker.state == 'half_open'
+    resilience.call('hunter', lambda: 200, lambda status, error: (False, False, None))
+    assert breaker.state == 'closed' and breaker.failures == 0
+    print("✅ Neutral results leave the breaker alone")
+
+def test_retries_transient_failures():
+    """Transient failures are retried and counted; permanent ones aren't"""
+    resilience = Resilience(max_retries=3)
+    attempts = []
+
+    def flaky():
+        attempts.append(1)
+        return 503 if len(attempts) < 3 else 200
+
+    result = resilience.call('gmass', flaky, lambda status, error: (status == 503, status == 503, 0))
+    assert result == 200 and len(attempts) == 3
+    assert resilience.summary()['gmass']['retries'] == 2
+
+    result = resilience.call('gmass', lambda: 404, lambda status, error: (False, False, None))
+    assert result == 404
+    print("✅ Transient failures are retried")
+
+if __name__ == "__main__":
+    test_backoff_and_retry_after()
+    test_circuit_breaker()
+    test_neutral_results()
+    test_retries_transient_failures()
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Test title relevance scoring used to filter people before email lookup and messaging
+"""
+from title_relevance import TitleRelevanceMatcher, normalize_keywords
+
+def test_keyword_normalization():
+    assert normalize_keywords('Software Engineer, software  engineer,SRE,,sre') == ['software engineer', 'sre']
+    print("✅ Keywords are deduplicated")
+
+def test_title_scores():
+    """Whole-word phrase matches score by coverage; excluded roles score 0"""
+    matcher = TitleRelevanceMatcher(
+        ['software engineer', 'senior software engineer', 'software', 'it', 'c++'],
+        exclude_keywords=['recruiter', 'sales']
+    )
+    assert matcher.score('Senior Software Engineer') == 1.0
+    assert matcher.matches('Software Engineer II') == ['software engineer']
+    assert matcher.score('C++ Developer') > 0
+    assert matcher.score('Recruiting Coordinator') == 0  # "it" only matches whole words
+    assert matcher.score('Technical Recruiter, Software') == 0
+    print("✅ Title scores work")
+
+def test_apply_modes():
+    """Low scorers are moved back or dropped; alumni are always kept"""
+    matcher = TitleRelevanceMatcher(['software engineer'], exclude_keywords=['recruiter'])
+    people = [
+        {'name': 'A', 'title': 'Recruiter', 'is_scu_alumni': False},
+        {'name': 'B', 'title': 'Software Engineer', 'is_scu_alumni': False},
+        {'name': 'C', 'title': 'Recruiter', 'is_scu_alumni': True}
+    ]
+    assert [p['name'] for p in matcher.apply(people, mode='deprioritize')] == ['B', 'C', 'A']
+    assert [p['name'] for p in matcher.apply(people, mode='drop')] == ['B', 'C']
+    assert people[0]['title_relevance'] == 0
+    print("✅ Relevance filtering works")
+
+if __name__ == "__main__":
+    test_keyword_normalization()
+    test_title_scores()
+    test_apply_modes()
@@ -0,0 +1,122 @@
+"""
+Title relevance scoring against Config.SEARCH_KEYWORDS
+"""
+import logging
+import re
+from config import Config
+
+# Titles are matched on whole words; '+' and '#' count as word characters for c++ / c#
+WORD_CHARS = 'a-z0-9+#'
+
+# Words matched before a title counts as fully relevant ("senior software engineer" = 1.0)
+FULL_SCORE_WORDS = 3
+
+RELEVANCE_OFF = 'off'
+RELEVANCE_DEPRIORITIZE = 'deprioritize'
+RELEVANCE_DROP = 'drop'
+
+
+def normalize_keywords(keywords):
+    """Lowercased, whitespace-collapsed, de-duplicated keywords (comma string or iterable)"""
+    if isinstance(keywords, str):
+        keywords = keywords.split(',')
+    seen = {}
+    for keyword in keywords or ():
+        keyword = ' '.join(str(keyword).lower().split())
+        if keyword:
+            seen.setdefault(keyword, None)
+    return list(seen)
+
+
+def compile_keywords(keywords):
+    """One alternation regex over the keywords, longest first so phrases win over their words"""
+    if not keywords:
+        return None
+    alternatives = [
+        re.escape(keyword).replace(r'\ ', r'\s+')
+        for keyword in sorted(keywords, key=len, reverse=True)
+    ]
+    return re.compile(rf"(?<![{WORD_CHARS}])(?:{'|'.join(alternatives)})(?![{WORD_CHARS}])")
+
+
+class TitleRelevanceMatcher:
+    """Scores job titles 0-1 by how much of them the search keywords cover
+
+    Matches are whole-word and non-overlapping, so "Senior Software Engineer" matches the
+    three-word phrase once rather than also counting "software" on its own. Any exclude
+    keyword (recruiter, sales, ...) scores the title 0.
+    """
+
+    def __init__(self, keywords=None, exclude_keywords=None):
+        self.keywords = normalize_keywords(Config.SEARCH_KEYWORDS if keywords is None else keywords)
+        self.exclude_keywords = normalize_keywords(
+            Config.TITLE_EXCLUDE_KEYWORDS if exclude_keywords is None else exclude_keywords
+        )
+        self._pattern = compile_keywords(self.keywords)
+        self._exclude_pattern = compile_keywords(self.exclude_keywords)
+        self._scores = {}
+        self.setup_logging()
+
+    def setup_logging(self):
+        logging.basicConfig(level=logging.INFO)
+        self.logger = logging.getLogger(__name__)
+
+    def matches(self, title):
+        """Keywords found in a title"""
+        if not title or self._pattern is None:
+            return []
+        return [' '.join(match.group(0).split()) for match in self._pattern.finditer(title.lower())]
+
+    def score(self, title):
+        title = ' '.join((title or '').lower().split())
+        score = self._scores.get(title)
+        if score is not None:
+            return score
+
+        if self._exclude_pattern is not None and self._exclude_pattern.search(title):
+            score = 0.0
+        else:
+            words = sum(len(keyword.split()) for keyword in set(self.matches(title)))
+            score = min(1.0, words / FULL_SCORE_WORDS)
+        self._scores[title] = score
+        return score
+
+    def score_person(self, person):
+        """Score a person's title and store it on the record"""
+        score = self.score(person.get('title'))
+        person['title_relevance'] = score
+        return score
+
+    def apply(self, people, mode=None, min_score=None):
+        """Score people and drop or move low scorers to the back (SCU alumni are always kept)
+
+        mode is 'drop', 'deprioritize' or 'off' (default TITLE_RELEVANCE_MODE).
+        """
+        mode = mode or Config.TITLE_RELEVANCE_MODE
+        min_score = Config.TITLE_RELEVANCE_MIN_SCORE if min_score is None else min_score
+        people = list(people)
+        if mode == RELEVANCE_OFF:
+            return people
+
+        relevant, low = [], []
+        for person in people:
+            score = self.score_person(person)
+            (relevant if score >= min_score or person.get('is_scu_alumni') else low).append(person)
+
+        if low:
+            action = 'Dropped' if mode == RELEVANCE_DROP else 'Deprioritized'
+            self.logger.info(f"{action} {len(low)} of {len(people)} people with low title relevance")
+        if mode == RELEVANCE_DROP:
+            return relevant
+        return relevant + low
+
+
+_matcher = None
+
+
+def get_title_matcher():
+    """Matcher for Config.SEARCH_KEYWORDS, compiled once per process"""
+    global _matcher
+    if _matcher is None:
+        _matcher = TitleRelevanceMatcher()
+    return _matcher